@@ -15,15 +15,18 @@ from unittest.mock import MagicMock, patch
 from urllib.parse import quote, unquote
 
 import pytest
+from aioresponses import aioresponses
 from jwt import encode
 from requests import get
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import MissingSchema
 from requests_mock import Mocker
 
+from wg_utilities.clients.json_api_client import JsonApiClient
 from wg_utilities.clients.oauth_client import OAuthCredentials
+from wg_utilities.clients.rate_limiter import RateLimiter
 from wg_utilities.exceptions._exception import NotFoundError
-from wg_utilities.functions.json import JSONObj
+from wg_utilities.functions.json import JSONObj, set_json_codec
 
 if TYPE_CHECKING:
     from requests_mock.request import _RequestObjectProxy
@@ -328,6 +331,32 @@ def live_jwt_token_alt() -> str:
     )
 
 
+@pytest.fixture(autouse=True)
+def _disable_rate_limits(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Disable client-side rate limiting, so that tests aren't paced."""
+    monkeypatch.setattr(RateLimiter, "_REGISTRY", {})
+
+    if request.node.get_closest_marker("rate_limited"):
+        return
+
+    monkeypatch.setattr(
+        JsonApiClient,
+        "rate_limiter",
+        property(lambda self: RateLimiter.for_base_url(self.base_url)),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _stdlib_json_codec() -> YieldFixture[None]:
+    """Use the stdlib JSON codec, so that output doesn't depend on what's installed."""
+    set_json_codec("stdlib")
+    yield
+    set_json_codec()
+
+
 @pytest.fixture(autouse=True)
 def mock_requests_root() -> YieldFixture[Mocker]:
     """Fixture for mocking sync HTTP requests."""
@@ -352,6 +381,13 @@ def mock_requests_root() -> YieldFixture[Mocker]:
         yield mock_requests
 
 
+@pytest.fixture(name="mock_aiohttp")
+def mock_aiohttp_() -> YieldFixture[aioresponses]:
+    """Fixture for mocking async HTTP requests."""
+    with aioresponses() as mock_aiohttp:
+        yield mock_aiohttp
+
+
 @pytest.fixture(name="mock_open_browser")
 def mock_open_browser_() -> YieldFixture[MagicMock]:
     """Fixture for mocking opening the user's browser."""
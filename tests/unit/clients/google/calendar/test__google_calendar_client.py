@@ -4,16 +4,23 @@ from __future__ import annotations
 
 from datetime import date, datetime, tzinfo
 from http import HTTPStatus
-from json import loads
+from json import dumps, loads
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import pytest
-from requests import HTTPError
+from requests import HTTPError, Response
 
+from tests.conftest import read_json_file
 from wg_utilities.clients import GoogleCalendarClient
-from wg_utilities.clients.google_calendar import Calendar, Event, _StartEndDatetime
+from wg_utilities.clients._google import BatchRequest, BatchRequestError
+from wg_utilities.clients.google_calendar import (
+    Calendar,
+    Event,
+    EventCreationParams,
+    _StartEndDatetime,
+)
 
 if TYPE_CHECKING:
     from requests_mock import Mocker
@@ -487,3 +494,159 @@ def test_primary_calendar(google_calendar_client: GoogleCalendarClient) -> None:
 
     assert isinstance(primary_calendar, Calendar)
     assert primary_calendar.id == "google-user@gmail.com"
+
+
+def test_create_events(
+    google_calendar_client: GoogleCalendarClient,
+    calendar: Calendar,
+) -> None:
+    """Test that `create_events` creates all events in a batch."""
+    event_json = read_json_file(
+        "v3/calendars/google-user@gmail.com/events/jt171go86rkonwwkyd5q7m84mm.json",
+        host_name="google/calendar",
+    )
+
+    res = Response()
+    res.status_code = HTTPStatus.OK
+    res._content = dumps(event_json).encode()
+
+    with patch.object(
+        google_calendar_client,
+        "batch",
+        return_value=[res, res],
+    ) as mock_batch:
+        events = google_calendar_client.create_events(
+            [
+                {
+                    "summary": "Timed Event",
+                    "start_datetime": datetime(2021, 1, 1, 12),
+                    "end_datetime": datetime(2021, 1, 1, 13),
+                    "tz": "Europe/London",
+                },
+                {
+                    "summary": "All Day Event",
+                    "start_datetime": date(2021, 1, 2),
+                    "end_datetime": date(2021, 1, 3),
+                    "tz": "Europe/London",
+                    "extra_params": {"location": "Home"},
+                },
+            ],
+            calendar=calendar,
+        )
+
+    assert list(mock_batch.call_args.args[0]) == [
+        BatchRequest(
+            "POST",
+            f"/calendars/{calendar.id}/events",
+            params={"maxResults": None},
+            json={
+                "summary": "Timed Event",
+                "start": {"timeZone": "Europe/London", "dateTime": "2021-01-01T12:00:00"},
+                "end": {"timeZone": "Europe/London", "dateTime": "2021-01-01T13:00:00"},
+            },
+        ),
+        BatchRequest(
+            "POST",
+            f"/calendars/{calendar.id}/events",
+            params={"maxResults": None},
+            json={
+                "summary": "All Day Event",
+                "start": {"timeZone": "Europe/London", "date": "2021-01-02"},
+                "end": {"timeZone": "Europe/London", "date": "2021-01-03"},
+                "location": "Home",
+            },
+        ),
+    ]
+
+    assert len(events) == 2
+
+    for event in events:
+        assert isinstance(event, Event)
+        assert event.calendar == calendar
+        assert event.id == event_json["id"]
+
+
+def test_create_events_partial_failure(
+    google_calendar_client: GoogleCalendarClient,
+    calendar: Calendar,
+) -> None:
+    """Test that one event failing to be created doesn't lose the others."""
+    event_json = read_json_file(
+        "v3/calendars/google-user@gmail.com/events/jt171go86rkonwwkyd5q7m84mm.json",
+        host_name="google/calendar",
+    )
+
+    created_res = Response()
+    created_res.status_code = HTTPStatus.OK
+    created_res._content = dumps(event_json).encode()
+
+    failed_res = Response()
+    failed_res.status_code = HTTPStatus.BAD_REQUEST
+    failed_res.url = f"{google_calendar_client.base_url}/calendars/{calendar.id}/events"
+
+    event_params: EventCreationParams = {
+        "summary": "Timed Event",
+        "start_datetime": datetime(2021, 1, 1, 12),
+        "end_datetime": datetime(2021, 1, 1, 13),
+        "tz": "Europe/London",
+    }
+
+    with patch.object(
+        google_calendar_client,
+        "batch",
+        return_value=[failed_res, created_res],
+    ):
+        with pytest.raises(BatchRequestError) as exc_info:
+            google_calendar_client.create_events([event_params] * 2, calendar=calendar)
+
+        google_calendar_client.validate_request_success = False
+
+        results = google_calendar_client.create_events(
+            [event_params] * 2,
+            calendar=calendar,
+        )
+
+    assert str(exc_info.value).startswith(
+        "1 of 2 batched requests failed, first error: 400 Client Error",
+    )
+    assert exc_info.value.response is failed_res
+    assert exc_info.value.errors == exc_info.value.results[:1]
+    assert exc_info.value.results[1] == results[1]
+
+    error, event = results
+    assert isinstance(error, HTTPError)
+    assert error.response is failed_res
+    assert isinstance(event, Event)
+    assert event.id == event_json["id"]
+
+
+def test_delete_events(
+    google_calendar_client: GoogleCalendarClient,
+    event: Event,
+    calendar: Calendar,
+) -> None:
+    """Test that `delete_events` deletes all events in a batch."""
+    res = Response()
+    res.status_code = HTTPStatus.NOT_FOUND
+    res.url = f"{google_calendar_client.base_url}/calendars/{calendar.id}/events"
+
+    with patch.object(google_calendar_client, "batch", return_value=[res]) as mock_batch:
+        with pytest.raises(BatchRequestError) as exc_info:
+            google_calendar_client.delete_events([event])
+
+        assert exc_info.value.response is res
+
+        google_calendar_client.validate_request_success = False
+
+        (error,) = google_calendar_client.delete_events([event])
+
+    assert isinstance(error, HTTPError)
+    assert error.response is res
+
+    assert list(mock_batch.call_args.args[0]) == [
+        BatchRequest(
+            "DELETE",
+            f"/calendars/{calendar.id}/events/{event.id}",
+            params={"maxResults": None},
+        ),
+    ]
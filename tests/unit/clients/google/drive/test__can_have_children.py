@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
 from textwrap import dedent
 from typing import TYPE_CHECKING
 from unittest.mock import patch
@@ -17,7 +18,9 @@ from wg_utilities.clients.google_drive import (
     File,
     GoogleDriveClient,
     ItemMetadataRetrieval,
+    _as_entity_list,
     _CanHaveChildren,
+    _EntityList,
     _GoogleDriveEntity,
 )
 
@@ -111,6 +114,71 @@ def test_add_file_raises_type_error_for_wrong_type(directory: Directory) -> None
     assert str(exc_info.value) == "Cannot add `Directory` instance to `self.files`."
 
 
+def test_add_file_indexes_by_id(directory: Directory, file: File) -> None:
+    """Test that added files are indexed by ID, and duplicates are found by ID."""
+    directory._add_file(file)
+
+    assert isinstance(directory._files, _EntityList)
+    assert directory._files.get(file.id) is file
+
+    # A different instance of the same file is still a duplicate
+    directory._add_file(file.model_copy())
+
+    assert directory._files == [file]
+    assert directory._files.get(file.id) is file
+
+
+def test_entity_list_index_stays_in_sync(
+    directory: Directory,
+    file: File,
+) -> None:
+    """Test that `_EntityList`'s index is kept in sync with the list's contents."""
+    new_file = file.model_copy(update={"name": "new_file", "id": "new_file_id"})
+    other_file = file.model_copy(update={"name": "other_file", "id": "other_file_id"})
+
+    entities = _EntityList([file])
+    entities.append(new_file)
+    entities += [directory]
+
+    assert entities == [file, new_file, directory]
+    assert all(entity in entities for entity in (file, new_file, directory))
+    assert other_file not in entities
+    assert "not an entity" not in entities
+
+    entities.remove(new_file)
+    assert new_file not in entities
+    assert entities.get(new_file.id) is None
+
+    entities[0] = other_file
+    assert file not in entities
+    assert entities.get(other_file.id) is other_file
+
+    del entities[:]
+    assert entities.get(directory.id) is None
+
+    entities.insert(0, file)
+    copied = deepcopy(entities)
+    assert isinstance(copied, _EntityList)
+    assert copied.get(file.id) == file
+    assert copied.get(file.id) is not file
+
+
+@pytest.mark.parametrize(
+    "value",
+    [[], FieldInfo(default_factory=list)],
+)
+def test_as_entity_list(value: object, file: File) -> None:
+    """Test that plain lists and unset attributes are converted to `_EntityList`s."""
+    if isinstance(value, list):
+        value.append(file)
+
+    entities = _as_entity_list(value)
+
+    assert isinstance(entities, _EntityList)
+    assert entities == ([file] if isinstance(value, list) else [])
+    assert _as_entity_list(entities) is entities
+
+
 def test_add_child_method_file(
     drive: Drive,
     file: File,
@@ -242,9 +242,9 @@ def test_map_directories_only(drive: Drive) -> None:
 
     with patch.object(
         drive.google_client,
-        "get_items",
-        wraps=drive.google_client.get_items,
-    ) as mock_get_items:
+        "iter_items",
+        wraps=drive.google_client.iter_items,
+    ) as mock_iter_items:
         mock_get_directory_by_id = Mock(wraps=drive.get_directory_by_id)
         object.__setattr__(drive, "get_directory_by_id", mock_get_directory_by_id)
 
@@ -255,7 +255,7 @@ def test_map_directories_only(drive: Drive) -> None:
 
     assert drive._directories_mapped is True
 
-    mock_get_items.assert_called_once_with(
+    mock_iter_items.assert_called_once_with(
         "/files",
         list_key="files",
         params={
@@ -267,15 +267,18 @@ def test_map_directories_only(drive: Drive) -> None:
 
     mock_get_file_by_id.assert_not_called()
 
-    assert sorted(mock_get_directory_by_id.call_args_list) == sorted(
-        call(directory.id) for directory in drive._directories
-    )
+    # Known directories are looked up in an index, not one by one
+    mock_get_directory_by_id.assert_not_called()
 
     assert drive._all_files == []
 
     assert isinstance(drive._all_directories, list)
     assert all(isinstance(d, Directory) for d in drive._all_directories)
 
+    # Previously known directories are kept, and nothing is duplicated
+    assert all(d in drive._all_directories for d in drive._directories)
+    assert len({d.id for d in drive._all_directories}) == len(drive._all_directories)
+
     # This list is of *all* directories in the drive, not just the children
     assert not all(d.parent == drive for d in drive._all_directories)
 
@@ -292,9 +295,9 @@ def test_map_directories_and_files(drive: Drive) -> None:
 
     with patch.object(
         drive.google_client,
-        "get_items",
-        wraps=drive.google_client.get_items,
-    ) as mock_get_items:
+        "iter_items",
+        wraps=drive.google_client.iter_items,
+    ) as mock_iter_items:
         mock_get_directory_by_id = Mock(wraps=drive.get_directory_by_id)
         object.__setattr__(drive, "get_directory_by_id", mock_get_directory_by_id)
 
@@ -307,7 +310,7 @@ def test_map_directories_and_files(drive: Drive) -> None:
         assert drive._directories_mapped is True
         assert drive._files_mapped is True
 
-    mock_get_items.assert_called_once_with(
+    mock_iter_items.assert_called_once_with(
         "/files",
         list_key="files",
         params={
@@ -316,9 +319,8 @@ def test_map_directories_and_files(drive: Drive) -> None:
         },
     )
 
-    assert sorted(mock_get_directory_by_id.call_args_list) == sorted(
-        call(directory.id) for directory in drive._directories
-    )
+    # Known directories are looked up in an index, not one by one
+    mock_get_directory_by_id.assert_not_called()
 
     mock_get_file_by_id.assert_not_called()
 
@@ -332,6 +334,22 @@ def test_map_directories_and_files(drive: Drive) -> None:
     assert not all(d.parent == drive for d in drive._all_directories)
 
 
+def test_map_files_after_directories(drive: Drive) -> None:
+    """Test that mapping the files after the directories keeps all directories."""
+    drive.map(EntityType.DIRECTORY)
+    drive.google_client.item_metadata_retrieval = ItemMetadataRetrieval.ON_DEMAND
+
+    all_directories = list(drive._all_directories)
+    assert all_directories
+
+    drive.map(EntityType.FILE)
+
+    assert drive._files_mapped is True
+    assert drive._all_directories == all_directories
+    assert drive._all_files
+    assert all(file.parent in [drive, *all_directories] for file in drive._all_files)
+
+
 def test_map_files_already_mapped(drive: Drive) -> None:
     """Test the `map` method when the files are already mapped."""
     drive._files_mapped = True
@@ -487,9 +505,9 @@ def test_search(
     """Test the `search` method."""
     with patch.object(
         drive.google_client,
-        "get_items",
-    ) as mock_get_items:
-        mock_get_items.return_value = []
+        "iter_items",
+    ) as mock_iter_items:
+        mock_iter_items.return_value = iter([])
 
         results = drive.search(
             term,
@@ -501,13 +519,38 @@ def test_search(
 
     assert results == []
 
-    mock_get_items.assert_called_once_with(
+    mock_iter_items.assert_called_once_with(
         "/files",
         list_key="files",
         params=expected_params,
+        max_items=max_results,
     )
 
 
+def test_search_results_are_siblings(drive: Drive) -> None:
+    """Test that search results are described together in `BATCHED` mode."""
+    items = [
+        {
+            "id": f"file-{i}",
+            "name": f"Result {i}.txt",
+            "parents": ["some-directory-id"],
+            "mimeType": "text/plain",
+        }
+        for i in range(3)
+    ]
+
+    with patch.object(
+        drive.google_client,
+        "iter_items",
+        return_value=iter(items),
+    ):
+        results = drive.search("Result")
+
+    assert [result.id for result in results] == ["file-0", "file-1", "file-2"]
+    assert all(result._siblings is results for result in results)
+    assert results[1]._batch_siblings == [results[1], results[0], results[2]]
+
+
 def test_search_invalid_entity_type(drive: Drive) -> None:
     """Test the `search` method with an invalid entity type."""
     with pytest.raises(
@@ -566,3 +609,162 @@ def test_all_files(drive: Drive) -> None:
     assert drive._files_mapped is True
 
     mock_map.assert_called_once_with()
+
+
+def _change_json(
+    entity: File | Directory | None = None,
+    *,
+    item_id: str | None = None,
+    name: str | None = None,
+    parent_id: str | None = None,
+    mime_type: str | None = None,
+    trashed: bool = False,
+) -> dict[str, Any]:
+    """Build a changes feed entry for an existing entity, or a new item."""
+    item_id = item_id or entity.id  # type: ignore[union-attr]
+
+    return {
+        "changeType": "file",
+        "fileId": item_id,
+        "removed": False,
+        "file": {
+            "id": item_id,
+            "name": name or entity.name,  # type: ignore[union-attr]
+            "parents": [parent_id or entity.parents[0]],  # type: ignore[union-attr]
+            "mimeType": mime_type or entity.mime_type,  # type: ignore[union-attr]
+            "kind": "drive#file",
+            "trashed": trashed,
+        },
+    }
+
+
+def test_sync(drive: Drive) -> None:
+    """Test that `sync` applies only the changes from the changes feed."""
+    drive.google_client.item_metadata_retrieval = ItemMetadataRetrieval.ON_DEMAND
+    drive.map()
+
+    assert drive._changes_page_token == "1234"
+
+    removed_directory = next(
+        d for d in drive._all_directories if d.parent_ == drive and d._directories
+    )
+    removed_ids = {removed_directory.id}
+    to_be_checked = [removed_directory]
+    while to_be_checked:
+        for child in to_be_checked.pop().all_known_children:
+            removed_ids.add(child.id)
+            if isinstance(child, Directory):
+                to_be_checked.append(child)
+
+    renamed_file, moved_file, trashed_file = [
+        f for f in drive._all_files if f.id not in removed_ids
+    ][:3]
+    target_directory = next(d for d in drive._all_directories if d.id not in removed_ids)
+    previous_parent = moved_file.parent_
+
+    new_directory = _change_json(
+        item_id="new-directory-id",
+        name="New Directory",
+        parent_id=drive.id,
+        mime_type=Directory.MIME_TYPE,
+    )
+
+    first_page = {
+        "nextPageToken": "1235",
+        "changes": [
+            _change_json(renamed_file, name="An Old Name.txt"),
+            # The file is listed before its (new) parent directory
+            _change_json(
+                item_id="new-file-id",
+                name="New File.txt",
+                parent_id="new-directory-id",
+                mime_type="text/plain",
+            ),
+            {"changeType": "drive", "driveId": "shared-drive-id"},
+            {"changeType": "file", "fileId": removed_directory.id, "removed": True},
+        ],
+    }
+    second_page = {
+        "newStartPageToken": "1240",
+        "changes": [
+            _change_json(renamed_file, name="A New Name.txt"),
+            _change_json(moved_file, parent_id=target_directory.id),
+            _change_json(trashed_file, trashed=True),
+            new_directory,
+            _change_json(
+                item_id="new-root-file-id",
+                name="New Root File.txt",
+                parent_id=drive.id,
+                mime_type="text/plain",
+            ),
+            # Not in this Drive at all
+            _change_json(
+                item_id="shared-with-me-id",
+                name="Shared With Me.txt",
+                parent_id="someone-elses-directory-id",
+                mime_type="text/plain",
+            ),
+        ],
+    }
+
+    with patch.object(
+        drive.google_client,
+        "get_json_response",
+        side_effect=[first_page, second_page],
+    ) as mock_get_json_response:
+        drive.sync()
+
+    assert mock_get_json_response.call_args_list == [
+        call(
+            "/changes",
+            params={
+                "pageToken": page_token,
+                "pageSize": 1000,
+                "fields": "nextPageToken, newStartPageToken, changes(changeType, "
+                "fileId, removed, file(id, name, parents, mimeType, kind, trashed))",
+            },
+        )
+        for page_token in ("1234", "1235")
+    ]
+
+    assert drive._changes_page_token == "1240"
+
+    assert renamed_file.name == "A New Name.txt"
+    assert renamed_file in drive._all_files
+
+    assert moved_file.parent_ == target_directory
+    assert moved_file in target_directory._files
+    assert previous_parent is None or moved_file not in previous_parent.all_known_children
+
+    assert trashed_file not in drive._all_files
+    assert trashed_file not in trashed_file.parent.all_known_children
+
+    assert removed_directory not in drive._directories
+    assert not removed_ids & {e.id for e in drive.all_known_descendents}
+
+    assert (added_directory := drive._all_directories.get("new-directory-id"))
+    assert added_directory in drive._directories
+    assert (added_file := drive._all_files.get("new-file-id"))
+    assert added_file.parent_ == added_directory
+    assert (added_root_file := drive._all_files.get("new-root-file-id"))
+    assert added_root_file.parent_ == drive
+    assert added_root_file in drive._files
+    assert drive._all_files.get("shared-with-me-id") is None
+
+    # New items are only registered once, even if they're in the Drive's root
+    for entity_id, entities in (
+        ("new-directory-id", drive.all_directories),
+        ("new-file-id", drive.all_files),
+        ("new-root-file-id", drive.all_files),
+    ):
+        assert [entity.id for entity in entities].count(entity_id) == 1
+
+
+def test_sync_not_mapped(drive: Drive) -> None:
+    """Test that `sync` maps the Drive if it hasn't been mapped yet."""
+    mock_map = Mock()
+    object.__setattr__(drive, "map", mock_map)
+
+    drive.sync()
+
+    mock_map.assert_called_once_with(EntityType.FILE)
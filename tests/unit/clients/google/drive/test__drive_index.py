@@ -0,0 +1,239 @@
+"""Unit tests for the `wg_utilities.clients.google_drive_index.DriveIndex` class."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from wg_utilities.clients.google_drive import (
+    Directory,
+    Drive,
+    EntityType,
+    File,
+    ItemMetadataRetrieval,
+)
+from wg_utilities.clients.google_drive_index import DriveIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from wg_utilities.clients import GoogleDriveClient
+    from wg_utilities.functions.json import JSONObj
+
+ITEMS: list[JSONObj] = [
+    {
+        "id": "dir-1",
+        "name": "Documents",
+        "parents": ["root-id"],
+        "mimeType": Directory.MIME_TYPE,
+    },
+    {
+        "id": "file-1",
+        "name": "100%_done.txt",
+        "parents": ["dir-1"],
+        "mimeType": "text/plain",
+    },
+    {
+        "id": "file-2",
+        "name": "1000 done.txt",
+        "parents": ["dir-1"],
+        "mimeType": "text/plain",
+    },
+    {
+        "id": "file-3",
+        "name": "documents.zip",
+        "parents": ["root-id"],
+        "mimeType": "application/zip",
+    },
+]
+
+
+@pytest.fixture(name="drive_index")
+def drive_index_(temp_dir: Path) -> DriveIndex:
+    """Fixture for a `DriveIndex` instance."""
+    return DriveIndex(temp_dir / "index" / "drive_index.db")
+
+
+def test_save_and_load(drive_index: DriveIndex) -> None:
+    """Test that items are loaded in the order they were saved in."""
+    assert drive_index.load("root-id") is None
+
+    drive_index.save("root-id", ITEMS, map_type=EntityType.FILE)
+
+    assert drive_index.load("root-id") == ITEMS
+    assert drive_index.load("root-id", map_type=EntityType.DIRECTORY) == [ITEMS[0]]
+
+    # Saving again replaces the previous items
+    drive_index.save("root-id", ITEMS[:1], map_type=EntityType.FILE)
+
+    assert drive_index.load("root-id") == ITEMS[:1]
+
+    drive_index.delete("root-id")
+
+    assert drive_index.load("root-id") is None
+
+
+def test_directory_map_does_not_cover_files(drive_index: DriveIndex) -> None:
+    """Test that an index of only directories isn't used to look up files."""
+    drive_index.save("root-id", ITEMS[:1], map_type=EntityType.DIRECTORY)
+
+    assert drive_index.load("root-id", map_type=EntityType.DIRECTORY) == ITEMS[:1]
+    assert drive_index.load("root-id", map_type=EntityType.FILE) is None
+    assert drive_index.search("root-id", "doc") is None
+    assert drive_index.search("root-id", "doc", entity_type=EntityType.DIRECTORY) == [
+        ITEMS[0],
+    ]
+
+
+def test_max_age(temp_dir: Path) -> None:
+    """Test that expired indexes are ignored."""
+    drive_index = DriveIndex(temp_dir / "drive_index.db", max_age=timedelta(hours=1))
+    drive_index.save("root-id", ITEMS, map_type=EntityType.FILE)
+
+    assert drive_index.load("root-id") == ITEMS
+
+    with patch(
+        "wg_utilities.clients.google_drive_index.time",
+        return_value=10**12,
+    ):
+        assert drive_index.load("root-id") is None
+        assert drive_index.get_item("root-id", "file-1") is None
+
+
+def test_apply_changes(drive_index: DriveIndex) -> None:
+    """Test that changes are applied to the index, along with the new token."""
+    assert drive_index.get_page_token("root-id") is None
+
+    drive_index.save("root-id", ITEMS, map_type=EntityType.FILE, page_token="1234")
+
+    assert drive_index.get_page_token("root-id") == "1234"
+
+    renamed_item = {**ITEMS[3], "name": "archive.zip"}
+
+    drive_index.apply_changes(
+        "root-id",
+        updated_items=[renamed_item],
+        removed_ids=["file-1"],
+        page_token="1240",
+    )
+
+    assert drive_index.get_page_token("root-id") == "1240"
+    assert drive_index.get_item("root-id", "file-1") is None
+    assert drive_index.get_item("root-id", "file-3") == renamed_item
+    assert [item["id"] for item in drive_index.load("root-id") or ()] == [
+        "dir-1",
+        "file-2",
+        "file-3",
+    ]
+
+
+def test_get_item_and_child(drive_index: DriveIndex) -> None:
+    """Test that single items can be looked up by ID or by parent and name."""
+    drive_index.save("root-id", ITEMS, map_type=EntityType.FILE)
+    drive_index.save("other-id", [], map_type=EntityType.FILE)
+
+    assert drive_index.get_item("root-id", "file-2") == ITEMS[2]
+    assert drive_index.get_item("other-id", "file-2") is None
+    assert drive_index.get_item("unknown-id", "file-2") is None
+
+    assert drive_index.get_child("root-id", "dir-1", "1000 done.txt") == ITEMS[2]
+    assert drive_index.get_child("root-id", "root-id", "1000 done.txt") is None
+
+
+@pytest.mark.parametrize(
+    ("term", "kwargs", "expected_ids"),
+    [
+        pytest.param("doc", {}, ["dir-1", "file-3"], id="case insensitive"),
+        pytest.param("100%", {}, ["file-1"], id="wildcards escaped"),
+        pytest.param("_", {}, ["file-1"], id="underscore escaped"),
+        pytest.param(
+            "doc",
+            {"entity_type": EntityType.FILE},
+            ["file-3"],
+            id="files only",
+        ),
+        pytest.param("done", {"max_results": 1}, ["file-1"], id="max results"),
+        pytest.param("documents", {"exact_match": True}, [], id="exact match"),
+        pytest.param(
+            "Documents",
+            {"exact_match": True},
+            ["dir-1"],
+            id="exact match found",
+        ),
+    ],
+)
+def test_search(
+    drive_index: DriveIndex,
+    term: str,
+    kwargs: dict[str, object],
+    expected_ids: list[str],
+) -> None:
+    """Test searching the index by name."""
+    drive_index.save("root-id", ITEMS, map_type=EntityType.FILE)
+
+    results = drive_index.search("root-id", term, **kwargs)  # type: ignore[arg-type]
+
+    assert results is not None
+    assert [item["id"] for item in results] == expected_ids
+
+
+def test_drive_map_is_rehydrated_from_index(
+    drive: Drive,
+    drive_index: DriveIndex,
+    google_drive_client: GoogleDriveClient,
+) -> None:
+    """Test that a mapped Drive can be rebuilt (and queried) without HTTP requests."""
+    google_drive_client.drive_index = drive_index
+    google_drive_client.item_metadata_retrieval = ItemMetadataRetrieval.ON_DEMAND
+
+    drive.map()
+
+    assert drive_index.load(drive.id) is not None
+
+    new_drive = Drive.from_json_response(
+        drive.model_dump(by_alias=True),
+        google_client=google_drive_client,
+    )
+    file = drive.all_files[-1]
+    directory = drive.all_directories[-1]
+
+    with (
+        patch.object(google_drive_client, "iter_items") as mock_iter_items,
+        patch.object(google_drive_client, "get_items") as mock_get_items,
+        patch.object(
+            google_drive_client,
+            "get_json_response",
+        ) as mock_get_json_response,
+    ):
+        assert new_drive.get_file_by_id(file.id) == file
+        assert new_drive.get_directory_by_id(directory.id) == directory
+
+        assert file in new_drive.search(file.name, exact_match=True)
+
+        navigated = new_drive.navigate(file.path.removeprefix(f"/{drive.name}/"))
+        assert isinstance(navigated, File)
+        assert navigated.path == file.path
+
+        assert new_drive.tree(local_only=True, include_files=True) == drive.tree(
+            local_only=True,
+            include_files=True,
+        )
+
+        new_drive.map()
+
+    mock_iter_items.assert_not_called()
+    mock_get_items.assert_not_called()
+    mock_get_json_response.assert_not_called()
+
+    assert {f.id for f in new_drive.all_files} == {f.id for f in drive.all_files}
+
+
+def test_load_index_without_index(drive: Drive) -> None:
+    """Test that `load_index` is a no-op when the client has no index."""
+    assert drive.google_client.drive_index is None
+
+    assert drive.load_index() is False
+    assert drive._files_mapped is False
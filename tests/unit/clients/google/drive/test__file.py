@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from http import HTTPStatus
+from json import dumps
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
+from requests import Response
 
 from tests.conftest import read_json_file
 from wg_utilities.clients.google_drive import (
@@ -128,6 +130,60 @@ def test_getattr_override_on_first_request_retrieval(
     )
 
 
+def test_getattr_override_batched_retrieval(
+    google_drive_client: GoogleDriveClient,
+    simple_file: File,
+    directory: Directory,
+) -> None:
+    """Test that siblings are described together in one batch for `BATCHED` IMR."""
+    google_drive_client.item_metadata_retrieval = ItemMetadataRetrieval.BATCHED
+
+    description = read_json_file(
+        "v3/files/1x9xhqui0chzagahgr1d0lion2jj5mzo-wu7l5fhcn4b/fields=%2a.json",
+        host_name="google/drive",
+    )
+    sibling = File.from_json_response(
+        {
+            "id": "sibling-file-id",
+            "name": "Sibling File",
+            "parents": simple_file.parents,
+            "mimeType": simple_file.mime_type,
+        },
+        google_client=google_drive_client,
+        host_drive=simple_file.host_drive,
+        parent=directory,
+        _block_describe_call=True,
+    )
+
+    responses = []
+    for file_description in (
+        description,
+        {**description, "id": sibling.id, "name": sibling.name},
+    ):
+        res = Response()
+        res.status_code = HTTPStatus.OK
+        res._content = dumps(file_description).encode()
+        responses.append(res)
+
+    assert simple_file.__dict__["size"] is None
+    assert sibling.__dict__["size"] is None
+
+    with patch.object(
+        google_drive_client,
+        "batch",
+        return_value=responses,
+    ) as mock_batch:
+        assert simple_file.size == 1024
+        assert sibling.size == 1024
+        assert sibling.name == "Sibling File"
+
+    mock_batch.assert_called_once()
+    assert [request.url for request in mock_batch.call_args.args[0]] == [
+        f"/files/{simple_file.id}",
+        f"/files/{sibling.id}",
+    ]
+
+
 def test_mime_type_validation(
     drive: Drive,
     google_drive_client: GoogleDriveClient,
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+from http import HTTPStatus
+from json import dumps
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import pytest
+from requests import HTTPError, Response
+
+from tests.conftest import read_json_file
 from wg_utilities.clients import GoogleDriveClient
+from wg_utilities.clients._google import BatchRequest
 from wg_utilities.clients.google_drive import Drive, ItemMetadataRetrieval
 
 if TYPE_CHECKING:
+    from wg_utilities.clients.google_drive import File
     from wg_utilities.clients.oauth_client import OAuthCredentials
 
 
@@ -65,3 +73,69 @@ def test_shared_drives_property(google_drive_client: GoogleDriveClient) -> None:
     assert len(shared_drives) == 2
     assert shared_drives[0].id == "2MRTrlO0S2aKbXx3OIN"
     assert shared_drives[1].id == "7LUC-DSr43i5CPz8IHB"
+
+
+def test_describe_files(
+    google_drive_client: GoogleDriveClient,
+    simple_file: File,
+    file: File,
+) -> None:
+    """Test that `describe_files` describes files in a batch, skipping failures."""
+    description = read_json_file(
+        "v3/files/1x9xhqui0chzagahgr1d0lion2jj5mzo-wu7l5fhcn4b/fields=%2a.json",
+        host_name="google/drive",
+    )
+
+    file._description = {}  # type: ignore[assignment]
+    assert not simple_file.has_description
+    assert not file.has_description
+
+    success = Response()
+    success.status_code = HTTPStatus.OK
+    success._content = dumps(description).encode()
+
+    failure = Response()
+    failure.status_code = HTTPStatus.NOT_FOUND
+    failure.url = f"{google_drive_client.base_url}/files/{file.id}"
+
+    google_drive_client.validate_request_success = False
+
+    with patch.object(
+        google_drive_client,
+        "batch",
+        return_value=[success, failure],
+    ) as mock_batch:
+        google_drive_client.describe_files([simple_file, file])
+
+    assert list(mock_batch.call_args.args[0]) == [
+        BatchRequest(
+            "GET",
+            f"/files/{simple_file.id}",
+            params={"fields": "*", "pageSize": None},
+        ),
+        BatchRequest(
+            "GET",
+            f"/files/{file.id}",
+            params={"fields": "*", "pageSize": None},
+        ),
+    ]
+
+    assert simple_file.describe() == description
+    assert not file.has_description
+
+    google_drive_client.validate_request_success = True
+
+    with (
+        patch.object(google_drive_client, "batch", return_value=[failure]) as mock_batch,
+        pytest.raises(HTTPError),
+    ):
+        google_drive_client.describe_files([simple_file, file])
+
+    # `simple_file` is already described, so isn't requested again
+    assert list(mock_batch.call_args.args[0]) == [
+        BatchRequest(
+            "GET",
+            f"/files/{file.id}",
+            params={"fields": "*", "pageSize": None},
+        ),
+    ]
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+from http import HTTPStatus
+from json import dumps
 from typing import TYPE_CHECKING, Any
 from unittest.mock import call, patch
 
+import pytest
 from requests import Response, post
+from requests.utils import default_user_agent
 
-from wg_utilities.clients._google import GoogleClient
+from wg_utilities.clients._google import BatchRequest, GoogleClient
 from wg_utilities.clients.oauth_client import OAuthClient, OAuthCredentials
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from requests_mock import Mocker
+    from requests_mock.request import _RequestObjectProxy
+    from requests_mock.response import _Context
 
     from wg_utilities.clients.json_api_client import StrBytIntFlt
 
@@ -100,3 +109,256 @@ def test_get_items_method(fake_oauth_credentials: OAuthCredentials) -> None:
             params={"pageSize": "50", "key": "value", "pageToken": "ghijkl"},
         ),
     ]
+
+
+def _paginated_side_effect(
+    items: list[dict[str, str]],
+    page_size: int,
+) -> Callable[..., dict[str, Any]]:
+    """Serve `items` in pages of `page_size`, using the index as the page token."""
+
+    def _side_effect(
+        method: Callable[..., Response],  # noqa: ARG001
+        url: str,  # noqa: ARG001
+        params: dict[StrBytIntFlt, Any],
+    ) -> dict[str, Any]:
+        start = int(params.get("pageToken", 0))
+        res: dict[str, Any] = {"files": items[start : start + page_size]}
+
+        if start + page_size < len(items):
+            res["nextPageToken"] = str(start + page_size)
+
+        return res
+
+    return _side_effect
+
+
+def test_iter_items_is_lazy(fake_oauth_credentials: OAuthCredentials) -> None:
+    """Test that `iter_items` only requests pages as they're consumed."""
+    client: GoogleClient[dict[str, Any]] = GoogleClient(
+        client_id=fake_oauth_credentials.client_id,
+        client_secret=fake_oauth_credentials.client_secret,
+        base_url="https://www.example.com",
+        scopes=[],
+    )
+    all_items = [{"name": f"file_{i}.txt"} for i in range(10)]
+
+    with patch.object(
+        client,
+        "_request_json_response",
+        side_effect=_paginated_side_effect(all_items, 3),
+    ) as mock_request_json_response:
+        iterator = client.iter_items("/files", list_key="files")
+
+        mock_request_json_response.assert_not_called()
+
+        for item in iterator:  # pragma: no branch
+            if item["name"] == "file_4.txt":
+                break
+
+    assert mock_request_json_response.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("max_items", "expected_request_count"),
+    [
+        (0, 0),
+        (1, 1),
+        (3, 1),
+        (4, 2),
+        (10, 4),
+        (50, 4),
+    ],
+)
+def test_iter_items_max_items(
+    fake_oauth_credentials: OAuthCredentials,
+    max_items: int,
+    expected_request_count: int,
+) -> None:
+    """Test that `iter_items` stops requesting pages once `max_items` is reached."""
+    client: GoogleClient[dict[str, Any]] = GoogleClient(
+        client_id=fake_oauth_credentials.client_id,
+        client_secret=fake_oauth_credentials.client_secret,
+        base_url="https://www.example.com",
+        scopes=[],
+    )
+    all_items = [{"name": f"file_{i}.txt"} for i in range(10)]
+
+    with patch.object(
+        client,
+        "_request_json_response",
+        side_effect=_paginated_side_effect(all_items, 3),
+    ) as mock_request_json_response:
+        items = list(
+            client.iter_items("/files", list_key="files", max_items=max_items),
+        )
+
+    assert items == all_items[:max_items]
+    assert mock_request_json_response.call_count == expected_request_count
+
+
+def test_iter_items_negative_max_items(
+    fake_oauth_credentials: OAuthCredentials,
+) -> None:
+    """Test that `iter_items` rejects a negative `max_items`."""
+    client: GoogleClient[dict[str, Any]] = GoogleClient(
+        client_id=fake_oauth_credentials.client_id,
+        client_secret=fake_oauth_credentials.client_secret,
+        base_url="https://www.example.com",
+        scopes=[],
+    )
+
+    with pytest.raises(ValueError, match="max_items must be at least 0, not -1"):
+        next(client.iter_items("/files", list_key="files", max_items=-1))
+
+
+class _BatchingGoogleClient(GoogleClient[dict[str, Any]]):
+    BASE_URL = "https://www.example.com/v1"
+    BATCH_URL = "https://www.example.com/batch/v1"
+    BATCH_MAX_SIZE = 2
+
+
+def _batch_callback(request: _RequestObjectProxy, context: _Context) -> str:
+    """Echo each sub-request back as its sub-response, in reverse order."""
+    boundary = request.headers["Content-Type"].split("boundary=")[1]
+    parts = request.text.split(f"--{boundary}")[1:-1]
+
+    body = ""
+    for part in reversed(parts):
+        headers, _, http_request = part.strip().partition("\r\n\r\n")
+        content_id = headers.split("Content-ID: <")[1].split(">")[0]
+        request_line, _, request_message = http_request.partition("\r\n")
+        method, path, _ = request_line.split()
+        request_body = request_message.partition("\r\n\r\n")[2]
+
+        status = HTTPStatus.NOT_FOUND if "missing" in path else HTTPStatus.OK
+        content = dumps(
+            {"method": method, "path": path, "body": request_body.strip() or None},
+        )
+
+        body += (
+            "--response_boundary\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <response-{content_id}>\r\n\r\n"
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            f"{content}\r\n"
+        )
+
+    context.headers["Content-Type"] = "multipart/mixed; boundary=response_boundary"
+    return body + "--response_boundary--\r\n"
+
+
+def test_batch_method(
+    temp_dir: Path,
+    fake_oauth_credentials: OAuthCredentials,
+    mock_requests: Mocker,
+) -> None:
+    """Test that `batch` chunks requests and maps sub-responses back in order."""
+    (
+        creds_cache_path := temp_dir / "oauth_credentials/batch_credentials.json"
+    ).write_text(
+        fake_oauth_credentials.model_dump_json(),
+    )
+
+    client = _BatchingGoogleClient(
+        client_id=fake_oauth_credentials.client_id,
+        client_secret=fake_oauth_credentials.client_secret,
+        creds_cache_path=creds_cache_path,
+    )
+
+    mock_requests.post(_BatchingGoogleClient.BATCH_URL, text=_batch_callback)
+
+    responses = client.batch(
+        [
+            BatchRequest("GET", "/files/abc", params={"fields": "*"}),
+            BatchRequest("POST", "/files", json={"name": "new file"}),
+            BatchRequest("DELETE", "/files/missing"),
+        ],
+    )
+
+    assert [res.status_code for res in responses] == [
+        HTTPStatus.OK,
+        HTTPStatus.OK,
+        HTTPStatus.NOT_FOUND,
+    ]
+    assert [res.json() for res in responses] == [
+        {"method": "GET", "path": "/v1/files/abc?fields=%2A&pageSize=50", "body": None},
+        {
+            "method": "POST",
+            "path": "/v1/files?pageSize=50",
+            "body": '{"name": "new file"}',
+        },
+        {"method": "DELETE", "path": "/v1/files/missing?pageSize=50", "body": None},
+    ]
+    assert [res.url for res in responses] == [
+        "https://www.example.com/v1/files/abc",
+        "https://www.example.com/v1/files",
+        "https://www.example.com/v1/files/missing",
+    ]
+
+    # Three requests, in batches of two
+    assert len(mock_requests.request_history) == 2
+    for batch_request in mock_requests.request_history:
+        assert batch_request.url == _BatchingGoogleClient.BATCH_URL
+        assert batch_request.headers["Authorization"] == f"Bearer {client.access_token}"
+
+
+def test_batch_missing_sub_response(
+    temp_dir: Path,
+    fake_oauth_credentials: OAuthCredentials,
+    mock_requests: Mocker,
+) -> None:
+    """Test that a batch response without all of its sub-responses raises an error."""
+    (
+        creds_cache_path := temp_dir / "oauth_credentials/batch_credentials.json"
+    ).write_text(
+        fake_oauth_credentials.model_dump_json(),
+    )
+
+    client = _BatchingGoogleClient(
+        client_id=fake_oauth_credentials.client_id,
+        client_secret=fake_oauth_credentials.client_secret,
+        creds_cache_path=creds_cache_path,
+    )
+
+    mock_requests.post(
+        _BatchingGoogleClient.BATCH_URL,
+        text="--response_boundary--\r\n",
+        headers={"Content-Type": "multipart/mixed; boundary=response_boundary"},
+    )
+
+    with pytest.raises(ValueError) as exc_info:
+        client.batch([BatchRequest("GET", "/files/abc")])
+
+    assert str(exc_info.value) == "Batch response missing sub-responses: [0]"
+
+
+def test_batch_not_supported(fake_oauth_credentials: OAuthCredentials) -> None:
+    """Test that `batch` raises an error for APIs without a batch endpoint."""
+    client: GoogleClient[dict[str, Any]] = GoogleClient(
+        client_id=fake_oauth_credentials.client_id,
+        client_secret=fake_oauth_credentials.client_secret,
+        base_url="https://www.example.com",
+        scopes=[],
+    )
+
+    with pytest.raises(NotImplementedError) as exc_info:
+        client.batch([BatchRequest("GET", "/files/abc")])
+
+    assert str(exc_info.value) == "GoogleClient doesn't support batch requests"
+
+
+def test_session_user_agent_requests_gzip(
+    fake_oauth_credentials: OAuthCredentials,
+) -> None:
+    """Test that the session's User-Agent lets Google gzip its responses."""
+    client: GoogleClient[dict[str, Any]] = GoogleClient(
+        client_id=fake_oauth_credentials.client_id,
+        client_secret=fake_oauth_credentials.client_secret,
+        base_url="https://www.example.com",
+        scopes=[],
+    )
+
+    assert client.session.headers["User-Agent"] == f"{default_user_agent()} (gzip)"
+    assert "gzip" in client.session.headers["Accept-Encoding"]
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
+from tests.conftest import read_json_file
 from wg_utilities.clients import GooglePhotosClient
-from wg_utilities.clients.google_photos import Album
+from wg_utilities.clients.google_photos import Album, MediaItem
 
 if TYPE_CHECKING:
     from requests_mock import Mocker
@@ -167,3 +169,58 @@ def test_albums_property_some_known_albums(
     assert len([album.id for album in google_photos_client._albums]) == len(
         {album.id for album in google_photos_client._albums},
     )
+
+
+def test_get_media_items_by_ids(
+    google_photos_client: GooglePhotosClient,
+    mock_requests: Mocker,
+) -> None:
+    """Test that `get_media_items_by_ids` gets items in chunks, skipping failures."""
+    media_items_json = read_json_file(
+        ":search/pagesize=100&albumid=aeaj_ygjq7orbkhxtxqtvky_nf_thtkex5ygvq6m1-qcy0wwmoosefqrmt5el2hakuossonw3jll.json",
+        host_name="google/photos/v1/mediaitems",
+    )["mediaItems"][:3]
+
+    mock_requests.get(
+        f"{google_photos_client.base_url}/mediaItems:batchGet",
+        [
+            {
+                "json": {
+                    "mediaItemResults": [
+                        {"mediaItem": media_items_json[0]},
+                        {"status": {"code": 5, "message": "Not found"}},
+                    ],
+                },
+            },
+            {
+                "json": {
+                    "mediaItemResults": [
+                        {"mediaItem": media_items_json[1]},
+                        {"mediaItem": media_items_json[2]},
+                    ],
+                },
+            },
+        ],
+    )
+
+    ids = [
+        media_items_json[0]["id"],
+        "unknown",
+        media_items_json[1]["id"],
+        media_items_json[2]["id"],
+    ]
+
+    with patch.object(GooglePhotosClient, "MEDIA_ITEMS_BATCH_GET_MAX_SIZE", 2):
+        media_items = google_photos_client.get_media_items_by_ids(ids)
+
+    assert [item.id for item in media_items] == [
+        media_items_json[0]["id"],
+        media_items_json[1]["id"],
+        media_items_json[2]["id"],
+    ]
+    assert all(isinstance(item, MediaItem) for item in media_items)
+
+    assert [req.qs["mediaitemids"] for req in mock_requests.request_history] == [
+        [ids[0].lower(), ids[1].lower()],
+        [ids[2].lower(), ids[3].lower()],
+    ]
@@ -0,0 +1,231 @@
+"""Unit Tests for `wg_utilities.clients.async_json_api_client.AsyncJsonApiClient`."""
+
+from __future__ import annotations
+
+from asyncio import gather
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aiohttp import ClientResponseError
+
+from wg_utilities.clients.async_json_api_client import AsyncJsonApiClient
+from wg_utilities.clients.json_api_client import GetRequest
+
+if TYPE_CHECKING:
+    from aioresponses import aioresponses
+
+    from wg_utilities.clients.json_api_client import JsonApiClient
+
+
+def test_aio_property(json_api_client: JsonApiClient[dict[str, Any]]) -> None:
+    """Test that the `aio` property returns a cached async client wrapping the client."""
+    aio = json_api_client.aio
+
+    assert isinstance(aio, AsyncJsonApiClient)
+    assert aio.client is json_api_client
+    assert json_api_client.aio is aio
+
+
+@pytest.mark.asyncio
+async def test_get_json_response(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+) -> None:
+    """Test that `get_json_response` sends the correct request and returns the JSON."""
+    mock_aiohttp.get(
+        "https://api.example.com/test_endpoint?test_param=test_value&list_param=a&list_param=b",
+        status=HTTPStatus.OK,
+        payload={"key": "value"},
+    )
+
+    async with json_api_client.aio as aio:
+        res = await aio.get_json_response(
+            "/test_endpoint",
+            params={"test_param": "test_value", "list_param": ["a", "b"], "none": None},
+        )
+
+    assert res == {"key": "value"}
+
+    ((_, url), (request,)) = next(iter(mock_aiohttp.requests.items()))
+
+    assert str(url).startswith("https://api.example.com/test_endpoint")
+    assert request.kwargs["headers"] == {"Content-Type": "application/json"}
+
+
+@pytest.mark.asyncio
+async def test_post_json_response(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+) -> None:
+    """Test that `post_json_response` sends a POST request with the JSON payload."""
+    mock_aiohttp.post(
+        "https://api.example.com/test_endpoint",
+        status=HTTPStatus.OK,
+        payload={"key": "value"},
+    )
+
+    async with json_api_client.aio as aio:
+        res = await aio.post_json_response(
+            "/test_endpoint",
+            json={"payload": True},
+            header_overrides={},
+        )
+
+    assert res == {"key": "value"}
+
+    ((method, _), (request,)) = next(iter(mock_aiohttp.requests.items()))
+
+    assert method == "POST"
+    assert request.kwargs["json"] == {"payload": True}
+    assert request.kwargs["headers"] == {}
+
+
+@pytest.mark.asyncio
+async def test_get_json_response_empty_and_invalid_bodies(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+) -> None:
+    """Test that empty bodies return an empty dict and invalid JSON raises an error."""
+    mock_aiohttp.get(
+        "https://api.example.com/no_content",
+        status=HTTPStatus.NO_CONTENT,
+    )
+    mock_aiohttp.get(
+        "https://api.example.com/invalid",
+        status=HTTPStatus.OK,
+        body="invalid_json",
+    )
+
+    async with json_api_client.aio as aio:
+        assert await aio.get_json_response("/no_content") == {}
+
+        with pytest.raises(ValueError) as exc_info:
+            await aio.get_json_response("/invalid")
+
+    assert str(exc_info.value) == "invalid_json"
+
+
+@pytest.mark.asyncio
+async def test_request_validates_success(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+) -> None:
+    """Test that unsuccessful requests raise an error, unless disabled."""
+    mock_aiohttp.get(
+        "https://api.example.com/test_endpoint",
+        status=HTTPStatus.NOT_FOUND,
+        repeat=True,
+    )
+
+    async with json_api_client.aio as aio:
+        with pytest.raises(ClientResponseError) as exc_info:
+            await aio.get_json_response("/test_endpoint")
+
+        assert exc_info.value.status == HTTPStatus.NOT_FOUND
+
+        json_api_client.validate_request_success = False
+
+        assert await aio.get_json_response("/test_endpoint") == {}
+
+
+@pytest.mark.asyncio
+async def test_get_items_follows_page_tokens_and_next_urls(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+) -> None:
+    """Test that `get_items` follows both pagination styles."""
+    mock_aiohttp.get(
+        "https://api.example.com/tokens",
+        payload={"items": [1, 2], "nextPageToken": "abc"},
+    )
+    mock_aiohttp.get(
+        "https://api.example.com/tokens?pageToken=abc",
+        payload={"items": [3]},
+    )
+    mock_aiohttp.get(
+        "https://api.example.com/urls",
+        payload={"items": [1], "next": "https://api.example.com/urls?offset=1"},
+    )
+    mock_aiohttp.get(
+        "https://api.example.com/urls?offset=1",
+        payload={"items": [2, 3], "next": None},
+    )
+
+    async with json_api_client.aio as aio:
+        tokens, urls = await gather(
+            aio.get_items("/tokens"),
+            aio.get_items("/urls"),
+        )
+
+    assert tokens == [1, 2, 3]
+    assert urls == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_get_items_hard_limit(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+) -> None:
+    """Test that `get_items` stops requesting pages once the hard limit is reached."""
+    mock_aiohttp.get(
+        "https://api.example.com/tokens",
+        payload={"items": [1, 2, 3], "nextPageToken": "abc"},
+    )
+
+    async with json_api_client.aio as aio:
+        assert await aio.get_items("/tokens", hard_limit=2) == [1, 2]
+
+    assert len(mock_aiohttp.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_many(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+) -> None:
+    """Test that `get_many` returns results in order, capturing errors per item."""
+    mock_aiohttp.get("https://api.example.com/one", payload={"id": 1})
+    mock_aiohttp.get("https://api.example.com/two?key=value", payload={"id": 2})
+    mock_aiohttp.get("https://api.example.com/missing", status=HTTPStatus.NOT_FOUND)
+
+    async with json_api_client.aio as aio:
+        one, missing, two = await aio.get_many(
+            [
+                "/one",
+                "/missing",
+                GetRequest("/two", params={"key": "value"}),
+            ],
+            max_concurrency=2,
+        )
+
+    assert one == {"id": 1}
+    assert isinstance(missing, ClientResponseError)
+    assert missing.status == HTTPStatus.NOT_FOUND
+    assert two == {"id": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_many_invalid_max_concurrency(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> None:
+    """Test that `get_many` rejects a `max_concurrency` of less than 1."""
+    with pytest.raises(ValueError) as exc_info:
+        await json_api_client.aio.get_many(["/test_endpoint"], max_concurrency=0)
+
+    assert str(exc_info.value) == "max_concurrency must be at least 1, not 0"
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_and_closed(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> None:
+    """Test that the session is reused within a loop, and closed on exit."""
+    async with json_api_client.aio as aio:
+        session = aio.session
+        assert aio.session is session
+        assert session.connector is not None
+        assert session.connector.limit_per_host == json_api_client.SESSION_POOL_MAXSIZE
+
+    assert session.closed
+    assert aio._session is None
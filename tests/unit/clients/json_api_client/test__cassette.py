@@ -0,0 +1,222 @@
+"""Unit Tests for `wg_utilities.clients.cassette`."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from unittest.mock import call, patch
+
+import pytest
+from requests import get
+
+from wg_utilities.clients.cassette import Cassette, CassetteMissError, Interaction
+from wg_utilities.functions import json_loads
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from requests_mock import Mocker
+
+    from wg_utilities.clients.json_api_client import JsonApiClient
+
+
+@pytest.fixture(name="paginated_api")
+def paginated_api_(mock_requests: Mocker) -> Mocker:
+    """Mock a paginated endpoint, with each page linking to the next."""
+    mock_requests.get(
+        "https://api.example.com/items?limit=2",
+        json={"items": [1, 2], "next": "https://api.example.com/items?offset=2&limit=2"},
+    )
+    mock_requests.get(
+        "https://api.example.com/items?limit=2&offset=2",
+        json={"items": [3], "next": None},
+    )
+
+    return mock_requests
+
+
+def _get_all_items(client: JsonApiClient[dict[str, Any]]) -> list[int]:
+    res = client.get_json_response("/items", params={"limit": 2})
+    items: list[int] = res["items"]
+
+    while next_url := res["next"]:
+        res = client.get_json_response(next_url)
+        items.extend(res["items"])
+
+    return items
+
+
+@pytest.mark.parametrize(
+    ("url", "params", "expected"),
+    [
+        ("https://API.example.com/items", None, "https://api.example.com/items"),
+        (
+            "https://api.example.com/items?offset=2&limit=2",
+            None,
+            "https://api.example.com/items?limit=2&offset=2",
+        ),
+        (
+            "https://api.example.com/items?b=2",
+            {"a": "1", "c": ["3", "4"]},
+            "https://api.example.com/items?a=1&b=2&c=3&c=4",
+        ),
+    ],
+)
+def test_normalize_url(url: str, params: dict[str, Any] | None, expected: str) -> None:
+    """Test that URLs are normalized, so that equivalent requests match."""
+    assert Cassette.normalize_url(url, params) == expected
+
+
+def test_record_and_replay(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    paginated_api: Mocker,
+    temp_dir: Path,
+) -> None:
+    """Test that paginated responses can be recorded, then replayed offline."""
+    cassette_path = temp_dir / "cassettes" / "items.json"
+
+    with Cassette(cassette_path, mode="record") as cassette:
+        json_api_client.cassette = cassette
+        assert _get_all_items(json_api_client) == [1, 2, 3]
+
+    assert len(paginated_api.request_history) == 2
+    assert [
+        (interaction.method, interaction.url, interaction.status_code)
+        for interaction in cassette.interactions
+    ] == [
+        ("GET", "https://api.example.com/items?limit=2", HTTPStatus.OK),
+        ("GET", "https://api.example.com/items?limit=2&offset=2", HTTPStatus.OK),
+    ]
+    assert len(json_loads(cassette_path.read_bytes())["interactions"]) == 2
+
+    json_api_client.cassette = Cassette(cassette_path, latency=0.25)
+
+    with patch("wg_utilities.clients.cassette.sleep") as mock_sleep:
+        assert _get_all_items(json_api_client) == [1, 2, 3]
+
+    assert len(paginated_api.request_history) == 2
+    assert mock_sleep.call_args_list == [call(0.25), call(0.25)]
+
+
+def test_replay_repeated_requests_in_order(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+    temp_dir: Path,
+) -> None:
+    """Test that identical requests get their responses in order, with redaction."""
+    mock_requests.post(
+        "https://api.example.com/token",
+        [
+            {"json": {"access_token": "first", "expires_in": 3600}},
+            {"json": {"access_token": "second", "expires_in": 1800}},
+        ],
+    )
+
+    cassette = Cassette(temp_dir / "token.json", mode="record")
+    json_api_client.cassette = cassette
+
+    # The live responses aren't redacted
+    assert json_api_client.post_json_response("/token", data={"code": "abc"}) == {
+        "access_token": "first",
+        "expires_in": 3600,
+    }
+    json_api_client.post_json_response("/token", data={"code": "def"})
+    cassette.save()
+
+    json_api_client.cassette = Cassette(temp_dir / "token.json")
+
+    assert [
+        json_api_client.post_json_response("/token", data={"code": "ghi"})
+        for _ in range(3)
+    ] == [
+        {"access_token": "REDACTED", "expires_in": 3600},
+        {"access_token": "REDACTED", "expires_in": 1800},
+        {"access_token": "REDACTED", "expires_in": 1800},
+    ]
+
+    assert len(mock_requests.request_history) == 2
+
+
+def test_replay_streamed_request(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    paginated_api: Mocker,
+    temp_dir: Path,
+) -> None:
+    """Test that streamed responses can be replayed (and closed) from a cassette."""
+    with Cassette(temp_dir / "streamed.json", mode="record") as cassette:
+        json_api_client.cassette = cassette
+        assert list(
+            json_api_client.iter_json_items(
+                "/items",
+                list_key="items",
+                params={"limit": 2},
+            ),
+        ) == [1, 2]
+
+    json_api_client.cassette = Cassette(temp_dir / "streamed.json")
+
+    metadata: dict[str, Any] = {}
+
+    assert list(
+        json_api_client.iter_json_items(
+            "/items",
+            list_key="items",
+            params={"limit": 2},
+            metadata=metadata,
+            chunk_size=4,
+        ),
+    ) == [1, 2]
+    assert metadata == {"next": "https://api.example.com/items?offset=2&limit=2"}
+
+    res = json_api_client._request(
+        method=get,
+        url="/items",
+        params={"limit": 2},
+        stream=True,
+    )
+    assert json_loads(b"".join(res.iter_content(4)))["items"] == [1, 2]
+    res.close()
+
+    assert len(paginated_api.request_history) == 1
+
+
+def test_replay_miss(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+    temp_dir: Path,
+) -> None:
+    """Test that requests without a recorded response raise an error."""
+    cassette = Cassette(temp_dir / "empty.json", mode="record")
+    cassette.add(
+        Interaction(
+            method="GET",
+            url="https://api.example.com/items?limit=2",
+            status_code=HTTPStatus.NOT_FOUND,
+            headers={},
+            content=b"",
+        ),
+    )
+    cassette.save()
+
+    json_api_client.cassette = Cassette(temp_dir / "empty.json")
+
+    with pytest.raises(CassetteMissError) as exc_info:
+        json_api_client.get_json_response("/items", params={"limit": 3})
+
+    assert (
+        str(exc_info.value)
+        == "No recorded response for GET https://api.example.com/items?limit=3"
+    )
+
+    json_api_client.validate_request_success = False
+    res = json_api_client._request(method=get, url="/items", params={"limit": 2})
+
+    assert res.status_code == HTTPStatus.NOT_FOUND
+    assert res.reason == "Not Found"
+    assert not mock_requests.request_history
+
+
+def test_replay_missing_cassette(temp_dir: Path) -> None:
+    """Test that replaying a cassette which doesn't exist raises an error."""
+    with pytest.raises(FileNotFoundError):
+        Cassette(temp_dir / "missing.json")
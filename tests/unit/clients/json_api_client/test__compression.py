@@ -0,0 +1,174 @@
+"""Unit Tests for `JsonApiClient`'s request/response compression."""
+
+from __future__ import annotations
+
+from gzip import compress, decompress
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+
+from wg_utilities.clients.json_api_client import JsonApiClient
+from wg_utilities.functions import json_dumps_bytes, json_loads
+
+if TYPE_CHECKING:
+    from aioresponses import aioresponses
+    from requests_mock import Mocker
+
+LARGE_PAYLOAD = {"items": [{"id": i, "name": f"Item {i}"} for i in range(100)]}
+
+
+@pytest.fixture(name="compressing_client")
+def compressing_client_(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> JsonApiClient[dict[str, Any]]:
+    """Enable request compression for bodies of at least 1KB."""
+    json_api_client.REQUEST_COMPRESSION_MIN_SIZE = 1024  # type: ignore[misc]
+
+    return json_api_client
+
+
+def test_accept_encoding_header(json_api_client: JsonApiClient[dict[str, Any]]) -> None:
+    """Test that the session advertises the encodings it can decode."""
+    assert "gzip" in json_api_client.session.headers["Accept-Encoding"]
+    assert (
+        json_api_client.session.headers["Accept-Encoding"]
+        == JsonApiClient.ACCEPT_ENCODING
+    )
+
+
+def test_gzipped_response_is_decoded(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that gzipped responses are decoded transparently."""
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        content=compress(json_dumps_bytes(LARGE_PAYLOAD)),
+        headers={"Content-Encoding": "gzip"},
+    )
+
+    assert json_api_client.get_json_response("/test_endpoint") == LARGE_PAYLOAD
+
+
+def test_request_body_not_compressed_by_default(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that request bodies aren't compressed unless it's enabled."""
+    mock_requests.post("https://api.example.com/test_endpoint", json={})
+
+    json_api_client.post_json_response("/test_endpoint", json=LARGE_PAYLOAD)
+
+    assert "Content-Encoding" not in mock_requests.last_request.headers
+    assert mock_requests.last_request.json() == LARGE_PAYLOAD
+
+
+def test_large_request_body_is_compressed(
+    compressing_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that JSON bodies over the size threshold are gzipped."""
+    mock_requests.post("https://api.example.com/test_endpoint", json={})
+
+    compressing_client.post_json_response("/test_endpoint", json=LARGE_PAYLOAD)
+
+    request = mock_requests.last_request
+
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert request.headers["Content-Type"] == "application/json"
+    assert json_loads(decompress(request.body)) == LARGE_PAYLOAD
+
+
+@pytest.mark.parametrize(
+    ("json", "data"),
+    [
+        pytest.param({"small": True}, None, id="small JSON body"),
+        pytest.param(None, {"form": "x" * 2048}, id="form data"),
+        pytest.param(None, None, id="no body"),
+    ],
+)
+def test_request_body_not_compressed(
+    compressing_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+    json: Any,
+    data: Any,
+) -> None:
+    """Test that small bodies and form data aren't compressed."""
+    mock_requests.post("https://api.example.com/test_endpoint", json={})
+
+    compressing_client.post_json_response("/test_endpoint", json=json, data=data)
+
+    assert "Content-Encoding" not in mock_requests.last_request.headers
+
+
+def test_rejected_compression_falls_back(
+    compressing_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that a 415 response disables compression and resends the request."""
+    mock_requests.post(
+        "https://api.example.com/test_endpoint",
+        [
+            {"status_code": HTTPStatus.UNSUPPORTED_MEDIA_TYPE},
+            {"json": {"first": True}},
+            {"json": {"second": True}},
+        ],
+    )
+
+    assert compressing_client.post_json_response(
+        "/test_endpoint",
+        json=LARGE_PAYLOAD,
+    ) == {"first": True}
+    assert compressing_client.post_json_response(
+        "/test_endpoint",
+        json=LARGE_PAYLOAD,
+    ) == {"second": True}
+
+    assert [
+        request.headers.get("Content-Encoding")
+        for request in mock_requests.request_history
+    ] == ["gzip", None, None]
+    assert mock_requests.request_history[1].json() == LARGE_PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_async_request_compression(
+    compressing_client: JsonApiClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+) -> None:
+    """Test that async requests are compressed, with the same 415 fallback."""
+    mock_aiohttp.post(
+        "https://api.example.com/test_endpoint",
+        status=HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+    )
+    mock_aiohttp.post(
+        "https://api.example.com/test_endpoint",
+        status=HTTPStatus.OK,
+        payload={"key": "value"},
+    )
+
+    with patch.object(compressing_client, "validate_request_success", new=True):
+        async with compressing_client.aio as aio:
+            res = await aio.post_json_response(
+                "/test_endpoint",
+                json=LARGE_PAYLOAD,
+                header_overrides={},
+            )
+
+    assert res == {"key": "value"}
+
+    ((_, _), (compressed_request, plain_request)) = next(
+        iter(mock_aiohttp.requests.items()),
+    )
+
+    assert compressed_request.kwargs["headers"] == {
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+    }
+    assert json_loads(decompress(compressed_request.kwargs["data"])) == LARGE_PAYLOAD
+
+    assert plain_request.kwargs["headers"] == {}
+    assert plain_request.kwargs["json"] == LARGE_PAYLOAD
+    assert compressing_client._request_compression_rejected
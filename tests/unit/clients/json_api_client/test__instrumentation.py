@@ -0,0 +1,144 @@
+"""Unit Tests for `wg_utilities.clients.instrumentation`."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from json import dumps
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from wg_utilities.clients.instrumentation import (
+    EndpointStats,
+    MetricsRegistry,
+    RequestMetrics,
+    endpoint_template,
+)
+from wg_utilities.clients.json_api_client import RetryPolicy
+
+if TYPE_CHECKING:
+    from aioresponses import aioresponses
+    from requests_mock import Mocker
+
+    from wg_utilities.clients.json_api_client import JsonApiClient
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (
+            "https://api.spotify.com/v1/playlists/37i9dQZF1DXcBWIGoYBM5M/tracks",
+            "/playlists/{id}/tracks",
+        ),
+        (
+            "https://api.spotify.com/v1/me/player/currently-playing",
+            "/me/player/currently-playing",
+        ),
+        ("https://api.spotify.com/v1/albums/123?market=GB", "/albums/{id}"),
+        ("/files/1a2b3c4d5e6f7g8h9i0j/permissions", "/files/{id}/permissions"),
+        ("https://other.example.com/drive/v3/files", "/drive/v3/files"),
+    ],
+)
+def test_endpoint_template(url: str, expected: str) -> None:
+    """Test that IDs are templated out of URLs, along with the base URL and query."""
+    assert endpoint_template(url, "https://api.spotify.com/v1") == expected
+
+
+def test_endpoint_stats() -> None:
+    """Test that request metrics are aggregated correctly."""
+    stats = EndpointStats()
+
+    for wall_time, status_code in ((0.01, 200), (0.3, 200), (45, None)):
+        stats.add(
+            RequestMetrics(
+                client="Client",
+                method="GET",
+                endpoint="/",
+                wall_time=wall_time,
+                ttfb=wall_time / 2 if status_code else None,
+                response_bytes=100,
+                status_code=status_code,
+                retries=1,
+            ),
+        )
+
+    stats_dict = stats.as_dict()
+
+    assert stats_dict["count"] == 3
+    assert stats_dict["retries"] == 3
+    assert stats_dict["response_bytes"] == 300
+    assert stats_dict["status_codes"] == {"200": 2, "error": 1}
+    assert stats_dict["wall_time"]["max"] == 45
+    assert stats_dict["ttfb"]["max"] == 0.15
+    assert stats_dict["wall_time"]["histogram"] == {
+        "0.05": 1,
+        "0.1": 0,
+        "0.25": 0,
+        "0.5": 1,
+        "1": 0,
+        "2.5": 0,
+        "5": 0,
+        "10": 0,
+        "30": 0,
+        "+Inf": 1,
+    }
+
+
+def test_client_records_metrics_per_endpoint(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that the client records metrics for each request, per templated endpoint."""
+    json_api_client.instrumentation = metrics = MetricsRegistry()
+
+    mock_requests.get(
+        "https://api.example.com/items/123456",
+        [{"status_code": HTTPStatus.SERVICE_UNAVAILABLE}, {"json": {"key": "value"}}],
+    )
+    mock_requests.get("https://api.example.com/items/654321", json={"key": "value"})
+    mock_requests.get("https://api.example.com/error", exc=RequestsConnectionError)
+
+    json_api_client.retry_policy = RetryPolicy(max_attempts=1)
+    with pytest.raises(RequestsConnectionError):
+        json_api_client.get_json_response("/error")
+
+    json_api_client.retry_policy = RetryPolicy()
+    with patch("wg_utilities.functions.decorators.sleep"):
+        json_api_client.get_json_response("/items/123456")
+        json_api_client.get_json_response("/items/654321")
+
+    snapshot = metrics.snapshot()
+    dumps(snapshot)
+
+    items = snapshot["JsonApiClient"]["GET /items/{id}"]
+    assert items["count"] == 2
+    assert items["retries"] == 1
+    assert items["response_bytes"] == 2 * len(b'{"key": "value"}')
+    assert items["status_codes"] == {"200": 2}
+
+    assert snapshot["JsonApiClient"]["GET /error"]["status_codes"] == {"error": 1}
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_async_client_records_metrics(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+) -> None:
+    """Test that the async client records metrics via the same hook."""
+    json_api_client.instrumentation = metrics = MetricsRegistry()
+
+    mock_aiohttp.get("https://api.example.com/items/123456", payload={"key": "value"})
+
+    async with json_api_client.aio as aio:
+        await aio.get_json_response("/items/123456")
+
+    items = metrics.snapshot()["JsonApiClient"]["GET /items/{id}"]
+
+    assert items["count"] == 1
+    assert items["status_codes"] == {"200": 1}
+    assert items["response_bytes"] == len(b'{"key": "value"}')
@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from copy import deepcopy
+from functools import partial
 from http import HTTPStatus
 from logging import DEBUG
+from threading import Event, Lock, Semaphore, current_thread
 from typing import TYPE_CHECKING, Any
-from unittest.mock import call, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
-from requests import HTTPError, get, post
+from requests import HTTPError, Session, get, post, put
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from wg_utilities.clients.json_api_client import LOGGER, GetRequest, RetryPolicy
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from requests import Response
     from requests_mock import Mocker
 
     from wg_utilities.clients.json_api_client import JsonApiClient
@@ -192,6 +204,54 @@ def test_request_validate_request_success_false(
     assert res.status_code == HTTPStatus.NOT_FOUND
 
 
+@pytest.mark.parametrize(
+    ("method", "expected_method"),
+    [
+        pytest.param(put, "PUT", id="requests function"),
+        pytest.param(Session.patch, "PATCH", id="Session function"),
+        pytest.param(Session().delete, "DELETE", id="bound Session method"),
+        pytest.param("post", "POST", id="verb"),
+    ],
+)
+def test_request_method_names(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+    method: Callable[..., Response] | str,
+    expected_method: str,
+) -> None:
+    """Test that the HTTP verb is taken from known request methods or a string."""
+    mock_requests.register_uri(
+        expected_method,
+        "https://api.example.com/test_endpoint",
+        status_code=HTTPStatus.OK,
+        json={},
+    )
+
+    json_api_client._request(method=method, url="/test_endpoint")
+
+    assert mock_requests.request_history[0].method == expected_method
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        pytest.param(partial(get, timeout=10), id="partial"),
+        pytest.param(lambda *_, **__: None, id="lambda"),
+        pytest.param(MagicMock(), id="mock"),
+    ],
+)
+def test_request_unknown_method(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+    method: Callable[..., Response],
+) -> None:
+    """Test that unknown request methods are rejected instead of guessing the verb."""
+    with pytest.raises(ValueError, match=r"^Unknown HTTP method "):
+        json_api_client._request(method=method, url="/test_endpoint")
+
+    assert not mock_requests.request_history
+
+
 def test_request_json_response(
     json_api_client: JsonApiClient[dict[str, Any]],
     mock_requests: Mocker,
@@ -348,3 +408,488 @@ def test_request_headers(
     assert json_api_client.request_headers == {
         "Content-Type": "application/json",
     }
+
+
+def test_session_is_pooled_and_reused(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that the `session` property returns the same pooled session each time."""
+    session = json_api_client.session
+
+    assert isinstance(session, Session)
+    assert json_api_client.session is session
+
+    adapter = session.get_adapter("https://api.example.com")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_connections == json_api_client.SESSION_POOL_CONNECTIONS
+    assert adapter._pool_maxsize == json_api_client.SESSION_POOL_MAXSIZE
+    assert adapter._pool_block == json_api_client.SESSION_POOL_BLOCK
+
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        status_code=HTTPStatus.OK,
+        json={"key": "value"},
+    )
+
+    with patch.object(session, "request", wraps=session.request) as mock_request:
+        json_api_client.get_json_response("/test_endpoint")
+
+    mock_request.assert_called_once()
+    assert mock_request.call_args.args == ("GET", "https://api.example.com/test_endpoint")
+
+
+def test_close_session(json_api_client: JsonApiClient[dict[str, Any]]) -> None:
+    """Test that `close_session` closes the session and a new one is created after."""
+    session = json_api_client.session
+
+    with patch.object(session, "close") as mock_close:
+        json_api_client.close_session()
+
+    mock_close.assert_called_once_with()
+
+    assert json_api_client.session is not session
+
+
+def test_session_keep_alive_disabled(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> None:
+    """Test that disabling keep-alive sets the `Connection` header on the session."""
+    assert json_api_client.session.headers["Connection"] == "keep-alive"
+
+    json_api_client.close_session()
+
+    with patch.object(json_api_client, "SESSION_KEEP_ALIVE", new=False):
+        assert json_api_client.session.headers["Connection"] == "close"
+
+
+def test_request_retries_retryable_statuses_and_errors(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that idempotent requests are retried on connection errors and 5xx/429s."""
+    json_api_client.retry_policy = RetryPolicy()
+
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        [
+            {"exc": RequestsConnectionError},
+            {"status_code": HTTPStatus.SERVICE_UNAVAILABLE},
+            {"json": {"key": "value"}},
+        ],
+    )
+
+    with patch("wg_utilities.functions.decorators.sleep") as mock_sleep:
+        assert json_api_client.get_json_response("/test_endpoint") == {"key": "value"}
+
+    assert mock_requests.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+def test_request_retries_exhausted(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that the final response is validated as normal once retries run out."""
+    json_api_client.retry_policy = RetryPolicy(max_attempts=4)
+
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        status_code=HTTPStatus.BAD_GATEWAY,
+        reason=HTTPStatus.BAD_GATEWAY.phrase,
+    )
+
+    with (
+        patch("wg_utilities.functions.decorators.sleep"),
+        pytest.raises(HTTPError) as exc_info,
+    ):
+        json_api_client.get_json_response("/test_endpoint")
+
+    assert exc_info.value.response is not None
+    assert exc_info.value.response.status_code == HTTPStatus.BAD_GATEWAY
+    assert mock_requests.call_count == 4
+
+
+def test_request_not_retried_by_default(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that requests aren't retried unless the client has a retry policy."""
+    assert json_api_client.retry_policy is None
+
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        [{"exc": RequestsConnectionError}, {"json": {"key": "value"}}],
+    )
+
+    with pytest.raises(RequestsConnectionError):
+        json_api_client.get_json_response("/test_endpoint")
+
+    assert mock_requests.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("retry_policy", "method", "status_code"),
+    [
+        (RetryPolicy(), post, HTTPStatus.SERVICE_UNAVAILABLE),
+        (RetryPolicy(), get, HTTPStatus.NOT_FOUND),
+        (None, get, HTTPStatus.SERVICE_UNAVAILABLE),
+    ],
+)
+def test_request_not_retried(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+    retry_policy: RetryPolicy | None,
+    method: Any,
+    status_code: HTTPStatus,
+) -> None:
+    """Test that non-idempotent requests and non-retryable statuses aren't retried."""
+    json_api_client.retry_policy = retry_policy
+    json_api_client.validate_request_success = False
+
+    mock_requests.register_uri(
+        method.__name__.upper(),
+        "https://api.example.com/test_endpoint",
+        status_code=status_code,
+    )
+
+    with patch("wg_utilities.functions.decorators.sleep") as mock_sleep:
+        res = json_api_client._request(method=method, url="/test_endpoint")
+
+    assert res.status_code == status_code
+    assert mock_requests.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_iter_json_items_streams_response(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that `iter_json_items` streams the items from the response."""
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        json={"nextPageToken": "abc", "files": [{"id": 1}, {"id": 2}], "kind": "list"},
+    )
+
+    metadata: dict[str, Any] = {}
+
+    with patch.object(
+        json_api_client.session,
+        "request",
+        wraps=json_api_client.session.request,
+    ) as mock_request:
+        items = list(
+            json_api_client.iter_json_items(
+                "/test_endpoint",
+                list_key="files",
+                metadata=metadata,
+                chunk_size=4,
+            ),
+        )
+
+    assert items == [{"id": 1}, {"id": 2}]
+    assert metadata == {"nextPageToken": "abc", "kind": "list"}
+    assert mock_request.call_args.kwargs["stream"] is True
+
+
+@pytest.mark.parametrize(
+    ("content_type", "encoding"),
+    [
+        ("application/json", "utf-8"),
+        ("application/json; charset=latin-1", "latin-1"),
+    ],
+)
+def test_iter_json_items_decodes_chunks(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+    content_type: str,
+    encoding: str,
+) -> None:
+    """Test that multibyte characters split across chunks are decoded correctly."""
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        content='["café", "naïve"]'.encode(encoding),
+        headers={"Content-Type": content_type},
+    )
+
+    items = json_api_client.iter_json_items(
+        "/test_endpoint",
+        list_key=None,
+        chunk_size=1,
+    )
+
+    assert list(items) == ["café", "naïve"]
+
+
+def test_iter_json_items_no_content(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that `iter_json_items` yields nothing for a 204 response."""
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        status_code=HTTPStatus.NO_CONTENT,
+    )
+
+    assert not list(json_api_client.iter_json_items("/test_endpoint"))
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_coalesce_requests(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+    fail: bool,
+) -> None:
+    """Test that concurrent identical GET requests share a single HTTP call."""
+    json_api_client.coalesce_requests = True
+
+    release = Event()
+    waiting = Semaphore(0)
+
+    def _callback(*_: Any) -> dict[str, str]:
+        release.wait(5)
+
+        if fail:
+            raise RequestsConnectionError
+
+        return {"key": "value"}
+
+    def _debug(msg: str, *_: Any) -> None:
+        if msg.startswith("Waiting for in-flight request"):
+            waiting.release()
+
+    mock_requests.get("https://api.example.com/test_endpoint", json=_callback)
+
+    with (
+        patch.object(LOGGER, "debug", side_effect=_debug),
+        ThreadPoolExecutor(5) as pool,
+    ):
+        futures = [
+            pool.submit(json_api_client.get_json_response, "/test_endpoint")
+            for _ in range(5)
+        ]
+
+        for _ in range(4):
+            assert waiting.acquire(timeout=5)
+
+        release.set()
+
+        if fail:
+            for future in futures:
+                with pytest.raises(RequestsConnectionError):
+                    future.result()
+        else:
+            assert [future.result() for future in futures] == [{"key": "value"}] * 5
+
+    assert mock_requests.call_count == 1
+    assert json_api_client._in_flight == {}
+
+    # Once the request has completed, a new one is made
+    release.set()
+    with pytest.raises(RequestsConnectionError) if fail else nullcontext():
+        json_api_client.get_json_response("/test_endpoint")
+
+    assert mock_requests.call_count == 2
+
+
+def test_in_flight_requests_not_copied(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> None:
+    """Test that copies of a client don't share (or copy) its in-flight requests."""
+    json_api_client._in_flight["GET https://api.example.com/test_endpoint?"] = Future()
+
+    client_copy = deepcopy(json_api_client)
+
+    assert client_copy._in_flight == {}
+    assert client_copy._in_flight_lock is not json_api_client._in_flight_lock
+    assert len(json_api_client._in_flight) == 1
+
+
+def test_get_many(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that `get_many` returns results in order, capturing errors per item."""
+    mock_requests.get("https://api.example.com/one", json={"id": 1})
+    mock_requests.get(
+        "https://api.example.com/two?key=value",
+        json={"id": 2},
+        complete_qs=True,
+    )
+    mock_requests.get(
+        "https://api.example.com/missing",
+        status_code=HTTPStatus.NOT_FOUND,
+    )
+
+    one, missing, two = json_api_client.get_many(
+        [
+            "/one",
+            "/missing",
+            GetRequest("/two", params={"key": "value"}),
+        ],
+        max_concurrency=3,
+    )
+
+    assert one == {"id": 1}
+    assert isinstance(missing, HTTPError)
+    assert missing.response.status_code == HTTPStatus.NOT_FOUND
+    assert two == {"id": 2}
+
+
+def test_get_many_bounded_concurrency(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> None:
+    """Test that `get_many` never has more than `max_concurrency` requests in flight."""
+    in_flight = peak = 0
+    lock = Lock()
+    all_started = Event()
+
+    def _get_json_response(url: str, **_: Any) -> dict[str, str]:
+        nonlocal in_flight, peak
+
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            if peak == 3:
+                all_started.set()
+
+        all_started.wait(5)
+
+        with lock:
+            in_flight -= 1
+
+        return {"url": url}
+
+    with patch.object(
+        json_api_client,
+        "get_json_response",
+        side_effect=_get_json_response,
+    ):
+        results = json_api_client.get_many(
+            [f"/test_endpoint/{i}" for i in range(10)],
+            max_concurrency=3,
+        )
+
+    assert results == [{"url": f"/test_endpoint/{i}"} for i in range(10)]
+    assert peak == 3
+
+
+def test_get_many_sequential(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that `get_many` doesn't start a thread pool if it doesn't need one."""
+    mock_requests.get("https://api.example.com/test_endpoint", json={"key": "value"})
+
+    with patch(
+        "wg_utilities.clients.json_api_client.ThreadPoolExecutor",
+    ) as mock_pool:
+        assert json_api_client.get_many([]) == []
+        assert json_api_client.get_many(["/test_endpoint"]) == [{"key": "value"}]
+        assert json_api_client.get_many(
+            ["/test_endpoint", "/test_endpoint"],
+            max_concurrency=1,
+        ) == [{"key": "value"}, {"key": "value"}]
+
+    mock_pool.assert_not_called()
+
+
+def test_get_many_invalid_max_concurrency(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> None:
+    """Test that `get_many` rejects a `max_concurrency` of less than 1."""
+    with pytest.raises(ValueError) as exc_info:
+        json_api_client.get_many(["/test_endpoint"], max_concurrency=0)
+
+    assert str(exc_info.value) == "max_concurrency must be at least 1, not 0"
+
+
+def test_prefetch_pages_fetches_ahead(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> None:
+    """Test that `_prefetch_pages` fetches the next page while the caller is busy."""
+    json_api_client.page_prefetch_depth = 1
+    fetched: list[int] = []
+    page_fetched = {i: Event() for i in range(5)}
+
+    def _pages() -> Iterator[int]:
+        for i in range(5):
+            fetched.append(i)
+            page_fetched[i].set()
+            yield i
+
+    pages = json_api_client._prefetch_pages(_pages())
+
+    assert next(pages) == 0
+
+    # The caller is "processing" page 0, so page 1 is fetched in the background...
+    assert page_fetched[1].wait(5)
+    # ...but no further, as the prefetch depth is 1
+    assert not page_fetched[2].wait(0.3)
+    assert fetched == [0, 1]
+
+    assert list(pages) == [1, 2, 3, 4]
+
+
+def test_prefetch_pages_stops_when_caller_does(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> None:
+    """Test that `_prefetch_pages` stops fetching pages once the caller stops."""
+    json_api_client.page_prefetch_depth = 1
+    fetched: list[int] = []
+    finished = Event()
+
+    def _pages() -> Iterator[int]:
+        try:
+            for i in range(100):
+                fetched.append(i)
+                yield i
+        finally:
+            finished.set()
+
+    pages = json_api_client._prefetch_pages(_pages())
+
+    assert next(pages) == 0
+    pages.close()
+
+    assert finished.wait(5)
+    assert fetched == [0, 1]
+
+
+def test_prefetch_pages_raises_errors_in_order(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> None:
+    """Test that an error fetching a page is raised when the caller reaches it."""
+    json_api_client.page_prefetch_depth = 1
+
+    def _pages() -> Iterator[int]:
+        yield 0
+        yield 1
+        raise HTTPError("Page 2 not found")
+
+    pages = json_api_client._prefetch_pages(_pages())
+
+    assert next(pages) == 0
+    assert next(pages) == 1
+
+    with pytest.raises(HTTPError, match="Page 2 not found"):
+        next(pages)
+
+
+def test_prefetch_pages_disabled(
+    json_api_client: JsonApiClient[dict[str, Any]],
+) -> None:
+    """Test that pages are fetched in the caller's thread if prefetching is disabled."""
+    assert json_api_client.page_prefetch_depth == 0
+
+    def _pages() -> Iterator[str]:
+        for _ in range(3):
+            yield current_thread().name
+
+    assert (
+        list(json_api_client._prefetch_pages(_pages()))
+        == [
+            current_thread().name,
+        ]
+        * 3
+    )
@@ -0,0 +1,189 @@
+"""Unit Tests for `wg_utilities.clients.rate_limiter`."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from http import HTTPStatus
+from logging import WARNING
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from freezegun import freeze_time
+
+from wg_utilities.clients.json_api_client import JsonApiClient
+from wg_utilities.clients.rate_limiter import RateLimiter, parse_retry_after
+
+if TYPE_CHECKING:
+    from aioresponses import aioresponses
+    from requests_mock import Mocker
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"Retry-After": "5"}, 5),
+        ({"Retry-After": "0.5"}, 0.5),
+        ({"Retry-After": "-1"}, 0),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:05 GMT"}, 5),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:27:00 GMT"}, 0),
+        ({"Retry-After": "soon"}, None),
+    ],
+)
+@freeze_time("2015-10-21 07:28:00")
+def test_parse_retry_after(headers: dict[str, str], expected: float | None) -> None:
+    """Test that both formats of the `Retry-After` header are parsed."""
+    assert parse_retry_after(headers) == expected
+
+
+@freeze_time("2024-01-01 00:00:00")
+def test_rate_limiter_paces_requests_after_burst() -> None:
+    """Test that requests beyond the burst size wait for their (reserved) token."""
+    limiter = RateLimiter(rate=2, capacity=2)
+
+    with patch("wg_utilities.clients.rate_limiter.sleep") as mock_sleep:
+        waits = [limiter.acquire() for _ in range(4)]
+
+    assert waits == [0, 0, 0.5, 1]
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1]
+
+
+def test_rate_limiter_refills_tokens() -> None:
+    """Test that tokens are replenished over time, up to the capacity."""
+    with patch("wg_utilities.clients.rate_limiter.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 0
+        limiter = RateLimiter(rate=2, capacity=2)
+
+        assert [limiter._reserve() for _ in range(3)] == [0, 0, 0.5]
+
+        mock_monotonic.return_value = 60
+
+        assert [limiter._reserve() for _ in range(3)] == [0, 0, 0.5]
+
+
+@freeze_time("2024-01-01 00:00:00")
+def test_rate_limiter_pause() -> None:
+    """Test that pausing the limiter makes all requests wait, even without pacing."""
+    limiter = RateLimiter()
+
+    assert limiter._reserve() == 0
+
+    limiter.pause(5)
+    limiter.pause(1)
+
+    assert limiter._reserve() == 5
+    assert limiter._reserve() == 5
+
+
+def test_rate_limiter_shared_per_base_url() -> None:
+    """Test that the same limiter is returned for the same base URL."""
+    limiter = RateLimiter.for_base_url("https://a.com", rate=1, capacity=5)
+
+    assert RateLimiter.for_base_url("https://a.com", rate=1, capacity=5) is limiter
+    assert RateLimiter.for_base_url("https://b.com") is not limiter
+    assert limiter.rate == 1
+    assert limiter.capacity == 5
+
+
+def test_rate_limiter_different_settings_warning(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that the first caller's settings win, with a warning for any others."""
+    limiter = RateLimiter.for_base_url("https://a.com", rate=1, capacity=5)
+
+    assert not caplog.records
+
+    for _ in range(2):
+        assert RateLimiter.for_base_url("https://a.com", rate=2) is limiter
+
+    assert limiter.rate == 1
+    assert limiter.capacity == 5
+
+    assert [record.message for record in caplog.records] == [
+        (
+            "Rate limiter for https://a.com already exists with rate=1 and "
+            "capacity=5; ignoring rate=2 and capacity=1"
+        ),
+    ]
+
+
+@pytest.mark.rate_limited
+def test_client_rate_limiter_from_class_config(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that clients with the same base URL share a limiter, as per their config."""
+
+    class LimitedClient(JsonApiClient[dict[str, Any]]):
+        RATE_LIMIT = 3
+        RATE_LIMIT_BURST = 6
+
+    limiter = LimitedClient(base_url="https://api.example.com").rate_limiter
+
+    assert limiter.rate == 3
+    assert limiter.capacity == 6
+    assert json_api_client.rate_limiter is limiter
+    assert JsonApiClient(base_url="https://other.example.com").rate_limiter.rate is None
+
+    # The first client's config is used, but the mismatch isn't silent
+    assert caplog.records[-1].levelno == WARNING
+    assert caplog.records[-1].message == (
+        "Rate limiter for https://api.example.com already exists with rate=3 and "
+        "capacity=6; ignoring rate=None and capacity=1"
+    )
+
+
+@freeze_time("2024-01-01 00:00:00")
+def test_client_pauses_after_429(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that a 429 with a `Retry-After` header pauses subsequent requests."""
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        [
+            {
+                "status_code": HTTPStatus.TOO_MANY_REQUESTS,
+                "headers": {"Retry-After": "3"},
+            },
+            {"json": {"key": "value"}},
+        ],
+    )
+
+    json_api_client.validate_request_success = False
+
+    with patch("wg_utilities.clients.rate_limiter.sleep") as mock_sleep:
+        json_api_client.get_json_response("/test_endpoint")
+        mock_sleep.assert_not_called()
+
+        assert json_api_client.get_json_response("/test_endpoint") == {"key": "value"}
+
+    mock_sleep.assert_called_once_with(3)
+
+
+@pytest.mark.asyncio
+@freeze_time("2024-01-01 00:00:00")
+async def test_async_client_pauses_after_429(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+) -> None:
+    """Test that the async client shares the limiter and honours `Retry-After`."""
+    retry_at = datetime.now(UTC) + timedelta(seconds=2)
+
+    mock_aiohttp.get(
+        "https://api.example.com/test_endpoint",
+        status=HTTPStatus.TOO_MANY_REQUESTS,
+        headers={"Retry-After": format_datetime(retry_at, usegmt=True)},
+    )
+    mock_aiohttp.get("https://api.example.com/test_endpoint", payload={"key": "value"})
+
+    json_api_client.validate_request_success = False
+
+    with patch("wg_utilities.clients.rate_limiter.async_sleep") as mock_sleep:
+        async with json_api_client.aio as aio:
+            await aio.get_json_response("/test_endpoint")
+            assert await aio.get_json_response("/test_endpoint") == {"key": "value"}
+
+    mock_sleep.assert_awaited_once_with(2)
@@ -0,0 +1,318 @@
+"""Unit Tests for `wg_utilities.clients.response_cache`."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from time import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from freezegun import freeze_time
+from requests import get
+
+from wg_utilities.clients.json_api_client import JsonApiClient
+from wg_utilities.clients.response_cache import CachedResponse, ResponseCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from requests_mock import Mocker
+
+
+def _entry(content: bytes = b"{}", **headers: str) -> CachedResponse:
+    return CachedResponse(
+        url="https://api.example.com/test_endpoint",
+        content=content,
+        headers=headers,
+        fresh_until=0,
+        stored_at=time(),
+    )
+
+
+@pytest.mark.parametrize(
+    ("headers", "cacheable", "fresh"),
+    [
+        ({}, False, False),
+        ({"ETag": '"abc"'}, True, False),
+        ({"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}, True, False),
+        ({"Cache-Control": "max-age=60"}, True, True),
+        ({"Cache-Control": "private, max-age=60", "ETag": '"abc"'}, True, True),
+        ({"Cache-Control": "no-cache, max-age=60", "ETag": '"abc"'}, True, False),
+        ({"Cache-Control": "no-store", "ETag": '"abc"'}, False, False),
+    ],
+)
+def test_cached_response_from_response(
+    mock_requests: Mocker,
+    headers: dict[str, str],
+    cacheable: bool,
+    fresh: bool,
+) -> None:
+    """Test that only cacheable responses are cached, with the correct freshness."""
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        json={"key": "value"},
+        headers=headers,
+    )
+
+    entry = CachedResponse.from_response(get("https://api.example.com/test_endpoint"))
+
+    if not cacheable:
+        assert entry is None
+        return
+
+    assert entry is not None
+    assert entry.is_fresh is fresh
+    assert entry.to_response().json() == {"key": "value"}
+
+
+def test_cached_response_conditional_headers() -> None:
+    """Test that the conditional headers are built from the cached validators."""
+    assert _entry().conditional_headers() == {}
+    assert _entry(etag='"abc"').conditional_headers() == {"If-None-Match": '"abc"'}
+    assert _entry(
+        **{"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT", "ETag": '"abc"'},
+    ).conditional_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+
+
+def test_response_cache_key_is_order_independent() -> None:
+    """Test that the cache key doesn't depend on the order of the params."""
+    assert ResponseCache.key("get", "https://a.com", {"a": 1, "b": "2"}) == (
+        ResponseCache.key("GET", "https://a.com", {"b": "2", "a": 1})
+    )
+    assert ResponseCache.key("GET", "https://a.com") != ResponseCache.key(
+        "GET",
+        "https://a.com",
+        {"a": 1},
+    )
+
+
+def test_response_cache_key_query() -> None:
+    """Test that the params are encoded in the key as they would be in the URL."""
+    assert (
+        ResponseCache.key(
+            "GET",
+            "https://a.com",
+            {"b": [2, "x y"], b"a": b"1", "c": 0.5},
+        )
+        == "GET https://a.com?a=1&b=2&b=x+y&c=0.5"
+    )
+
+
+def test_response_cache_key_headers() -> None:
+    """Test that the key varies on the (hashed) headers, but not their names' case."""
+    key = ResponseCache.key("GET", "https://a.com", headers={"Authorization": "a"})
+
+    assert "Authorization" not in key
+    assert key == ResponseCache.key(
+        "GET",
+        "https://a.com",
+        headers={"authorization": b"a"},
+    )
+    assert key != ResponseCache.key(
+        "GET",
+        "https://a.com",
+        headers={"Authorization": "b"},
+    )
+    assert key != ResponseCache.key("GET", "https://a.com")
+
+
+def test_response_cache_lru_eviction() -> None:
+    """Test that the least recently used entry is evicted first."""
+    cache = ResponseCache(max_entries=2)
+
+    cache.set("a", _entry())
+    cache.set("b", _entry())
+    assert cache.get("a") is not None
+
+    cache.set("c", _entry())
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_response_cache_ttl() -> None:
+    """Test that entries are expired after the TTL."""
+    cache = ResponseCache(ttl=60)
+
+    with freeze_time("2024-01-01 00:00:00"):
+        cache.set("a", _entry())
+
+    with freeze_time("2024-01-01 00:00:59"):
+        assert "a" in cache
+
+    with freeze_time("2024-01-01 00:01:01"):
+        assert "a" not in cache
+
+    assert len(cache) == 0
+
+
+def test_response_cache_disk_tier(temp_dir: Path) -> None:
+    """Test that entries are persisted to and loaded from disk."""
+    cache = ResponseCache(disk_dir=temp_dir / "response_cache")
+    cache.set("a", _entry(b'{"key": "value"}', etag='"abc"'))
+
+    new_cache = ResponseCache(disk_dir=temp_dir / "response_cache")
+
+    assert len(new_cache) == 0
+    assert (entry := new_cache.get("a")) is not None
+    assert entry.content == b'{"key": "value"}'
+    assert entry.headers == {"etag": '"abc"'}
+    assert len(new_cache) == 1
+
+    new_cache.delete("a")
+    assert "a" not in new_cache
+    assert "a" in cache  # still in the first cache's memory tier
+
+    cache.set("b", _entry())
+    cache.clear()
+    assert not list((temp_dir / "response_cache").iterdir())
+
+
+def test_cached_response_to_response() -> None:
+    """Test that cached responses can be read as a stream, and closed."""
+    res = _entry(b'{"key": "value"}', etag='"abc"').to_response()
+
+    assert res.status_code == HTTPStatus.OK
+    assert res.headers["ETag"] == '"abc"'
+    assert b"".join(res.iter_content(4)) == b'{"key": "value"}'
+    assert res.json() == {"key": "value"}
+
+    res.close()
+
+
+def test_response_cache_concurrent_disk_writes(temp_dir: Path) -> None:
+    """Test that concurrent writes of the same entry don't collide on disk."""
+    cache = ResponseCache(disk_dir=temp_dir / "response_cache")
+    entry = _entry(b'{"key": "value"}')
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: cache.set("a", entry), range(32)))
+
+    assert [path.suffix for path in (temp_dir / "response_cache").iterdir()] == [".json"]
+    assert ResponseCache(disk_dir=temp_dir / "response_cache").get("a") == entry
+
+
+def test_response_cache_invalid_disk_file(temp_dir: Path) -> None:
+    """Test that invalid cache files are ignored and removed."""
+    cache = ResponseCache(disk_dir=temp_dir)
+    cache.set("a", _entry())
+
+    (path,) = temp_dir.glob("*.json")
+    path.write_text("not json")
+
+    cache.clear()
+    path.write_text("not json")
+
+    assert cache.get("a") is None
+    assert not path.exists()
+
+
+def test_client_serves_fresh_responses_from_cache(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that fresh responses are served without a request being made."""
+    json_api_client.response_cache = ResponseCache()
+
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        json={"key": "value"},
+        headers={"Cache-Control": "max-age=60"},
+    )
+
+    for _ in range(3):
+        assert json_api_client.get_json_response("/test_endpoint") == {"key": "value"}
+
+    assert mock_requests.call_count == 1
+
+    # Different params aren't served from the cache
+    json_api_client.get_json_response("/test_endpoint", params={"a": "b"})
+    assert mock_requests.call_count == 2
+
+
+def test_shared_cache_varies_on_credentials(mock_requests: Mocker) -> None:
+    """Test that clients sharing a cache aren't served each other's responses."""
+
+    class TokenClient(JsonApiClient[dict[str, Any]]):
+        response_cache = ResponseCache()
+
+        def __init__(self, token: str):
+            super().__init__(base_url="https://api.example.com")
+            self.token = token
+
+        @property
+        def request_headers(self) -> dict[str, str]:
+            return {
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": "application/json",
+            }
+
+    mock_requests.get(
+        "https://api.example.com/me",
+        json=lambda req, _: {"user": req.headers["Authorization"]},
+        headers={"Cache-Control": "max-age=60"},
+    )
+
+    client_a = TokenClient("token_a")
+    client_b = TokenClient("token_b")
+
+    for _ in range(2):
+        assert client_a.get_json_response("/me") == {"user": "Bearer token_a"}
+        assert client_b.get_json_response("/me") == {"user": "Bearer token_b"}
+
+    assert mock_requests.call_count == 2
+    assert len(TokenClient.response_cache) == 2
+
+
+def test_client_revalidates_stale_responses(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that stale responses are revalidated, and 304s served from the cache."""
+    json_api_client.response_cache = ResponseCache()
+
+    mock_requests.get(
+        "https://api.example.com/test_endpoint",
+        [
+            {"json": {"key": "value"}, "headers": {"ETag": '"abc"'}},
+            {"status_code": HTTPStatus.NOT_MODIFIED, "headers": {"ETag": '"abc"'}},
+            {"json": {"key": "new_value"}, "headers": {"ETag": '"def"'}},
+        ],
+    )
+
+    assert json_api_client.get_json_response("/test_endpoint") == {"key": "value"}
+    assert json_api_client.get_json_response("/test_endpoint") == {"key": "value"}
+    assert json_api_client.get_json_response("/test_endpoint") == {"key": "new_value"}
+
+    first, second, third = mock_requests.request_history
+
+    assert "If-None-Match" not in first.headers
+    assert second.headers["If-None-Match"] == '"abc"'
+    assert third.headers["If-None-Match"] == '"abc"'
+    assert third.headers["Content-Type"] == "application/json"
+
+
+def test_client_doesnt_cache_non_get_requests(
+    json_api_client: JsonApiClient[dict[str, Any]],
+    mock_requests: Mocker,
+) -> None:
+    """Test that only GET requests are cached."""
+    json_api_client.response_cache = ResponseCache()
+
+    mock_requests.post(
+        "https://api.example.com/test_endpoint",
+        json={"key": "value"},
+        headers={"Cache-Control": "max-age=60"},
+    )
+
+    json_api_client.post_json_response("/test_endpoint")
+    json_api_client.post_json_response("/test_endpoint")
+
+    assert mock_requests.call_count == 2
+    assert len(json_api_client.response_cache) == 0
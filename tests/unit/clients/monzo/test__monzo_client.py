@@ -48,6 +48,13 @@ def test_instantiation(fake_oauth_credentials: OAuthCredentials) -> None:
     )
 
 
+@pytest.mark.rate_limited
+def test_rate_limiter(monzo_client: MonzoClient) -> None:
+    """Test that the client is rate limited as per its class's config."""
+    assert monzo_client.rate_limiter.rate == MonzoClient.RATE_LIMIT == 5
+    assert monzo_client.rate_limiter.capacity == MonzoClient.RATE_LIMIT_BURST == 10
+
+
 def test_deposit_into_pot_makes_correct_request(
     monzo_client: MonzoClient,
     monzo_pot: Pot,
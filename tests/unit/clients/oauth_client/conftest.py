@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
-from flask import Flask
 from jwt import decode
 
 from wg_utilities.api import TempAuthServer
@@ -50,16 +49,10 @@ def oauth_client_(
     )
 
 
-@pytest.fixture(scope="session", name="flask_app")
-def flask_app_() -> Flask:
-    """Fixture for Flask app."""
-    return Flask(__name__)
-
-
 @pytest.fixture(name="server_thread")
-def server_thread_(flask_app: Flask) -> YieldFixture[TempAuthServer.ServerThread]:
+def server_thread_() -> YieldFixture[TempAuthServer.ServerThread]:
     """Fixture for creating a server thread."""
-    server_thread = TempAuthServer.ServerThread(flask_app)
+    server_thread = TempAuthServer.ServerThread({})
     server_thread.start()
 
     yield server_thread
@@ -0,0 +1,146 @@
+"""Unit Tests for `wg_utilities.clients.credential_store`."""
+
+from __future__ import annotations
+
+from json import dumps
+from os import environ
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from wg_utilities.clients.credential_store import (
+    CachedCredentialStore,
+    CredentialStore,
+    EnvironmentCredentialStore,
+    FileCredentialStore,
+    InMemoryCredentialStore,
+    SQLiteCredentialStore,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from wg_utilities.clients.oauth_client import OAuthCredentials
+
+
+@pytest.fixture(name="credential_store", params=["file", "memory", "sqlite", "env"])
+def credential_store_(request: pytest.FixtureRequest, temp_dir: Path) -> CredentialStore:
+    """Fixture for each of the credential store backends."""
+    if request.param == "file":
+        return FileCredentialStore(temp_dir / "creds" / "credentials.json")
+
+    if request.param == "sqlite":
+        return SQLiteCredentialStore(temp_dir / "creds.db", key="test_client_id")
+
+    if request.param == "env":
+        return EnvironmentCredentialStore("WG_UTILITIES_TEST_OAUTH_CREDENTIALS")
+
+    return InMemoryCredentialStore()
+
+
+@patch.dict(environ, {}, clear=False)
+def test_round_trip(
+    credential_store: CredentialStore,
+    fake_oauth_credentials: OAuthCredentials,
+) -> None:
+    """Test that each store can save, load and delete credentials."""
+    assert credential_store.load() is None
+
+    credential_store.save(fake_oauth_credentials)
+
+    assert credential_store.load() == fake_oauth_credentials
+    assert credential_store.reload() == fake_oauth_credentials
+
+    credential_store.delete()
+
+    assert credential_store.load() is None
+
+    # Deleting non-existent credentials is a no-op
+    credential_store.delete()
+
+
+def test_file_store_writes_json(
+    temp_dir: Path,
+    fake_oauth_credentials: OAuthCredentials,
+) -> None:
+    """Test that the file store writes the credentials as JSON."""
+    credential_store = FileCredentialStore(temp_dir / "credentials.json")
+    credential_store.save(fake_oauth_credentials)
+
+    assert (temp_dir / "credentials.json").read_text() == dumps(
+        fake_oauth_credentials.model_dump(exclude_none=True),
+    )
+
+
+def test_sqlite_store_keys_are_independent(
+    temp_dir: Path,
+    fake_oauth_credentials: OAuthCredentials,
+) -> None:
+    """Test that one SQLite database can hold credentials for multiple keys."""
+    store_one = SQLiteCredentialStore(temp_dir / "creds.db", key="one")
+    store_two = SQLiteCredentialStore(temp_dir / "creds.db", key="two")
+
+    store_one.save(fake_oauth_credentials)
+
+    assert store_one.load() == fake_oauth_credentials
+    assert store_two.load() is None
+
+
+def test_cached_store_only_loads_once(fake_oauth_credentials: OAuthCredentials) -> None:
+    """Test that the cached store only hits the underlying store once."""
+    underlying_store = MagicMock(spec=CredentialStore)
+    underlying_store.load.return_value = fake_oauth_credentials
+
+    credential_store = CachedCredentialStore(underlying_store)
+
+    first = credential_store.load()
+    second = credential_store.load()
+
+    underlying_store.load.assert_called_once_with()
+
+    # Copies are returned, as clients update their credentials in place
+    assert first == second == fake_oauth_credentials
+    assert first is not second
+    assert first is not fake_oauth_credentials
+
+
+def test_cached_store_reload_and_write_through(
+    fake_oauth_credentials: OAuthCredentials,
+) -> None:
+    """Test that the cached store writes through and can be reloaded."""
+    underlying_store = InMemoryCredentialStore()
+    credential_store = CachedCredentialStore(underlying_store)
+
+    assert credential_store.load() is None
+
+    credential_store.save(fake_oauth_credentials)
+    assert underlying_store.load() == fake_oauth_credentials
+
+    # Simulate another process refreshing the credentials
+    refreshed_credentials = fake_oauth_credentials.model_copy()
+    refreshed_credentials.access_token = "refreshed"
+    underlying_store.save(refreshed_credentials)
+
+    assert credential_store.load() == fake_oauth_credentials
+    assert credential_store.reload() == refreshed_credentials
+    assert credential_store.load() == refreshed_credentials
+
+    credential_store.delete()
+    assert underlying_store.load() is None
+    assert credential_store.load() is None
+
+
+def test_lock(temp_dir: Path) -> None:
+    """Test that the shareable stores lock a file, and the others don't need to."""
+    with FileCredentialStore(temp_dir / "credentials.json").lock():
+        assert (temp_dir / "credentials.json.lock").is_file()
+
+    with SQLiteCredentialStore(temp_dir / "creds.db", key="one").lock():
+        assert (temp_dir / "creds.db.lock").is_file()
+
+    with CachedCredentialStore(FileCredentialStore(temp_dir / "other.json")).lock():
+        assert (temp_dir / "other.json.lock").is_file()
+
+    with InMemoryCredentialStore().lock():
+        pass
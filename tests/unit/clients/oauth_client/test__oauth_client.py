@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from asyncio import gather
+from copy import deepcopy
 from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 from json import loads
 from pathlib import Path
+from pickle import dumps as dumps_pickle
+from pickle import loads as loads_pickle
 from re import fullmatch
-from threading import Thread
+from subprocess import run
+from sys import executable
+from threading import Event, Thread
 from time import sleep, time
 from typing import TYPE_CHECKING, Any
 from unittest.mock import ANY, MagicMock, patch
@@ -20,14 +26,18 @@ from requests import get
 from tests.conftest import assert_mock_requests_request_history
 from tests.unit.clients.oauth_client.conftest import get_jwt_expiry
 from wg_utilities.api import TempAuthServer
+from wg_utilities.clients.async_json_api_client import AsyncOAuthClient
+from wg_utilities.clients.credential_store import InMemoryCredentialStore
 from wg_utilities.clients.oauth_client import (
     BaseModelWithConfig,
     OAuthClient,
     OAuthCredentials,
 )
 from wg_utilities.functions import user_data_dir
+from wg_utilities.functions.file_management import atomic_write_bytes, file_lock
 
 if TYPE_CHECKING:
+    from aioresponses import aioresponses
     from requests_mock import Mocker
 
 
@@ -208,6 +218,57 @@ def test_refresh_access_token(
     )
 
 
+def test_refresh_access_token_uses_credentials_refreshed_by_another_process(
+    oauth_client: OAuthClient[dict[str, Any]],
+    fake_oauth_credentials: OAuthCredentials,
+    mock_requests: Mocker,
+) -> None:
+    """Test that a token refreshed by another process is loaded, not refreshed again."""
+    assert oauth_client.credentials.access_token == fake_oauth_credentials.access_token
+
+    # Simulate another process refreshing the token and writing it to the cache
+    refreshed_credentials = fake_oauth_credentials.model_copy()
+    refreshed_credentials.access_token = "refreshed_by_another_process"
+    oauth_client.creds_cache_path.write_text(
+        refreshed_credentials.model_dump_json(exclude_none=True),
+    )
+
+    oauth_client.refresh_access_token()
+
+    assert oauth_client.credentials.access_token == "refreshed_by_another_process"
+    assert not mock_requests.request_history
+
+
+def test_refresh_access_token_writes_atomically(
+    oauth_client: OAuthClient[dict[str, Any]],
+    live_jwt_token_alt: str,
+) -> None:
+    """Test that the refreshed credentials are written atomically, under a lock."""
+    with (
+        patch(
+            "wg_utilities.clients.credential_store.file_lock",
+            wraps=file_lock,
+        ) as mock_file_lock,
+        patch(
+            "wg_utilities.clients.credential_store.atomic_write_bytes",
+            wraps=atomic_write_bytes,
+        ) as mock_atomic_write_bytes,
+    ):
+        oauth_client.refresh_access_token()
+
+    mock_file_lock.assert_called_once_with(
+        oauth_client.creds_cache_path.with_name("test_client_id.json.lock"),
+    )
+    mock_atomic_write_bytes.assert_called_once_with(oauth_client.creds_cache_path, ANY)
+
+    assert (
+        OAuthCredentials.model_validate_json(
+            oauth_client.creds_cache_path.read_text(),
+        ).access_token
+        == live_jwt_token_alt
+    )
+
+
 def test_refresh_access_token_with_no_local_credentials(
     oauth_client: OAuthClient[dict[str, Any]],
 ) -> None:
@@ -349,6 +410,62 @@ def test_access_token_with_expired_token(
     mock_refresh_access_token.assert_called_once()
 
 
+def test_access_token_only_refreshed_once_by_concurrent_threads(
+    oauth_client: OAuthClient[dict[str, Any]],
+    live_jwt_token_alt: str,
+) -> None:
+    """Test that concurrent `access_token` calls only refresh an expired token once."""
+    oauth_client.credentials.expiry_epoch = int(time()) - 1
+
+    tokens: list[str | None] = []
+
+    with patch.object(
+        oauth_client,
+        "refresh_access_token",
+        wraps=oauth_client.refresh_access_token,
+    ) as mock_refresh_access_token:
+        threads = [
+            Thread(target=lambda: tokens.append(oauth_client.access_token))
+            for _ in range(5)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    mock_refresh_access_token.assert_called_once()
+    assert tokens == [live_jwt_token_alt] * 5
+
+
+def test_refresh_lock_is_per_instance(
+    oauth_client: OAuthClient[dict[str, Any]],
+) -> None:
+    """Test that each client (and each copy of a client) has its own refresh lock."""
+    other_client = deepcopy(oauth_client)
+    unpickled_client = loads_pickle(dumps_pickle(oauth_client))  # noqa: S301
+
+    assert isinstance(other_client._refresh_lock, type(oauth_client._refresh_lock))
+    assert other_client._refresh_lock is not oauth_client._refresh_lock
+    assert unpickled_client._refresh_lock is not oauth_client._refresh_lock
+    assert unpickled_client.access_token == oauth_client.access_token
+
+    acquired: list[bool] = []
+
+    # Holding one client's lock doesn't block another client's refresh
+    with oauth_client._refresh_lock:
+        thread = Thread(
+            target=lambda: acquired.append(
+                other_client._refresh_lock.acquire(timeout=1),
+            ),
+        )
+        thread.start()
+        thread.join()
+
+    assert acquired == [True]
+
+
 def test_access_token_has_expired(oauth_client: OAuthClient[dict[str, Any]]) -> None:
     """Test the `access_token_has_expired` property returns the expected value."""
     assert oauth_client.access_token_has_expired is False
@@ -567,6 +684,49 @@ def test_request_headers(
     }
 
 
+def test_request_headers_reused_until_token_changes(
+    oauth_client: OAuthClient[dict[str, Any]],
+    live_jwt_token_alt: str,
+) -> None:
+    """Test that the `request_headers` dict is only rebuilt when the token changes."""
+    request_headers = oauth_client.request_headers
+    assert oauth_client.request_headers is request_headers
+
+    oauth_client.credentials.expiry_epoch = int(time()) - 1
+
+    assert oauth_client.request_headers is not request_headers
+    assert oauth_client.request_headers == {
+        "Authorization": f"Bearer {live_jwt_token_alt}",
+        "Content-Type": "application/json",
+    }
+
+
+def test_credential_store(
+    fake_oauth_credentials: OAuthCredentials,
+    live_jwt_token_alt: str,
+) -> None:
+    """Test that a custom `credential_store` is used instead of the local cache file."""
+    credential_store = InMemoryCredentialStore(fake_oauth_credentials.model_copy())
+
+    with patch.object(OAuthClient, "credential_store", credential_store):
+        client = OAuthClient[dict[str, Any]](
+            base_url="https://api.example.com",
+            access_token_endpoint="https://api.example.com/oauth2/token",
+            auth_link_base="https://api.example.com/oauth2/authorize",
+        )
+
+        assert client.credentials == fake_oauth_credentials
+
+        client.refresh_access_token()
+
+        stored_credentials = credential_store.load()
+        assert stored_credentials is not None
+        assert stored_credentials.access_token == live_jwt_token_alt
+
+        client.delete_creds_file()
+        assert credential_store.load() is None
+
+
 def test_refresh_token(
     oauth_client: OAuthClient[dict[str, Any]],
     fake_oauth_credentials: OAuthCredentials,
@@ -588,9 +748,7 @@ def test_temp_auth_server_property(oauth_client: OAuthClient[dict[str, Any]]) ->
 
     oauth_client.temp_auth_server.stop_server()
 
-    with patch(
-        "wg_utilities.clients.oauth_client.TempAuthServer",
-    ) as mock_temp_auth_server:
+    with patch("wg_utilities.api.TempAuthServer") as mock_temp_auth_server:
         assert oauth_client.temp_auth_server == oauth_tas
         mock_temp_auth_server.assert_not_called()
 
@@ -756,3 +914,141 @@ def test_creds_rel_file_path_no_client_id(
     del oauth_client._credentials
 
     assert oauth_client._creds_rel_file_path is None
+
+
+def test_aio_property(oauth_client: OAuthClient[dict[str, Any]]) -> None:
+    """Test that the `aio` property returns an `AsyncOAuthClient`."""
+    assert isinstance(oauth_client.aio, AsyncOAuthClient)
+    assert oauth_client.aio.client is oauth_client
+
+
+@pytest.mark.asyncio
+async def test_aio_refreshes_expired_token_once(
+    oauth_client: OAuthClient[dict[str, Any]],
+    mock_aiohttp: aioresponses,
+    live_jwt_token_alt: str,
+) -> None:
+    """Test that concurrent async requests only refresh an expired token once."""
+    oauth_client.credentials.expiry_epoch = int(time()) - 1
+
+    mock_aiohttp.get("https://api.example.com/test_endpoint", payload={}, repeat=True)
+
+    with patch.object(
+        oauth_client,
+        "refresh_access_token",
+        wraps=oauth_client.refresh_access_token,
+    ) as mock_refresh_access_token:
+        async with oauth_client.aio as aio:
+            await gather(*[aio.get_json_response("/test_endpoint") for _ in range(5)])
+
+    mock_refresh_access_token.assert_called_once()
+
+    (requests,) = mock_aiohttp.requests.values()
+    assert len(requests) == 5
+
+    for request in requests:
+        assert (
+            request.kwargs["headers"]["Authorization"] == f"Bearer {live_jwt_token_alt}"
+        )
+
+
+def test_background_refresh(
+    oauth_client: OAuthClient[dict[str, Any]],
+    live_jwt_token_alt: str,
+) -> None:
+    """Test that the background refresh renews the token before it expires."""
+    # Not expired yet, but within the background refresh margin
+    oauth_client.credentials.expiry_epoch = (
+        time()
+        + oauth_client.ACCESS_TOKEN_EXPIRY_THRESHOLD
+        + oauth_client.BACKGROUND_REFRESH_MARGIN
+        - 1
+    )
+    assert oauth_client.access_token_has_expired is False
+
+    refreshed = Event()
+
+    def _refresh_access_token() -> None:
+        OAuthClient.refresh_access_token(oauth_client)
+        refreshed.set()
+
+    with patch.object(
+        oauth_client,
+        "refresh_access_token",
+        side_effect=_refresh_access_token,
+    ) as mock_refresh_access_token:
+        oauth_client.start_background_refresh()
+        thread = oauth_client._background_refresh_thread
+
+        # Starting it again is a no-op
+        oauth_client.start_background_refresh()
+        assert oauth_client._background_refresh_thread is thread
+
+        assert refreshed.wait(5)
+        assert oauth_client.background_refresh_running is True
+
+        # The new token isn't due for a refresh, so the request path doesn't block
+        assert oauth_client.access_token == live_jwt_token_alt
+
+        oauth_client.stop_background_refresh(timeout=5)
+
+    mock_refresh_access_token.assert_called_once()
+    assert not thread.is_alive()
+    assert oauth_client.background_refresh_running is False
+
+    # Stopping it again is a no-op
+    oauth_client.stop_background_refresh()
+
+
+def test_background_refresh_retries_failures(
+    oauth_client: OAuthClient[dict[str, Any]],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that a failed background refresh is logged and retried."""
+    oauth_client.credentials.expiry_epoch = int(time()) - 1
+    oauth_client.BACKGROUND_REFRESH_RETRY_DELAY = 0.01  # type: ignore[misc]
+
+    refreshed = Event()
+
+    def _refresh_access_token() -> None:
+        if mock_refresh_access_token.call_count == 1:
+            raise ValueError("Oh no!")
+
+        OAuthClient.refresh_access_token(oauth_client)
+        refreshed.set()
+
+    with patch.object(
+        oauth_client,
+        "refresh_access_token",
+        side_effect=_refresh_access_token,
+    ) as mock_refresh_access_token:
+        oauth_client.start_background_refresh()
+
+        assert refreshed.wait(5)
+
+        oauth_client.stop_background_refresh(timeout=5)
+
+    assert mock_refresh_access_token.call_count == 2
+    assert (
+        "Background access token refresh failed, retrying in 0.01 seconds" in caplog.text
+    )
+    assert oauth_client.access_token_has_expired is False
+
+
+def test_temp_auth_server_imported_lazily() -> None:
+    """Test that importing `OAuthClient` doesn't import the temporary auth server."""
+    result = run(
+        [
+            executable,
+            "-c",
+            (
+                "import sys, wg_utilities.clients.oauth_client; "
+                "print('wg_utilities.api.temp_auth_server' in sys.modules)"
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "False"
@@ -5,29 +5,30 @@ from __future__ import annotations
 from http import HTTPStatus
 from threading import Thread
 from time import sleep
-from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 from requests import get
-from werkzeug.serving import BaseWSGIServer, make_server
 
 from wg_utilities.api import TempAuthServer
+from wg_utilities.api.temp_auth_server import AuthCallbackServer, make_server
 
-if TYPE_CHECKING:
-    from flask import Flask
 
-
-def test_server_thread_instantiation(flask_app: Flask) -> None:
+def test_server_thread_instantiation() -> None:
     """Test `ServerThread` instantiation."""
-    st = TempAuthServer.ServerThread(flask_app)
+    request_args: dict[str, dict[str, str]] = {}
+    st = TempAuthServer.ServerThread(request_args)
 
     assert isinstance(st, TempAuthServer.ServerThread)
+    assert isinstance(st.server, AuthCallbackServer)
 
     assert st.server.host == "localhost"
     assert isinstance(st.server.port, int)
     assert st.server.port > 0
-    assert st.ctx.app == flask_app
+    assert st.server.request_args is request_args
+    assert st.daemon is True
+
+    st.server.server_close()
 
 
 def test_server_thread_run_serves_forever(
@@ -54,12 +55,11 @@ def test_temp_auth_server_instantiation() -> None:
 
     assert isinstance(tas, TempAuthServer)
 
+    assert tas.name == __name__
     assert tas.host == "localhost"
     assert tas._user_port == 1234
     assert tas.debug is False
-
-    assert tas.app.name == __name__
-    assert tas.app.debug is False
+    assert not tas.is_running
 
 
 def test_temp_auth_server_auto_run() -> None:
@@ -72,14 +72,29 @@ def test_temp_auth_server_auto_run() -> None:
     tas.stop_server()
 
 
-def test_create_endpoints(temp_auth_server: TempAuthServer) -> None:
-    """Test that the `create_endpoints` method adds two endpoints."""
-    rules = list(temp_auth_server.app.url_map.iter_rules())
+def test_unknown_endpoint_not_found(temp_auth_server: TempAuthServer) -> None:
+    """Test that requests to unknown endpoints get a 404 and aren't recorded."""
+    temp_auth_server.start_server()
+
+    res = get(
+        f"http://localhost:{temp_auth_server.port}/unknown?code=abc",
+        timeout=2.5,
+    )
+
+    assert res.status_code == HTTPStatus.NOT_FOUND
+    assert temp_auth_server._request_args == {}
+
+
+def test_repeated_args_use_first_value(temp_auth_server: TempAuthServer) -> None:
+    """Test that only the first value of a repeated query arg is recorded."""
+    temp_auth_server.start_server()
+
+    get(temp_auth_server.get_auth_code_url + "?code=one&code=two&state=", timeout=2.5)
 
-    assert [rule.rule for rule in rules] == [
-        "/static/<path:filename>",
-        "/get_auth_code",
-    ]
+    assert temp_auth_server.wait_for_request("/get_auth_code", max_wait=5) == {
+        "code": "one",
+        "state": "",
+    }
 
 
 def test_start_server_starts_thread(temp_auth_server: TempAuthServer) -> None:
@@ -250,11 +265,17 @@ def test_port_allocation(temp_auth_server: TempAuthServer) -> None:
     """Test that the `start_server` method allocates a port."""
     assert not temp_auth_server.is_running
 
-    def make_server_side_effect(host: str, port: int, app: Flask) -> BaseWSGIServer:
+    def make_server_side_effect(
+        host: str,
+        port: int,
+        request_args: dict[str, dict[str, str]],
+        *,
+        debug: bool = False,
+    ) -> AuthCallbackServer:
         if port < 5015:
             raise OSError("Address already in use")
 
-        return make_server(host, port, app)  # type: ignore[no-any-return]
+        return make_server(host, port, request_args, debug=debug)
 
     with patch(
         "wg_utilities.api.temp_auth_server.make_server",
@@ -292,11 +313,17 @@ def test_hard_port_allocation(temp_auth_server: TempAuthServer) -> None:
 
     temp_auth_server.port = 5015
 
-    def make_server_side_effect(host: str, port: int, app: Flask) -> BaseWSGIServer:
+    def make_server_side_effect(
+        host: str,
+        port: int,
+        request_args: dict[str, dict[str, str]],
+        *,
+        debug: bool = False,
+    ) -> AuthCallbackServer:
         if port == 5015:
             raise OSError("Address already in use")
 
-        return make_server(host, port, app)  # type: ignore[no-any-return]
+        return make_server(host, port, request_args, debug=debug)
 
     with (
         patch(
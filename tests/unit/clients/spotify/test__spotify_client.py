@@ -18,6 +18,7 @@ from tests.conftest import (
 )
 from tests.unit.clients.spotify.conftest import snapshot_id_request
 from wg_utilities.clients import SpotifyClient
+from wg_utilities.clients.cassette import Cassette
 from wg_utilities.clients.spotify import (
     Album,
     Artist,
@@ -47,6 +48,13 @@ def test_instantiation(fake_oauth_credentials: OAuthCredentials) -> None:
     assert client.log_requests is True
 
 
+@pytest.mark.rate_limited
+def test_rate_limiter(spotify_client: SpotifyClient) -> None:
+    """Test that the client is rate limited as per its class's config."""
+    assert spotify_client.rate_limiter.rate == SpotifyClient.RATE_LIMIT == 10
+    assert spotify_client.rate_limiter.capacity == SpotifyClient.RATE_LIMIT_BURST == 20
+
+
 @pytest.mark.parametrize(
     "file_path",
     [
@@ -325,11 +333,13 @@ def test_get_items_from_url_limit_func(
     """Test that a limit function can be passed to `get_items_from_url`."""
     items = spotify_client.get_items(
         url=f"{SpotifyClient.BASE_URL}/playlists/2lmx8fu0seq7ea5kcmlnpx/tracks",
-        limit_func=lambda item: datetime.strptime(
-            item["added_at"],  # type: ignore[typeddict-item]
-            spotify_client.DATETIME_FORMAT,
-        )
-        >= datetime(2020, 1, 1),
+        limit_func=lambda item: (
+            datetime.strptime(
+                item["added_at"],  # type: ignore[typeddict-item]
+                spotify_client.DATETIME_FORMAT,
+            )
+            >= datetime(2020, 1, 1)
+        ),
     )
 
     tracks = [
@@ -415,17 +425,78 @@ def test_get_items_from_url_limit_func(
             spotify_client.get_items(
                 f"{SpotifyClient.BASE_URL}/playlists/2lmx8fu0seq7ea5kcmlnpx/tracks",
                 hard_limit=75,
-                limit_func=lambda item: datetime.strptime(
-                    item["added_at"],  # type: ignore[typeddict-item]
-                    spotify_client.DATETIME_FORMAT,
-                )
-                >= datetime(2020, 1, 1),
+                limit_func=lambda item: (
+                    datetime.strptime(
+                        item["added_at"],  # type: ignore[typeddict-item]
+                        spotify_client.DATETIME_FORMAT,
+                    )
+                    >= datetime(2020, 1, 1)
+                ),
             ),
         )
         == 75
     )
 
 
+def test_get_items_from_url_parallel(
+    spotify_client: SpotifyClient,
+    mock_requests: Mocker,
+) -> None:
+    """Test that `get_items` can request the remaining pages concurrently, in order."""
+    url = f"{SpotifyClient.BASE_URL}/playlists/2lmx8fu0seq7ea5kcmlnpx/tracks"
+
+    sequential_items = spotify_client.get_items(url)
+    mock_requests.reset_mock()
+
+    parallel_items = spotify_client.get_items(url, parallel=True, max_concurrency=4)
+
+    assert parallel_items == sequential_items
+    assert len(parallel_items) == 518
+
+    # The first page has to be received before the others can be requested
+    assert mock_requests.request_history[0].query == "limit=50"
+    assert sorted(req.query for req in mock_requests.request_history[1:]) == sorted(
+        f"offset={(i + 1) * 50}&limit=50" for i in range(10)
+    )
+
+
+def test_get_items_from_url_parallel_hard_limit(
+    spotify_client: SpotifyClient,
+    mock_requests: Mocker,
+) -> None:
+    """Test that parallel mode doesn't request more items than the `hard_limit`."""
+    spotify_client.parallel_page_fetching = True
+
+    items = spotify_client.get_items(
+        f"{SpotifyClient.BASE_URL}/playlists/2lmx8fu0seq7ea5kcmlnpx/tracks",
+        hard_limit=75,
+    )
+
+    assert len(items) == 75
+    assert [req.query for req in mock_requests.request_history] == [
+        "limit=50",
+        "offset=50&limit=25",
+    ]
+
+
+def test_get_items_from_url_parallel_error(
+    spotify_client: SpotifyClient,
+    mock_requests: Mocker,
+) -> None:
+    """Test that an error from any page in parallel mode is raised."""
+    mock_requests.get(
+        f"{SpotifyClient.BASE_URL}/playlists/2lmx8fu0seq7ea5kcmlnpx/tracks?offset=250&limit=50",
+        status_code=HTTPStatus.NOT_FOUND,
+        reason=HTTPStatus.NOT_FOUND.phrase,
+    )
+
+    with pytest.raises(HTTPError, match="404 Client Error: Not Found"):
+        spotify_client.get_items(
+            f"{SpotifyClient.BASE_URL}/playlists/2lmx8fu0seq7ea5kcmlnpx/tracks",
+            parallel=True,
+        )
+
+
 def test_get_items_from_url_different_list_key(spotify_client: SpotifyClient) -> None:
     """Test items under a different key are correctly extracted."""
     items = spotify_client.get_items("/me/player/devices")
@@ -1048,3 +1119,35 @@ def test_remove_tracks_from_playlist(
     )
 
     assert all(track not in playlist_to_remove_from.tracks for track in tracks_to_remove)
+
+
+def test_record_and_replay_with_cassette(
+    spotify_client: SpotifyClient,
+    mock_requests: Mocker,
+    live_jwt_token: str,
+    temp_dir: Path,
+) -> None:
+    """Test that pagination and token refreshes can be recorded and replayed offline."""
+    mock_requests.post(
+        SpotifyClient.ACCESS_TOKEN_ENDPOINT,
+        json={"access_token": live_jwt_token, "expires_in": 3600},
+    )
+    url = f"{SpotifyClient.BASE_URL}/playlists/2lmx8fu0seq7ea5kcmlnpx/tracks"
+
+    spotify_client.credentials.expiry_epoch = 0
+
+    with Cassette(temp_dir / "cassette.json", mode="record") as cassette:
+        spotify_client.cassette = cassette
+        items = spotify_client.get_items(url)
+
+    # One token refresh, then 11 pages
+    assert len(mock_requests.request_history) == 12
+    assert mock_requests.request_history[0].url == SpotifyClient.ACCESS_TOKEN_ENDPOINT
+
+    spotify_client.credentials.expiry_epoch = 0
+    spotify_client.cassette = Cassette(temp_dir / "cassette.json")
+
+    assert spotify_client.get_items(url) == items
+    assert len(items) == 518
+    assert len(mock_requests.request_history) == 12
+    assert spotify_client.access_token == "REDACTED"
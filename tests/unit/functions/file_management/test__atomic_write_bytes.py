@@ -0,0 +1,42 @@
+"""Unit Tests for `wg_utilities.functions.file_management.atomic_write_bytes`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from wg_utilities.functions.file_management import atomic_write_bytes
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_file_written(temp_dir: Path) -> None:
+    """Test that the file is written, replacing any existing content."""
+    (target_path := temp_dir / "files" / "file.json").parent.mkdir()
+    target_path.write_bytes(b"old content")
+
+    atomic_write_bytes(target_path, b"new content")
+
+    assert target_path.read_bytes() == b"new content"
+    assert list(target_path.parent.iterdir()) == [target_path]
+
+
+def test_failed_write_leaves_original_file(temp_dir: Path) -> None:
+    """Test that a failed write doesn't affect the original file or leave a temp file."""
+    (target_path := temp_dir / "files" / "file.json").parent.mkdir()
+    target_path.write_bytes(b"old content")
+
+    with (
+        patch(
+            "wg_utilities.functions.file_management.fsync",
+            side_effect=OSError("Disk full"),
+        ),
+        pytest.raises(OSError, match=r"^Disk full$"),
+    ):
+        atomic_write_bytes(target_path, b"new content")
+
+    assert target_path.read_bytes() == b"old content"
+    assert list(target_path.parent.iterdir()) == [target_path]
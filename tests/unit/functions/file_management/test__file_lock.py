@@ -0,0 +1,50 @@
+"""Unit Tests for `wg_utilities.functions.file_management.file_lock`."""
+
+from __future__ import annotations
+
+from multiprocessing import get_context
+from time import sleep, time
+from typing import TYPE_CHECKING
+
+from wg_utilities.functions.file_management import file_lock
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _hold_lock(lock_path: Path, duration: float) -> None:
+    """Hold the lock for the given duration, in a separate process."""
+    with file_lock(lock_path):
+        (lock_path.parent / "locked").touch()
+        sleep(duration)
+
+
+def test_lock_file_created(temp_dir: Path) -> None:
+    """Test that the lock file (and its parent directories) are created."""
+    lock_path = temp_dir / "one" / "two" / "file.lock"
+
+    with file_lock(lock_path):
+        assert lock_path.is_file()
+
+    assert lock_path.is_file()
+
+
+def test_lock_excludes_other_processes(temp_dir: Path) -> None:
+    """Test that the lock blocks until another process has released it."""
+    lock_path = temp_dir / "file.lock"
+
+    process = get_context("spawn").Process(target=_hold_lock, args=(lock_path, 1))
+    process.start()
+
+    start_time = time()
+    while not (temp_dir / "locked").exists():
+        assert time() - start_time < 30
+        sleep(0.01)
+
+    locked_time = time()
+
+    with file_lock(lock_path):
+        assert time() - locked_time > 0.5
+
+    process.join()
+    assert process.exitcode == 0
@@ -0,0 +1,106 @@
+"""Unit Tests for the `wg_utilities.functions.json.iter_json_array` function."""
+
+from __future__ import annotations
+
+from json import JSONDecodeError, dumps
+from typing import Any
+
+import pytest
+
+from wg_utilities.functions import iter_json_array
+
+DOCUMENT = {
+    "kind": "drive#fileList",
+    "nextPageToken": "abc",
+    "files": [
+        {"id": "1", "name": 'a é "quoted" [name]', "size": 1234567890},
+        {"id": "2", "parents": ["x", "y"], "trashed": False, "sha": None},
+        12345.678,
+        "string, with, commas",
+        [],
+        {},
+    ],
+    "incompleteSearch": False,
+}
+
+
+def _chunked(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 100000])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_items_are_yielded_regardless_of_chunking(
+    chunk_size: int,
+    indent: int | None,
+) -> None:
+    """Test that items are parsed correctly, however the document is chunked."""
+    text = dumps(DOCUMENT, indent=indent, ensure_ascii=False)
+
+    metadata: dict[str, Any] = {}
+
+    assert (
+        list(iter_json_array(_chunked(text, chunk_size), "files", metadata=metadata))
+        == DOCUMENT["files"]
+    )
+
+    assert metadata == {
+        "kind": "drive#fileList",
+        "nextPageToken": "abc",
+        "incompleteSearch": False,
+    }
+
+
+def test_items_are_yielded_lazily() -> None:
+    """Test that items are yielded before the rest of the document is read."""
+    consumed = []
+
+    def _chunks() -> Any:
+        for chunk in ('{"items": [', '{"a": 1}', ", ", '{"b": 2}', "]}"):
+            consumed.append(chunk)
+            yield chunk
+
+    items = iter_json_array(_chunks(), "items")
+
+    assert next(items) == {"a": 1}
+    assert consumed == ['{"items": [', '{"a": 1}', ", "]
+
+
+@pytest.mark.parametrize(
+    ("text", "key", "expected"),
+    [
+        ("[1, 2, 3]", None, [1, 2, 3]),
+        (" [ ] ", None, []),
+        ('{"items": []}', "items", []),
+        ('{"items": [1,2]}', "items", [1, 2]),
+    ],
+)
+def test_top_level_arrays_and_empty_arrays(
+    text: str,
+    key: str | None,
+    expected: list[Any],
+) -> None:
+    """Test top-level arrays and empty arrays."""
+    assert list(iter_json_array(_chunked(text, 2), key)) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "key", "exception"),
+    [
+        ("{}", "items", ValueError),
+        ('{"other": [1]}', "items", ValueError),
+        ('{"items": {"a": 1}}', "items", ValueError),
+        ('["a" "b"]', None, ValueError),
+        ("[1, 2", None, ValueError),
+        ('[{"a": }]', None, JSONDecodeError),
+        ("", None, ValueError),
+    ],
+)
+def test_invalid_documents(
+    text: str,
+    key: str | None,
+    exception: type[Exception],
+) -> None:
+    """Test that invalid documents raise an error."""
+    with pytest.raises(exception):
+        list(iter_json_array(_chunked(text, 3), key))
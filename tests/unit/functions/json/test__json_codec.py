@@ -0,0 +1,95 @@
+"""Unit Tests for the `wg_utilities.functions.json` codec functions."""
+
+from __future__ import annotations
+
+from datetime import date
+from importlib.util import find_spec
+from json import JSONDecodeError
+from json import loads as stdlib_loads
+from typing import TYPE_CHECKING
+
+import pytest
+
+from wg_utilities.functions import (
+    get_json_codec,
+    json_dumps,
+    json_dumps_bytes,
+    json_loads,
+    set_json_codec,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+CODECS = [
+    "stdlib",
+    *(name for name in ("orjson", "msgspec") if find_spec(name) is not None),
+]
+
+
+@pytest.fixture(name="codec", params=CODECS)
+def codec_(request: pytest.FixtureRequest) -> Iterator[str]:
+    """Use each installed codec, resetting to the default afterwards."""
+    set_json_codec(request.param)
+    yield request.param
+    set_json_codec()
+
+
+def test_default_codec() -> None:
+    """Test that the fastest installed codec is used by default."""
+    assert set_json_codec().name == next(
+        name for name in ("orjson", "msgspec", "stdlib") if name in CODECS
+    )
+
+
+def test_round_trip(codec: str) -> None:
+    """Test each codec's output, and that it can be decoded again."""
+    obj = {"a": [1, 2.5, None, True], "b": {"c": "é ✓"}}
+
+    assert get_json_codec().name == codec
+    assert json_dumps(obj) == (
+        # The stdlib codec keeps `json.dumps`'s default formatting
+        '{"a": [1, 2.5, null, true], "b": {"c": "\\u00e9 \\u2713"}}'
+        if codec == "stdlib"
+        else '{"a":[1,2.5,null,true],"b":{"c":"é ✓"}}'
+    )
+    assert json_dumps_bytes(obj) == json_dumps(obj).encode()
+    assert json_loads(json_dumps(obj)) == obj
+    assert json_loads(json_dumps_bytes(obj)) == obj
+
+
+def test_default_function(codec: str) -> None:  # noqa: ARG001
+    """Test that the `default` function is used for unsupported types."""
+    assert json_loads(json_dumps({"date": date(2024, 1, 2)}, default=str)) == {
+        "date": "2024-01-02",
+    }
+
+
+def test_fallback_to_stdlib(codec: str) -> None:  # noqa: ARG001
+    """Test that objects the codec can't handle are serialized by the stdlib."""
+    assert stdlib_loads(json_dumps({"big": 2**70})) == {"big": 2**70}
+
+    with pytest.raises(TypeError):
+        json_dumps({"obj": object()})
+
+
+def test_invalid_document(codec: str) -> None:  # noqa: ARG001
+    """Test that invalid documents raise a `JSONDecodeError` for every codec."""
+    with pytest.raises(JSONDecodeError):
+        json_loads(b"")
+
+    with pytest.raises(JSONDecodeError):
+        json_loads('{"a": ')
+
+
+def test_codec_not_installed() -> None:
+    """Test that requesting a codec which isn't installed raises an ImportError."""
+    if "msgspec" in CODECS:
+        pytest.skip("msgspec is installed")
+
+    codec = get_json_codec()
+
+    with pytest.raises(ImportError):
+        set_json_codec("msgspec")
+
+    assert get_json_codec() is codec
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+from gzip import decompress
 from hashlib import md5
 from http import HTTPStatus
-from json import dumps
+from json import dumps, loads
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING, Handler, Logger, LogRecord
 from socket import gethostname
 from typing import TYPE_CHECKING
 from unittest.mock import ANY, patch
 
 import pytest
+from requests import Session
 
 from tests.conftest import TestError, assert_mock_requests_request_history
 from tests.unit.loggers.conftest import (
@@ -231,7 +233,7 @@ def test_emit(level: int, message: str, logger: Logger, record: LogRecord) -> No
 @pytest.mark.add_handler("warehouse_handler")
 def test_post_with_backoff_duplicate_record(logger: Logger) -> None:
     """Test that the post_with_backoff method doesn't throw an error for duplicate records."""
-    with patch("wg_utilities.loggers.item_warehouse.warehouse_handler.post") as mock_post:
+    with patch.object(Session, "post") as mock_post:
         mock_post.return_value.status_code = HTTPStatus.CONFLICT
 
         logger.info("Info log")
@@ -256,7 +258,7 @@ def test_post_with_backoff_duplicate_record(logger: Logger) -> None:
 @pytest.mark.add_handler("warehouse_handler")
 def test_post_with_backoff(logger: Logger, response_status: HTTPStatus) -> None:
     """Test that the post_with_backoff works (ignoring actual backoff functionality)."""
-    with patch("wg_utilities.loggers.item_warehouse.warehouse_handler.post") as mock_post:
+    with patch.object(Session, "post") as mock_post:
         mock_post.return_value.status_code = response_status
 
         logger.debug("Debug log")
@@ -269,7 +271,7 @@ def test_post_with_backoff(logger: Logger, response_status: HTTPStatus) -> None:
     assert mock_post.call_count == 6
 
     assert all(
-        mock_post.call_args_list[i][1]["json"]["level"] == level
+        loads(mock_post.call_args_list[i].kwargs["data"])["level"] == level
         for i, level in enumerate([DEBUG, INFO, WARNING, ERROR, CRITICAL, ERROR])
     )
 
@@ -307,9 +309,7 @@ def test_post_with_backoff_permanent_failure(
 ) -> None:
     """Test that 4XX status codes aren't backed off."""
     with (
-        patch(
-            "wg_utilities.loggers.item_warehouse.warehouse_handler.post",
-        ) as mock_post,
+        patch.object(Session, "post") as mock_post,
         caplog.at_level("ERROR"),
     ):
         mock_post.return_value.status_code = response_status
@@ -326,3 +326,36 @@ def test_post_with_backoff_permanent_failure(
         f"Permanent error posting log to warehouse ({response_status} {response_status.phrase}): !!!"
         == caplog.records[-1].message
     )
+
+
+@pytest.mark.add_handler("warehouse_handler")
+def test_post_with_backoff_compression(
+    logger: Logger,
+    warehouse_handler: WarehouseHandler,
+) -> None:
+    """Test that large payloads are gzipped, falling back to uncompressed on a 415."""
+    warehouse_handler.REQUEST_COMPRESSION_MIN_SIZE = 1  # type: ignore[misc]
+
+    with patch.object(Session, "post") as mock_post:
+        mock_post.return_value.status_code = HTTPStatus.OK
+
+        logger.info("Info log")
+
+        mock_post.return_value.status_code = HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+
+        logger.info("Another info log")
+        logger.info("Yet another info log")
+
+    assert [
+        call.kwargs["headers"].get("Content-Encoding")
+        for call in mock_post.call_args_list
+    ] == ["gzip", "gzip", None, None]
+
+    first_call, second_call, third_call, fourth_call = mock_post.call_args_list
+
+    assert loads(decompress(first_call.kwargs["data"]))["message"] == "Info log"
+    assert loads(decompress(second_call.kwargs["data"])) == loads(
+        third_call.kwargs["data"],
+    )
+    assert loads(fourth_call.kwargs["data"])["message"] == "Yet another info log"
+    assert warehouse_handler._request_compression_rejected
@@ -2,22 +2,144 @@
 
 from __future__ import annotations
 
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import DEBUG, getLogger
+from socketserver import TCPServer
 from textwrap import dedent
 from threading import Thread
 from time import sleep, time
-from typing import Any, cast
+from typing import Any, ClassVar
+from urllib.parse import parse_qsl, urlsplit
 
-from flask import Flask, Response, request
-from werkzeug.serving import make_server
+LOGGER = getLogger(__name__)
+LOGGER.setLevel(DEBUG)
+
+
+class AuthCallbackServer(ThreadingHTTPServer):
+    """Minimal HTTP server which records the query args of requests to its endpoints.
+
+    Args:
+        host (str): the hostname to listen on
+        port (int): the port to listen on
+        request_args (dict): where to record the args of each request, keyed by path
+        debug (bool): log each request which is received
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        request_args: dict[str, dict[str, str]],
+        *,
+        debug: bool = False,
+    ):
+        self.host = host
+        self.request_args = request_args
+        self.debug = debug
+
+        super().__init__((host, port), AuthCallbackRequestHandler)
+
+        self.port: int = self.server_address[1]
+
+    def server_bind(self) -> None:
+        """Bind the socket, skipping `HTTPServer`'s (potentially slow) FQDN lookup."""
+        TCPServer.server_bind(self)
+
+        self.server_name = self.host
+        self.server_port = self.server_address[1]
+
+
+class AuthCallbackRequestHandler(BaseHTTPRequestHandler):
+    """Handle the OAuth provider's redirect back to the `TempAuthServer`."""
+
+    ENDPOINTS: ClassVar[frozenset[str]] = frozenset({"/get_auth_code"})
+
+    RESPONSE_BODY: ClassVar[bytes] = (
+        dedent(
+            """
+            <html lang="en">
+            <head>
+                <style>
+                    body {
+                        font-family: Verdana, sans-serif;
+                        height: 100vh;
+                    }
+                </style>
+                <title>Authentication Complete</title>
+            </head>
+            <body onclick="self.close()">
+                <h1>Authentication complete!</h1>
+                <span>Click anywhere to close this window.</span>
+            </body>
+            </html>
+            """,
+        )
+        .strip()
+        .encode()
+    )
+
+    server: AuthCallbackServer
+
+    def do_GET(self) -> None:
+        """Record the args of a request to a known endpoint."""
+        url = urlsplit(self.path)
+
+        if url.path not in self.ENDPOINTS:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        # TODO: add 400 response for mismatch in state token
+        # Only the first value of any repeated arg is kept
+        request_args: dict[str, str] = {}
+        for key, value in parse_qsl(url.query, keep_blank_values=True):
+            request_args.setdefault(key, value)
+
+        self.server.request_args[url.path] = request_args
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(self.RESPONSE_BODY)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Log requests to the module's logger (in debug mode) instead of stderr."""
+        if self.server.debug:
+            LOGGER.debug(format, *args)
+
+
+def make_server(
+    host: str,
+    port: int,
+    request_args: dict[str, dict[str, str]],
+    *,
+    debug: bool = False,
+) -> AuthCallbackServer:
+    """Create an `AuthCallbackServer`, bound to the given host and port.
+
+    Args:
+        host (str): the hostname to listen on
+        port (int): the port to listen on
+        request_args (dict): where to record the args of each request, keyed by path
+        debug (bool): log each request which is received
+
+    Returns:
+        AuthCallbackServer: the server, ready to be served
+    """
+    return AuthCallbackServer(host, port, request_args, debug=debug)
 
 
 class TempAuthServer:
-    """Temporary Flask server for auth flows.
+    """Temporary HTTP server for auth flows.
 
-    This allows the auth code to be retrieved without manual intervention
+    This allows the auth code to be retrieved without manual intervention. Only the
+    standard library is used, so no web framework needs to be installed or imported.
 
     Args:
-        name (str): the name of the Flask application package (i.e. __name__)
+        name (str): the name of the server (e.g. __name__), used for its thread name
         host (str): the hostname to listen on
         port (int): the port of the webserver
         debug (bool): if given, enable or disable debug mode
@@ -25,25 +147,30 @@ class TempAuthServer:
     """
 
     class ServerThread(Thread):
-        """Run a Flask app in a separate thread with shutdown control."""
-
-        def __init__(self, app: Flask, host: str = "localhost", port: int = 0):
-            super().__init__()
+        """Run an `AuthCallbackServer` in a separate thread with shutdown control."""
+
+        def __init__(
+            self,
+            request_args: dict[str, dict[str, str]],
+            host: str = "localhost",
+            port: int = 0,
+            *,
+            name: str | None = None,
+            debug: bool = False,
+        ):
+            super().__init__(name=name, daemon=True)
 
             if port == 0:
                 for i in range(5001, 5021):
                     try:
-                        self.server = make_server(host, i, app)
+                        self.server = make_server(host, i, request_args, debug=debug)
                         break
                     except (SystemExit, OSError):
                         continue
                 else:
                     raise OSError("No available ports in range 5000-5020")
             else:
-                self.server = make_server(host, port, app)
-
-            self.ctx = app.app_context()
-            self.ctx.push()
+                self.server = make_server(host, port, request_args, debug=debug)
 
             self.host = self.server.host
             self.port = self.server.port
@@ -65,64 +192,18 @@ class TempAuthServer:
         debug: bool = False,
         auto_run: bool = False,
     ):
+        self.name = name
         self.host = host
         self._user_port = port
         self._actual_port: int
         self.debug = debug
 
-        self.app = Flask(name)
-
         self._server_thread: TempAuthServer.ServerThread
-        self._request_args: dict[str, dict[str, object]] = {}
-
-        self.create_endpoints()
+        self._request_args: dict[str, dict[str, str]] = {}
 
         if auto_run:
             self.start_server()
 
-    def create_endpoints(self) -> None:
-        """Create all necessary endpoints.
-
-        This is an "endpoint factory" (rather than one decorated method per endpoint)
-        because of the need to use `self.app` as the decorator
-        """
-
-        @self.app.route("/get_auth_code", methods=["GET"])
-        def get_auth_code() -> Response:
-            # TODO: add 400 response for mismatch in state token
-            """Endpoint for getting auth code from third party callback.
-
-            Returns:
-                dict: simple response dict
-            """
-            self._request_args[request.path] = request.args
-
-            return cast(
-                Response,
-                self.app.response_class(
-                    response=dedent(
-                        """
-                    <html lang="en">
-                    <head>
-                        <style>
-                            body {
-                                font-family: Verdana, sans-serif;
-                                height: 100vh;
-                            }
-                        </style>
-                        <title>Authentication Complete</title>
-                    </head>
-                    <body onclick="self.close()">
-                        <h1>Authentication complete!</h1>
-                        <span>Click anywhere to close this window.</span>
-                    </body>
-                    </html>
-                """,
-                    ).strip(),
-                    status=200,
-                ),
-            )
-
     def wait_for_request(
         self,
         endpoint: str,
@@ -173,17 +254,12 @@ class TempAuthServer:
             self._actual_port = self.server_thread.port
 
     def stop_server(self) -> None:
-        """Stop the local server by hitting its `/kill` endpoint.
-
-        See Also:
-            self.create_endpoints: `/kill` endpoint
-        """
+        """Stop the local server, releasing its port."""
         # No point instantiating a new server if we're just going to kill it
         if hasattr(self, "_server_thread") and self.server_thread.is_alive():
             self.server_thread.shutdown()
-
-            while self.server_thread.is_alive():
-                pass
+            self.server_thread.join()
+            self.server_thread.server.server_close()
 
             del self._server_thread
 
@@ -243,9 +319,11 @@ class TempAuthServer:
         """
         if not hasattr(self, "_server_thread"):
             self._server_thread = self.ServerThread(
-                self.app,
+                self._request_args,
                 host=self.host,
                 port=self._user_port,
+                name=f"{self.name}.TempAuthServer",
+                debug=self.debug,
             )
 
         return self._server_thread
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from copy import deepcopy
-from json import dumps
+from dataclasses import dataclass
+from email.message import EmailMessage
+from email.parser import BytesParser
+from email.policy import HTTP
 from logging import DEBUG, getLogger
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, TypeAlias, TypeVar
+from urllib.parse import urlencode, urlsplit
+from uuid import uuid4
 
-from requests import Response, get
+from requests import HTTPError, Response, Session, get, post
+from requests.structures import CaseInsensitiveDict
 from typing_extensions import TypedDict
 
+from wg_utilities.functions import chunk_list, json_dumps
+
 from .oauth_client import OAuthClient
 
 LOGGER = getLogger(__name__)
@@ -28,6 +36,8 @@ GetJsonResponseGoogleClient = TypeVar(
     bound=Mapping[Any, Any],
 )
 
+_BatchResult = TypeVar("_BatchResult")
+
 
 class _PaginatedResponseBase(TypedDict):
     """Typing info for a paginated response."""
@@ -68,6 +78,43 @@ AnyPaginatedResponse: TypeAlias = (
 )
 
 
+@dataclass(frozen=True)
+class BatchRequest:
+    """A single request to be sent as part of a batch, see `GoogleClient.batch`."""
+
+    method: Literal["DELETE", "GET", "PATCH", "POST", "PUT"]
+    url: str
+    """The URL path to the endpoint (not necessarily including the base URL)."""
+
+    params: (
+        dict[
+            StrBytIntFlt,
+            StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+        ]
+        | None
+    ) = None
+    json: Any | None = None
+
+
+class BatchRequestError(HTTPError):
+    """Raised when some of the requests in a batch were unsuccessful.
+
+    The other requests in the batch will still have been processed, so their results
+    are available via `results` (in the same order as the requests), with each failed
+    request's `HTTPError` in its place.
+    """
+
+    def __init__(self, results: list[Any], /):
+        self.results = results
+        self.errors = [result for result in results if isinstance(result, HTTPError)]
+
+        super().__init__(
+            f"{len(self.errors)} of {len(results)} batched requests failed, first "
+            f"error: {self.errors[0]}",
+            response=self.errors[0].response,
+        )
+
+
 class GoogleClient(
     Generic[GetJsonResponseGoogleClient],
     OAuthClient[GetJsonResponseGoogleClient],
@@ -78,13 +125,198 @@ class GoogleClient(
     AUTH_LINK_BASE = "https://accounts.google.com/o/oauth2/v2/auth"
     BASE_URL: str
 
+    # Google's per-user quotas are ~1,000 requests per 100 seconds for most APIs
+    RATE_LIMIT: ClassVar[float | None] = 10
+    RATE_LIMIT_BURST: ClassVar[int] = 20
+
     DEFAULT_PARAMS: ClassVar[
         dict[StrBytIntFlt, StrBytIntFlt | Iterable[StrBytIntFlt] | None]
     ] = {
         "pageSize": "50",
     }
 
-    def get_items(
+    # Endpoint for batching multiple requests into one HTTP request, if the API has one
+    BATCH_URL: ClassVar[str | None] = None
+    BATCH_MAX_SIZE: ClassVar[int] = 100
+
+    def _create_session(self) -> Session:
+        """Create a session whose User-Agent lets Google gzip its responses.
+
+        Google only compresses responses for User-Agents which contain "gzip"; see
+        https://developers.google.com/drive/api/guides/performance#gzip
+
+        Returns:
+            Session: the new session
+        """
+        session = super()._create_session()
+        session.headers["User-Agent"] = f"{session.headers['User-Agent']!s} (gzip)"
+
+        return session
+
+    def batch(self, requests: Iterable[BatchRequest], /) -> list[Response]:
+        """Send multiple requests as `multipart/mixed` batch requests.
+
+        Requests are sent in batches of up to `BATCH_MAX_SIZE`, so any number of
+        requests can be passed in. The outer request's headers (i.e. authentication)
+        apply to each sub-request.
+
+        Args:
+            requests (Iterable[BatchRequest]): the requests to send
+
+        Returns:
+            list[Response]: the response to each request, in the same order as the
+                requests. Unsuccessful responses aren't raised, so should be checked by
+                the caller.
+
+        Raises:
+            NotImplementedError: if the API doesn't support batch requests
+        """
+        if self.BATCH_URL is None:
+            raise NotImplementedError(
+                f"{type(self).__name__} doesn't support batch requests",
+            )
+
+        responses: list[Response] = []
+
+        for chunk in chunk_list(list(requests), self.BATCH_MAX_SIZE):
+            urls = []
+            boundary = f"batch_{uuid4().hex}"
+            body = ""
+
+            for index, request in enumerate(chunk):
+                url, prepared_params = self._prepare_request(
+                    method_name=request.method,
+                    url=request.url,
+                    params=request.params,
+                )
+                urls.append(url)
+
+                path = urlsplit(url).path
+                if prepared_params:
+                    query = urlencode(
+                        [(str(key), value) for key, value in prepared_params.items()],
+                        doseq=True,
+                    )
+                    path += f"?{query}"
+
+                body += (
+                    f"--{boundary}\r\n"
+                    "Content-Type: application/http\r\n"
+                    f"Content-ID: <item-{index}>\r\n\r\n"
+                    f"{request.method} {path} HTTP/1.1\r\n"
+                )
+
+                if request.json is not None:
+                    body += (
+                        "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                        f"{json_dumps(request.json)}\r\n"
+                    )
+                else:
+                    body += "\r\n"
+
+            body += f"--{boundary}--\r\n"
+
+            res = self._request(
+                method=post,
+                url=self.BATCH_URL,
+                params=dict.fromkeys(self.DEFAULT_PARAMS),
+                header_overrides={
+                    **self.request_headers,
+                    "Content-Type": f"multipart/mixed; boundary={boundary}",
+                },
+                data=body.encode(),
+            )
+
+            responses.extend(self._parse_batch_response(res, urls))
+
+        return responses
+
+    def _process_batch_responses(
+        self,
+        responses: Iterable[Response],
+        process_response: Callable[[Response], _BatchResult],
+        /,
+    ) -> list[_BatchResult | HTTPError]:
+        """Process the sub-responses of a batch, collecting any errors in place.
+
+        Args:
+            responses (Iterable[Response]): the responses, as returned by `batch`
+            process_response (Callable): called with each successful response to get
+                its result
+
+        Returns:
+            list: the result of each successful response, or the `HTTPError` of each
+                unsuccessful one, in order
+
+        Raises:
+            BatchRequestError: if any of the requests were unsuccessful (and
+                `validate_request_success` is set)
+        """
+        results: list[_BatchResult | HTTPError] = []
+
+        for res in responses:
+            try:
+                res.raise_for_status()
+            except HTTPError as exc:
+                results.append(exc)
+            else:
+                results.append(process_response(res))
+
+        if self.validate_request_success and any(
+            isinstance(result, HTTPError) for result in results
+        ):
+            raise BatchRequestError(results)
+
+        return results
+
+    @staticmethod
+    def _parse_batch_response(res: Response, urls: list[str]) -> list[Response]:
+        """Split a `multipart/mixed` batch response into its sub-responses.
+
+        Args:
+            res (Response): the batch response
+            urls (list[str]): the full URLs of the sub-requests, in order
+
+        Returns:
+            list[Response]: the sub-responses, in the same order as the sub-requests
+
+        Raises:
+            ValueError: if the batch response is missing any sub-responses
+        """
+        parser = BytesParser(EmailMessage, policy=HTTP)
+
+        message = parser.parsebytes(
+            f"Content-Type: {res.headers['Content-Type']}\r\n\r\n".encode() + res.content,
+        )
+
+        sub_responses: dict[int, Response] = {}
+
+        for part in message.iter_parts():
+            index = int(str(part["Content-ID"]).strip("<>").rsplit("-", 1)[-1])
+
+            # Each part is a HTTP response: a status line, then headers and a body
+            payload = part.get_payload(decode=True)
+            status_line, _, http_message = bytes(payload).partition(b"\n")
+            inner = parser.parsebytes(http_message.lstrip(b"\r"))
+
+            _, status_code, *reason = status_line.decode().split(maxsplit=2)
+
+            sub_res = Response()
+            sub_res.status_code = int(status_code)
+            sub_res.reason = reason[0].strip() if reason else ""
+            sub_res.headers = CaseInsensitiveDict(dict(inner.items()))
+            sub_res._content = bytes(inner.get_payload(decode=True) or b"")
+            sub_res.url = urls[index]
+            sub_res.encoding = "utf-8"
+
+            sub_responses[index] = sub_res
+
+        if missing := set(range(len(urls))) - sub_responses.keys():
+            raise ValueError(f"Batch response missing sub-responses: {sorted(missing)}")
+
+        return [sub_responses[index] for index in range(len(urls))]
+
+    def iter_items(
         self,
         url: str,
         *,
@@ -104,48 +336,121 @@ class GoogleClient(
             | None
         ) = None,
         method_override: Callable[..., Response] | None = None,
-    ) -> list[GetJsonResponseGoogleClient]:
-        """List generic items on Google's API(s).
+        max_items: int | None = None,
+    ) -> Iterator[GetJsonResponseGoogleClient]:
+        """Lazily iterate over generic items on Google's API(s).
+
+        Pages are only requested as they're needed (plus up to `page_prefetch_depth`
+        pages fetched ahead in the background, if set), so breaking out of the loop (or
+        setting `max_items`) avoids fetching the rest of the collection.
 
         Args:
             url (str): the API endpoint to send a request to
             list_key (str): the key to use in extracting the data from the response
+            params (dict): any extra params to be passed in the request
             method_override (Callable): the method to use to get the data (e.g. GET,
                 POST)
-            params (dict): any extra params to be passed in the request
+            max_items (int): the maximum number of items to yield; no limit if None
 
+        Yields:
+            dict: a dict representing an item from the API
 
-        Returns:
-            list: a list of dicts, each representing an item from the API
+        Raises:
+            ValueError: if `max_items` is negative
         """
+        if max_items is not None and max_items < 0:
+            raise ValueError(f"max_items must be at least 0, not {max_items}")
+
         params = (
             {**self.DEFAULT_PARAMS, **params} if params else deepcopy(self.DEFAULT_PARAMS)
         )
         LOGGER.info(
             "Listing all items at endpoint `%s` with params %s",
             url,
-            dumps(params),
+            json_dumps(params),
         )
 
-        res: AnyPaginatedResponse = self._request_json_response(
-            method=method_override or get,
-            url=url,
-            params=params,
-        )  # type: ignore[assignment]
+        if max_items == 0:
+            return
 
-        item_list: list[GetJsonResponseGoogleClient] = res[
-            list_key  # type: ignore[typeddict-item]
-        ]
+        def _fetch_pages(
+            page_params: dict[
+                StrBytIntFlt,
+                StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+            ],
+        ) -> Iterator[list[GetJsonResponseGoogleClient]]:
+            fetched_count = 0
+            while True:
+                res: AnyPaginatedResponse = self._request_json_response(
+                    method=method_override or get,
+                    url=url,
+                    params=page_params,
+                )  # type: ignore[assignment]
 
-        while next_token := res.get("nextPageToken"):
-            params = {**params, "pageToken": next_token}  # type: ignore[dict-item]
-            res = self._request_json_response(
-                method=method_override or get,
-                url=url,
-                params=params,
-            )  # type: ignore[assignment]
+                page: list[GetJsonResponseGoogleClient] = res[
+                    list_key  # type: ignore[typeddict-item]
+                ]
+                fetched_count += len(page)
 
-            item_list.extend(res[list_key])  # type: ignore[typeddict-item]
-            LOGGER.debug("Found %i items so far", len(item_list))
+                yield page
 
-        return item_list
+                if (max_items is not None and fetched_count >= max_items) or not (
+                    next_token := res.get("nextPageToken")
+                ):
+                    return
+
+                page_params = {**page_params, "pageToken": next_token}  # type: ignore[dict-item]
+
+        item_count = 0
+        for page in self._prefetch_pages(_fetch_pages(params)):
+            for item in page:
+                yield item
+                item_count += 1
+
+                if item_count == max_items:
+                    return
+
+            LOGGER.debug("Found %i items so far", item_count)
+
+    def get_items(
+        self,
+        url: str,
+        *,
+        list_key: Literal[
+            "albums",
+            "drives",
+            "files",
+            "items",
+            "mediaItems",
+            "point",
+        ] = "items",
+        params: (
+            dict[
+                StrBytIntFlt,
+                StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+            ]
+            | None
+        ) = None,
+        method_override: Callable[..., Response] | None = None,
+    ) -> list[GetJsonResponseGoogleClient]:
+        """List generic items on Google's API(s).
+
+        Args:
+            url (str): the API endpoint to send a request to
+            list_key (str): the key to use in extracting the data from the response
+            method_override (Callable): the method to use to get the data (e.g. GET,
+                POST)
+            params (dict): any extra params to be passed in the request
+
+
+        Returns:
+            list: a list of dicts, each representing an item from the API
+        """
+        return list(
+            self.iter_items(
+                url,
+                list_key=list_key,
+                params=params,
+                method_override=method_override,
+            ),
+        )
@@ -0,0 +1,553 @@
+"""Asyncio-native flavours of `JsonApiClient` and `OAuthClient`."""
+
+from __future__ import annotations
+
+from asyncio import (
+    AbstractEventLoop,
+    Lock,
+    Semaphore,
+    gather,
+    get_running_loop,
+    to_thread,
+)
+from http import HTTPStatus
+from json import JSONDecodeError
+from logging import DEBUG, getLogger
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Generic, Literal, Self
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from wg_utilities.clients.json_api_client import GetJsonResponse, GetRequest
+from wg_utilities.functions.json import json_loads
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import AsyncIterator, Iterable, Mapping
+    from types import TracebackType
+
+    from aiohttp import ClientResponse
+
+    from wg_utilities.clients.json_api_client import JsonApiClient, StrBytIntFlt
+    from wg_utilities.clients.oauth_client import OAuthClient
+
+LOGGER = getLogger(__name__)
+LOGGER.setLevel(DEBUG)
+
+HttpMethod = Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+
+def _query_pairs(
+    params: Mapping[StrBytIntFlt, StrBytIntFlt | Iterable[StrBytIntFlt]],
+) -> list[tuple[str, str]]:
+    """Convert a params dict into query pairs which `aiohttp` will accept.
+
+    `requests` accepts bytes, numbers and iterables as values (the latter being
+    expanded into repeated keys); `aiohttp` only accepts strings and ints.
+
+    Args:
+        params (dict): the parameters to convert
+
+    Returns:
+        list[tuple[str, str]]: the query string pairs
+    """
+
+    def _to_str(value: StrBytIntFlt) -> str:
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    pairs = []
+    for key, value in params.items():
+        if isinstance(value, str | bytes | int | float):
+            pairs.append((_to_str(key), _to_str(value)))
+        else:
+            pairs.extend((_to_str(key), _to_str(item)) for item in value)
+
+    return pairs
+
+
+class AsyncJsonApiClient(Generic[GetJsonResponse]):
+    """Asyncio-native counterpart to `JsonApiClient`.
+
+    Wraps a (sync) client instance, so the same `BASE_URL`, `DEFAULT_PARAMS`,
+    `request_headers` etc. are used for both flavours; the easiest way to get one is
+    via the `aio` property of any client:
+
+        >>> spotify = SpotifyClient(...)
+        >>> playlist = await spotify.aio.get_json_response("/playlists/abc123")
+
+    Requests are made with an `aiohttp.ClientSession` which is pooled as per the
+    wrapped client's `SESSION_*` config. The session is bound to the event loop it
+    was created in; a new one is created if the client is used in a different loop.
+    """
+
+    def __init__(self, client: JsonApiClient[GetJsonResponse], /):
+        self.client = client
+
+        self._session: ClientSession | None = None
+        self._session_loop: AbstractEventLoop | None = None
+
+    async def _get_request_headers(self) -> Mapping[str, str]:
+        """Get the headers to be used in requests to the API.
+
+        Overridable in subclasses, e.g. to avoid blocking the event loop with
+        credential refreshes.
+
+        Returns:
+            dict: headers for HTTP requests
+        """
+        return self.client.request_headers
+
+    async def _request(
+        self,
+        *,
+        method: HttpMethod,
+        url: str,
+        params: (
+            dict[
+                StrBytIntFlt,
+                StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+            ]
+            | None
+        ) = None,
+        header_overrides: Mapping[str, str] | None = None,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,  # noqa: ASYNC109
+        json: Any | None = None,
+        data: Any | None = None,
+    ) -> tuple[ClientResponse, bytes]:
+        """Make a HTTP request.
+
+        Args:
+            method (str): the HTTP method to use
+            url (str): the URL path to the endpoint (not necessarily including the
+                base URL)
+            params (dict): the parameters to be passed in the HTTP request
+            header_overrides (dict): any headers to override the default headers
+            timeout (float | tuple[float, float] | tuple[float, None] | None): the
+                timeout for the request
+            json (dict): the data to be passed in the HTTP request
+            data (dict): the data to be passed in the HTTP request
+
+        Returns:
+            tuple[ClientResponse, bytes]: the (released) response, and its body
+
+        Raises:
+            ClientResponseError: if the request was unsuccessful and the wrapped
+                client has `validate_request_success` set
+        """
+        url, prepared_params = self.client._prepare_request(
+            method_name=method,
+            url=url,
+            params=params,
+        )
+
+        if isinstance(timeout, tuple):
+            client_timeout = ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        else:
+            client_timeout = ClientTimeout(total=timeout)
+
+        headers = (
+            header_overrides
+            if header_overrides is not None
+            else await self._get_request_headers()
+        )
+
+        request_json, request_data = json, data
+        if (
+            compressed := self.client._compress_request_body(json=json, data=data)
+        ) is not None:
+            headers = {
+                **({"Content-Type": "application/json"} if json is not None else {}),
+                **headers,
+                "Content-Encoding": "gzip",
+            }
+            request_json, request_data = None, compressed
+
+        start_time = perf_counter()
+
+        await self.client.rate_limiter.acquire_async()
+
+        sent_at = perf_counter()
+
+        try:
+            async with self.session.request(
+                method,
+                url,
+                headers=headers,
+                params=_query_pairs(prepared_params),
+                timeout=client_timeout,
+                json=request_json,
+                data=request_data,
+            ) as res:
+                ttfb = perf_counter() - sent_at
+                body = await res.read()
+        except Exception:
+            self.client._record_request_metrics(method, url, start_time=start_time)
+            raise
+
+        self.client._record_request_metrics(
+            method,
+            url,
+            start_time=start_time,
+            status_code=res.status,
+            ttfb=ttfb,
+            response_bytes=len(body),
+        )
+
+        self.client._handle_rate_limit_response(res.status, res.headers)
+
+        if compressed is not None and res.status == HTTPStatus.UNSUPPORTED_MEDIA_TYPE:
+            LOGGER.warning(
+                "Compressed request rejected by %s, disabling request compression",
+                url,
+            )
+            self.client._request_compression_rejected = True
+
+            return await self._request(
+                method=method,
+                url=url,
+                params=params,
+                header_overrides=header_overrides,
+                timeout=timeout,
+                json=json,
+                data=data,
+            )
+
+        if self.client.validate_request_success:
+            res.raise_for_status()
+
+        return res, body
+
+    async def _request_json_response(
+        self,
+        *,
+        method: HttpMethod,
+        url: str,
+        params: (
+            dict[
+                StrBytIntFlt,
+                StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+            ]
+            | None
+        ) = None,
+        header_overrides: Mapping[str, str] | None = None,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,  # noqa: ASYNC109
+        json: Any | None = None,
+        data: Any | None = None,
+    ) -> GetJsonResponse:
+        res, body = await self._request(
+            method=method,
+            url=url,
+            params=params,
+            header_overrides=header_overrides,
+            timeout=timeout,
+            json=json,
+            data=data,
+        )
+
+        if res.status == HTTPStatus.NO_CONTENT or not body:
+            return {}  # type: ignore[return-value]
+
+        try:
+            return json_loads(body)  # type: ignore[no-any-return]
+        except (JSONDecodeError, UnicodeDecodeError) as exc:
+            raise ValueError(body.decode(errors="replace")) from exc
+
+    async def get_json_response(
+        self,
+        url: str,
+        /,
+        *,
+        params: (
+            dict[
+                StrBytIntFlt,
+                StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+            ]
+            | None
+        ) = None,
+        header_overrides: Mapping[str, str] | None = None,
+        timeout: float | None = None,  # noqa: ASYNC109
+        json: Any | None = None,
+        data: Any | None = None,
+    ) -> GetJsonResponse:
+        """Get a simple JSON object from a URL.
+
+        Args:
+            url (str): the API endpoint to GET
+            params (dict): the parameters to be passed in the HTTP request
+            header_overrides (dict): headers to add to/overwrite the headers in
+                `self.request_headers`. Setting this to an empty dict will erase all
+                headers; `None` will use `self.request_headers`.
+            timeout (float): How many seconds to wait for the server to send data
+                before giving up
+            json (dict): a JSON payload to pass in the request
+            data (dict): a data payload to pass in the request
+
+        Returns:
+            dict: the JSON from the response
+        """
+        return await self._request_json_response(
+            method="GET",
+            url=url,
+            params=params,
+            header_overrides=header_overrides,
+            timeout=timeout,
+            json=json,
+            data=data,
+        )
+
+    async def post_json_response(
+        self,
+        url: str,
+        /,
+        *,
+        params: (
+            dict[
+                StrBytIntFlt,
+                StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+            ]
+            | None
+        ) = None,
+        header_overrides: Mapping[str, str] | None = None,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,  # noqa: ASYNC109
+        json: Any | None = None,
+        data: Any | None = None,
+    ) -> GetJsonResponse:
+        """Get a simple JSON object from a URL from a POST request.
+
+        Args:
+            url (str): the API endpoint to POST
+            params (dict): the parameters to be passed in the HTTP request
+            header_overrides (dict): headers to add to/overwrite the headers in
+                `self.request_headers`. Setting this to an empty dict will erase all
+                headers; `None` will use `self.request_headers`.
+            timeout (float): How many seconds to wait for the server to send data
+                before giving up
+            json (dict): a JSON payload to pass in the request
+            data (dict): a data payload to pass in the request
+
+        Returns:
+            dict: the JSON from the response
+        """
+        return await self._request_json_response(
+            method="POST",
+            url=url,
+            params=params,
+            header_overrides=header_overrides,
+            timeout=timeout,
+            json=json,
+            data=data,
+        )
+
+    async def get_many(
+        self,
+        urls_or_requests: Iterable[str | GetRequest],
+        /,
+        *,
+        max_concurrency: int | None = None,
+    ) -> list[GetJsonResponse | Exception]:
+        """Send independent GET requests concurrently, see `JsonApiClient.get_many`.
+
+        Args:
+            urls_or_requests (Iterable[str | GetRequest]): the API endpoints to GET, or
+                `GetRequest`s for requests which need parameters, headers etc.
+            max_concurrency (int): the maximum number of requests in flight at once;
+                defaults to the wrapped client's `SESSION_POOL_MAXSIZE`
+
+        Returns:
+            list: the JSON from each response, or the exception raised by the request
+
+        Raises:
+            ValueError: if `max_concurrency` is less than 1
+        """
+        if max_concurrency is None:
+            max_concurrency = self.client.SESSION_POOL_MAXSIZE
+        elif max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, not {max_concurrency}")
+
+        semaphore = Semaphore(max_concurrency)
+
+        async def _get_json_response(request: str | GetRequest) -> GetJsonResponse:
+            if isinstance(request, str):
+                request = GetRequest(request)
+
+            async with semaphore:
+                return await self.get_json_response(
+                    request.url,
+                    params=dict(request.params) if request.params is not None else None,
+                    header_overrides=request.header_overrides,  # type: ignore[arg-type]
+                    timeout=request.timeout,
+                )
+
+        results = await gather(
+            *(_get_json_response(request) for request in urls_or_requests),
+            return_exceptions=True,
+        )
+
+        # Don't swallow cancellations, `KeyboardInterrupt`s etc.
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
+        return results  # type: ignore[return-value]
+
+    async def iter_pages(
+        self,
+        url: str,
+        /,
+        *,
+        params: (
+            dict[
+                StrBytIntFlt,
+                StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+            ]
+            | None
+        ) = None,
+        page_token_key: str = "nextPageToken",  # noqa: S107
+        page_token_param: str = "pageToken",  # noqa: S107
+        next_url_key: str = "next",
+    ) -> AsyncIterator[GetJsonResponse]:
+        """Yield each page of a paginated GET endpoint.
+
+        Both of the pagination styles used by the supported APIs are followed:
+            - a page token (e.g. Google's `nextPageToken`), which is sent back as a
+              parameter to the same URL
+            - a fully-formed URL for the next page (e.g. Spotify's `next`)
+
+        Args:
+            url (str): the API endpoint to GET
+            params (dict): the parameters to be passed in the first request
+            page_token_key (str): the key in the response for the next page's token
+            page_token_param (str): the parameter to send the page token as
+            next_url_key (str): the key in the response for the next page's URL
+
+        Yields:
+            dict: each page's JSON
+        """
+        params = dict(params or {})
+
+        page = await self.get_json_response(url, params=params)
+        yield page
+
+        while True:
+            if next_token := page.get(page_token_key):
+                params = {**params, page_token_param: next_token}
+            elif next_url := page.get(next_url_key):
+                url, params = next_url, {}
+            else:
+                break
+
+            page = await self.get_json_response(url, params=params)
+            yield page
+
+    async def get_items(
+        self,
+        url: str,
+        /,
+        *,
+        list_key: str = "items",
+        params: (
+            dict[
+                StrBytIntFlt,
+                StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+            ]
+            | None
+        ) = None,
+        hard_limit: int | None = None,
+    ) -> list[Any]:
+        """List all items from a paginated endpoint.
+
+        Args:
+            url (str): the API endpoint to GET
+            list_key (str): the key to use in extracting the data from each page
+            params (dict): any extra params to be passed in the request
+            hard_limit (int): the maximum number of items to return
+
+        Returns:
+            list: all items from all pages
+        """
+        items: list[Any] = []
+
+        async for page in self.iter_pages(url, params=params):
+            items.extend(page.get(list_key, []))
+
+            if hard_limit is not None and len(items) >= hard_limit:
+                return items[:hard_limit]
+
+        return items
+
+    async def close(self) -> None:
+        """Close the client's session, releasing any pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._session_loop = None
+
+    @property
+    def session(self) -> ClientSession:
+        """Pooled session for the current event loop.
+
+        Returns:
+            ClientSession: the `aiohttp` session
+        """
+        loop = get_running_loop()
+
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.client.SESSION_POOL_CONNECTIONS
+                    * self.client.SESSION_POOL_MAXSIZE,
+                    limit_per_host=self.client.SESSION_POOL_MAXSIZE,
+                    force_close=not self.client.SESSION_KEEP_ALIVE,
+                ),
+            )
+            self._session_loop = loop
+
+        return self._session
+
+    async def __aenter__(self) -> Self:
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the session on exit."""
+        await self.close()
+
+
+class AsyncOAuthClient(AsyncJsonApiClient[GetJsonResponse]):
+    """Asyncio-native counterpart to `OAuthClient`.
+
+    Credentials are handled by the wrapped client; expired access tokens are
+    refreshed in a worker thread (once, regardless of how many requests are waiting on
+    it) so that building the request headers never blocks the event loop.
+    """
+
+    client: OAuthClient[GetJsonResponse]
+
+    def __init__(self, client: OAuthClient[GetJsonResponse], /):
+        super().__init__(client)
+
+        self._refresh_lock = Lock()
+
+    async def _get_request_headers(self) -> Mapping[str, str]:
+        """Get the auth headers, refreshing the access token first if necessary.
+
+        Returns:
+            dict: auth headers for HTTP requests
+        """
+        if self.client.access_token_has_expired:
+            async with self._refresh_lock:
+                if self.client.access_token_has_expired:
+                    await to_thread(self.client.refresh_access_token)
+
+        return self.client.request_headers
+
+
+__all__ = ["AsyncJsonApiClient", "AsyncOAuthClient"]
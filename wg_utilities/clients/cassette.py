@@ -0,0 +1,341 @@
+"""Record/replay transport for `JsonApiClient`, for offline and deterministic runs."""
+
+from __future__ import annotations
+
+from base64 import b64decode, b64encode
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from io import BytesIO
+from json import JSONDecodeError
+from logging import DEBUG, getLogger
+from threading import Lock
+from time import sleep
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests import Request, Response
+from requests.structures import CaseInsensitiveDict
+
+from wg_utilities.functions.file_management import force_mkdir
+from wg_utilities.functions.json import json_dumps_bytes, json_loads
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from types import TracebackType
+
+    from requests import Session
+
+LOGGER = getLogger(__name__)
+LOGGER.setLevel(DEBUG)
+
+
+class CassetteMissError(LookupError):
+    """Raised when a request has no recorded response to replay."""
+
+
+@dataclass
+class Interaction:
+    """A single recorded request/response pair.
+
+    Request headers and bodies are never recorded, so credentials sent to the API
+    don't end up in the cassette.
+    """
+
+    method: str
+    url: str
+    """The full URL of the request, including its (normalized) query string."""
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+
+    @classmethod
+    def from_response(cls, res: Response, /, *, method: str, url: str) -> Interaction:
+        """Create an interaction from a (live) response.
+
+        Args:
+            res (Response): the response to record
+            method (str): the HTTP method of the request
+            url (str): the full URL of the request
+
+        Returns:
+            Interaction: the recorded interaction
+        """
+        return cls(
+            method=method.upper(),
+            url=url,
+            status_code=res.status_code,
+            headers=dict(res.headers),
+            content=res.content,
+        )
+
+    def to_response(self) -> Response:
+        """Build a `requests.Response` from this interaction.
+
+        Returns:
+            Response: the recorded response
+        """
+        res = Response()
+        res.status_code = self.status_code
+        res.url = self.url
+        res.headers = CaseInsensitiveDict(self.headers)
+        res._content = self.content
+        # The body has already been read, so streamed requests iterate over (and
+        # close) an in-memory copy of it
+        res._content_consumed = True
+        res.raw = BytesIO(self.content)
+        res.encoding = "utf-8"
+
+        try:
+            res.reason = HTTPStatus(self.status_code).phrase
+        except ValueError:
+            res.reason = ""
+
+        return res
+
+
+class Cassette:
+    """Records responses to disk, or replays them in place of real requests.
+
+    In "record" mode, requests are sent as normal and each response is added to the
+    cassette; call `save` (or use the cassette as a context manager) to write it to
+    disk. In "replay" mode, no requests are sent: each one is served the next
+    recorded response for its method and URL, after `latency` seconds.
+
+    Requests are matched on their method and full URL (with the query parameters
+    sorted), so paginated requests (e.g. with a `pageToken` param, or Spotify's `next`
+    URLs) each get their own page. Identical requests are replayed in the order they
+    were recorded, with the last response repeated once they're exhausted; this
+    covers repeated POSTs to an OAuth token endpoint, for example.
+
+    Values of `REDACTED_KEYS` in recorded JSON responses (e.g. access tokens) are
+    replaced before being stored.
+
+    Args:
+        path (Path): the cassette file
+        mode (str): "record" or "replay"
+        latency (float): the number of seconds to wait before serving each replayed
+            response, to simulate network latency
+    """
+
+    REDACTED_KEYS: ClassVar[frozenset[str]] = frozenset(
+        {"access_token", "refresh_token", "id_token"},
+    )
+    REDACTED_VALUE: ClassVar[str] = "REDACTED"
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        mode: Literal["record", "replay"] = "replay",
+        latency: float = 0,
+    ):
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+
+        self._interactions: dict[tuple[str, str], list[Interaction]] = defaultdict(list)
+        self._play_counts: dict[tuple[str, str], int] = defaultdict(int)
+        self._lock = Lock()
+
+        if mode == "replay":
+            self.load()
+
+    def __enter__(self) -> Self:
+        """Use the cassette, saving it on exit if it's recording.
+
+        Returns:
+            Cassette: this cassette
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Save the cassette, if it's recording."""
+        if self.mode == "record":
+            self.save()
+
+    @staticmethod
+    def normalize_url(
+        url: str,
+        params: dict[Any, Any] | None = None,
+    ) -> str:
+        """Get the full URL of a request, with its query parameters sorted.
+
+        Args:
+            url (str): the URL of the request
+            params (dict): any query parameters which aren't already in the URL
+
+        Returns:
+            str: the normalized URL
+        """
+        prepared_url = Request("GET", url, params=params).prepare().url or url
+        scheme, netloc, path, query, _ = urlsplit(prepared_url)
+
+        return urlunsplit(
+            (
+                scheme.lower(),
+                netloc.lower(),
+                path,
+                urlencode(sorted(parse_qsl(query, keep_blank_values=True))),
+                "",
+            ),
+        )
+
+    def add(self, interaction: Interaction, /) -> None:
+        """Add an interaction to the cassette, e.g. to seed it from existing fixtures.
+
+        Args:
+            interaction (Interaction): the interaction to add
+        """
+        with self._lock:
+            self._interactions[(interaction.method, interaction.url)].append(interaction)
+
+    def play(self, method: str, url: str) -> Response:
+        """Get the next recorded response for a request.
+
+        Args:
+            method (str): the HTTP method of the request
+            url (str): the normalized URL of the request
+
+        Returns:
+            Response: the recorded response
+
+        Raises:
+            CassetteMissError: if there's no recorded response for the request
+        """
+        key = (method.upper(), url)
+
+        with self._lock:
+            if not (interactions := self._interactions.get(key)):
+                raise CassetteMissError(f"No recorded response for {method} {url}")
+
+            index = min(self._play_counts[key], len(interactions) - 1)
+            self._play_counts[key] += 1
+
+        return interactions[index].to_response()
+
+    def send(
+        self,
+        session: Session,
+        method_name: str,
+        url: str,
+        **kwargs: Any,
+    ) -> Response:
+        """Send (and record) a request, or replay its response.
+
+        Args:
+            session (Session): the session to send the request with when recording
+            method_name (str): the HTTP method to use, e.g. "GET"
+            url (str): the URL of the request
+            **kwargs (Any): any other arguments for `Session.request`
+
+        Returns:
+            Response: the live or replayed response
+        """
+        normalized_url = self.normalize_url(url, kwargs.get("params"))
+
+        if self.mode == "replay":
+            if self.latency > 0:
+                sleep(self.latency)
+
+            return self.play(method_name, normalized_url)
+
+        res = session.request(method_name, url, **kwargs)
+
+        self.add(
+            self._redact(
+                Interaction.from_response(res, method=method_name, url=normalized_url),
+            ),
+        )
+
+        return res
+
+    def _redact(self, interaction: Interaction) -> Interaction:
+        """Replace any sensitive values in an interaction's JSON content.
+
+        Args:
+            interaction (Interaction): the interaction to redact
+
+        Returns:
+            Interaction: the (possibly new) redacted interaction
+        """
+        try:
+            content = json_loads(interaction.content)
+        except JSONDecodeError:
+            return interaction
+
+        if not isinstance(content, dict) or not self.REDACTED_KEYS & content.keys():
+            return interaction
+
+        for key in self.REDACTED_KEYS & content.keys():
+            content[key] = self.REDACTED_VALUE
+
+        interaction_json = asdict(interaction)
+        interaction_json["content"] = json_dumps_bytes(content)
+
+        return Interaction(**interaction_json)
+
+    def load(self) -> None:
+        """Load the cassette's interactions from disk.
+
+        Raises:
+            FileNotFoundError: if the cassette file doesn't exist
+        """
+        cassette_json = json_loads(self.path.read_bytes())
+
+        with self._lock:
+            self._interactions.clear()
+            self._play_counts.clear()
+
+        for interaction_json in cassette_json["interactions"]:
+            interaction_json["content"] = b64decode(interaction_json["content"])
+            self.add(Interaction(**interaction_json))
+
+        LOGGER.debug(
+            "Loaded %i interactions from cassette %s",
+            len(cassette_json["interactions"]),
+            self.path,
+        )
+
+    def save(self) -> None:
+        """Write the cassette's interactions to disk."""
+        with self._lock:
+            interactions = [
+                {
+                    **asdict(interaction),
+                    "content": b64encode(interaction.content).decode(),
+                }
+                for interactions in self._interactions.values()
+                for interaction in interactions
+            ]
+
+        force_mkdir(self.path, path_is_file=True)
+
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_bytes(json_dumps_bytes({"interactions": interactions}))
+        tmp_path.replace(self.path)
+
+        LOGGER.debug("Saved %i interactions to cassette %s", len(interactions), self.path)
+
+    @property
+    def interactions(self) -> list[Interaction]:
+        """All interactions in the cassette.
+
+        Returns:
+            list[Interaction]: the interactions, grouped by request
+        """
+        with self._lock:
+            return [
+                interaction
+                for interactions in self._interactions.values()
+                for interaction in interactions
+            ]
+
+
+__all__ = ["Cassette", "CassetteMissError", "Interaction"]
@@ -0,0 +1,329 @@
+"""Pluggable storage backends for `OAuthClient` credentials."""
+
+from __future__ import annotations
+
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import closing, nullcontext
+from os import environ
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from wg_utilities.clients.oauth_client import OAuthCredentials
+from wg_utilities.functions.file_management import (
+    atomic_write_bytes,
+    file_lock,
+    force_mkdir,
+)
+from wg_utilities.functions.json import json_dumps_bytes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+
+class CredentialStore(ABC):
+    """Somewhere to persist an `OAuthClient`'s credentials between runs."""
+
+    @abstractmethod
+    def load(self) -> OAuthCredentials | None:
+        """Load the credentials from the store.
+
+        Returns:
+            OAuthCredentials: the stored credentials, or None if there aren't any
+        """
+
+    @abstractmethod
+    def save(self, credentials: OAuthCredentials, /) -> None:
+        """Save the credentials to the store, replacing any existing ones.
+
+        Args:
+            credentials (OAuthCredentials): the credentials to save
+        """
+
+    @abstractmethod
+    def delete(self) -> None:
+        """Delete the credentials from the store, if there are any."""
+
+    def reload(self) -> OAuthCredentials | None:
+        """Load the credentials from the underlying storage, bypassing any caching.
+
+        Used to pick up credentials which have been refreshed by another process.
+
+        Returns:
+            OAuthCredentials: the stored credentials, or None if there aren't any
+        """
+        return self.load()
+
+    def lock(self) -> AbstractContextManager[None]:
+        """Get the inter-process lock to hold while refreshing the credentials.
+
+        Returns:
+            AbstractContextManager: the lock; a no-op unless the store is shared
+                between processes
+        """
+        return nullcontext()
+
+
+class FileCredentialStore(CredentialStore):
+    """Credentials stored as JSON in a local file; the default store.
+
+    Writes are atomic, and refreshes are locked with a `.lock` file alongside the
+    credentials file, so the file can be shared between processes.
+
+    Args:
+        path (Path): the path to the credentials file
+    """
+
+    def __init__(self, path: Path, /):
+        self.path = path
+
+    def load(self) -> OAuthCredentials | None:
+        """Load the credentials from the file.
+
+        Returns:
+            OAuthCredentials: the stored credentials, or None if the file doesn't exist
+        """
+        try:
+            return OAuthCredentials.model_validate_json(self.path.read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def save(self, credentials: OAuthCredentials, /) -> None:
+        """Write the credentials to the file atomically.
+
+        Args:
+            credentials (OAuthCredentials): the credentials to save
+        """
+        atomic_write_bytes(
+            force_mkdir(self.path, path_is_file=True),
+            json_dumps_bytes(credentials.model_dump(exclude_none=True)),
+        )
+
+    def delete(self) -> None:
+        """Delete the credentials file."""
+        self.path.unlink(missing_ok=True)
+
+    def lock(self) -> AbstractContextManager[None]:
+        """Lock the credentials file against refreshes from other processes.
+
+        Returns:
+            AbstractContextManager: the file lock
+        """
+        return file_lock(self.path.with_name(f"{self.path.name}.lock"))
+
+
+class InMemoryCredentialStore(CredentialStore):
+    """Credentials held in memory only, e.g. for tests or one-off scripts.
+
+    Args:
+        credentials (OAuthCredentials): optional initial credentials
+    """
+
+    def __init__(self, credentials: OAuthCredentials | None = None, /):
+        self._credentials = credentials
+
+    def load(self) -> OAuthCredentials | None:
+        """Get the stored credentials.
+
+        Returns:
+            OAuthCredentials: the stored credentials, or None if there aren't any
+        """
+        return self._credentials
+
+    def save(self, credentials: OAuthCredentials, /) -> None:
+        """Store the credentials.
+
+        Args:
+            credentials (OAuthCredentials): the credentials to save
+        """
+        self._credentials = credentials
+
+    def delete(self) -> None:
+        """Forget the stored credentials."""
+        self._credentials = None
+
+
+class SQLiteCredentialStore(CredentialStore):
+    """Credentials stored in a SQLite database, keyed so one database can hold many.
+
+    Args:
+        path (Path): the path to the database file
+        key (str): the key to store the credentials under, e.g. the client ID
+    """
+
+    TABLE_NAME = "oauth_credentials"
+
+    def __init__(self, path: Path, /, *, key: str):
+        self.path = path
+        self.key = key
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} "
+                "(key TEXT PRIMARY KEY, credentials TEXT NOT NULL)",
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(force_mkdir(self.path, path_is_file=True))
+
+    def load(self) -> OAuthCredentials | None:
+        """Load the credentials from the database.
+
+        Returns:
+            OAuthCredentials: the stored credentials, or None if there aren't any
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f"SELECT credentials FROM {self.TABLE_NAME} WHERE key = ?",  # noqa: S608
+                (self.key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return OAuthCredentials.model_validate_json(row[0])
+
+    def save(self, credentials: OAuthCredentials, /) -> None:
+        """Write the credentials to the database.
+
+        Args:
+            credentials (OAuthCredentials): the credentials to save
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.TABLE_NAME} (key, credentials) "  # noqa: S608
+                "VALUES (?, ?)",
+                (self.key, credentials.model_dump_json(exclude_none=True)),
+            )
+
+    def delete(self) -> None:
+        """Delete the credentials from the database."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"DELETE FROM {self.TABLE_NAME} WHERE key = ?",  # noqa: S608
+                (self.key,),
+            )
+
+    def lock(self) -> AbstractContextManager[None]:
+        """Lock the database against refreshes from other processes.
+
+        Returns:
+            AbstractContextManager: the file lock
+        """
+        return file_lock(self.path.with_name(f"{self.path.name}.lock"))
+
+
+class EnvironmentCredentialStore(CredentialStore):
+    """Credentials injected as JSON via an environment variable.
+
+    Useful for serverless/CI runs where the credentials are provided by the platform.
+    Refreshed credentials are written back to the variable, so they're used for the
+    rest of the process (and by any child processes), but aren't persisted beyond it.
+
+    Args:
+        variable (str): the name of the environment variable
+    """
+
+    def __init__(self, variable: str = "WG_UTILITIES_OAUTH_CREDENTIALS", /):
+        self.variable = variable
+
+    def load(self) -> OAuthCredentials | None:
+        """Load the credentials from the environment variable.
+
+        Returns:
+            OAuthCredentials: the credentials, or None if the variable isn't set
+        """
+        if not (value := environ.get(self.variable)):
+            return None
+
+        return OAuthCredentials.model_validate_json(value)
+
+    def save(self, credentials: OAuthCredentials, /) -> None:
+        """Write the credentials to the environment variable.
+
+        Args:
+            credentials (OAuthCredentials): the credentials to save
+        """
+        environ[self.variable] = credentials.model_dump_json(exclude_none=True)
+
+    def delete(self) -> None:
+        """Unset the environment variable."""
+        environ.pop(self.variable, None)
+
+
+class CachedCredentialStore(CredentialStore):
+    """In-memory front cache for another store.
+
+    The credentials are only read (and validated) from the underlying store once;
+    saves are written through. Share one instance between clients (or keep it at
+    module level in serverless functions) to avoid repeated I/O.
+
+    Args:
+        store (CredentialStore): the underlying store
+    """
+
+    def __init__(self, store: CredentialStore, /):
+        self.store = store
+
+        self._credentials: OAuthCredentials | None = None
+        self._lock = Lock()
+
+    def load(self) -> OAuthCredentials | None:
+        """Get the credentials, from the cache if possible.
+
+        Returns:
+            OAuthCredentials: a copy of the cached credentials, or None if there
+                aren't any
+        """
+        with self._lock:
+            if self._credentials is None:
+                self._credentials = self.store.load()
+
+            # Clients update their credentials in place when refreshing them
+            return None if self._credentials is None else self._credentials.model_copy()
+
+    def reload(self) -> OAuthCredentials | None:
+        """Reload the credentials from the underlying store, updating the cache.
+
+        Returns:
+            OAuthCredentials: the stored credentials, or None if there aren't any
+        """
+        with self._lock:
+            self._credentials = self.store.reload()
+
+            return None if self._credentials is None else self._credentials.model_copy()
+
+    def save(self, credentials: OAuthCredentials, /) -> None:
+        """Save the credentials to the underlying store and the cache.
+
+        Args:
+            credentials (OAuthCredentials): the credentials to save
+        """
+        with self._lock:
+            self.store.save(credentials)
+            self._credentials = credentials.model_copy()
+
+    def delete(self) -> None:
+        """Delete the credentials from the underlying store and the cache."""
+        with self._lock:
+            self.store.delete()
+            self._credentials = None
+
+    def lock(self) -> AbstractContextManager[None]:
+        """Get the underlying store's lock.
+
+        Returns:
+            AbstractContextManager: the lock
+        """
+        return self.store.lock()
+
+
+__all__ = [
+    "CachedCredentialStore",
+    "CredentialStore",
+    "EnvironmentCredentialStore",
+    "FileCredentialStore",
+    "InMemoryCredentialStore",
+    "SQLiteCredentialStore",
+]
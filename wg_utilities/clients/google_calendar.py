@@ -11,16 +11,18 @@ from typing import TYPE_CHECKING, Any, ClassVar, Literal, NotRequired, Self, Typ
 from zoneinfo import ZoneInfo
 
 from pydantic import Field, field_serializer, field_validator, model_validator
-from requests import delete
 from typing_extensions import TypedDict
 from tzlocal import get_localzone
 
-from wg_utilities.clients._google import GoogleClient
+from wg_utilities.clients._google import BatchRequest, GoogleClient
 from wg_utilities.clients.oauth_client import BaseModelWithConfig
+from wg_utilities.functions import json_loads
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from requests import HTTPError
+
     from wg_utilities.clients.json_api_client import StrBytIntFlt
 
 
@@ -497,10 +499,22 @@ class Event(GoogleCalendarEntity):
 GoogleCalendarEntityJson: TypeAlias = CalendarJson | EventJson
 
 
+class EventCreationParams(TypedDict):
+    """Arguments for creating an event, see `GoogleCalendarClient.create_event`."""
+
+    summary: str
+    start_datetime: datetime_ | date_
+    end_datetime: datetime_ | date_
+    tz: NotRequired[str | None]
+    extra_params: NotRequired[dict[str, str] | None]
+
+
 class GoogleCalendarClient(GoogleClient[GoogleCalendarEntityJson]):
     """Custom client specifically for Google's Calendar API."""
 
     BASE_URL = "https://www.googleapis.com/calendar/v3"
+    BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+    BATCH_MAX_SIZE = 50
 
     DEFAULT_PARAMS: ClassVar[
         dict[StrBytIntFlt, StrBytIntFlt | Iterable[StrBytIntFlt] | None]
@@ -541,6 +555,45 @@ class GoogleCalendarClient(GoogleClient[GoogleCalendarEntityJson]):
             TypeError: if the start/end datetime params are not the correct type
         """
         calendar = calendar or self.primary_calendar
+
+        event_json = self.post_json_response(
+            f"/calendars/{calendar.id}/events",
+            json=self._build_event_body(
+                summary,
+                start_datetime,
+                end_datetime,
+                tz=tz,
+                extra_params=extra_params,
+            ),
+            params={"maxResults": None},
+        )
+
+        return Event.from_json_response(event_json, calendar=calendar, google_client=self)
+
+    @staticmethod
+    def _build_event_body(
+        summary: str,
+        start_datetime: datetime_ | date_,
+        end_datetime: datetime_ | date_,
+        *,
+        tz: str | None = None,
+        extra_params: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Build the JSON body for creating an event.
+
+        Args:
+            summary (str): the summary (title) of the event
+            start_datetime (Union[datetime, date]): when the event starts
+            end_datetime (Union[datetime, date]): when the event ends
+            tz (str): the timezone which the event is in (IANA database name)
+            extra_params (dict): any extra params to pass in the request
+
+        Returns:
+            dict: the event's JSON body
+
+        Raises:
+            TypeError: if the start/end datetime params are not the correct type
+        """
         tz = tz or str(get_localzone())
 
         start_params = {
@@ -565,18 +618,58 @@ class GoogleCalendarClient(GoogleClient[GoogleCalendarEntityJson]):
         else:
             raise TypeError("`end_datetime` must be either a date or a datetime")
 
-        event_json = self.post_json_response(
-            f"/calendars/{calendar.id}/events",
-            json={
-                "summary": summary,
-                "start": start_params,
-                "end": end_params,
-                **(extra_params or {}),
-            },
-            params={"maxResults": None},
+        return {
+            "summary": summary,
+            "start": start_params,
+            "end": end_params,
+            **(extra_params or {}),
+        }
+
+    def create_events(
+        self,
+        events: Iterable[EventCreationParams],
+        /,
+        *,
+        calendar: Calendar | None = None,
+    ) -> list[Event | HTTPError]:
+        """Create many events at once, using batch requests.
+
+        A failure to create one event doesn't stop the others from being created.
+
+        Args:
+            events (Iterable[EventCreationParams]): the events to create, each as the
+                arguments which would be passed to `create_event`
+            calendar (Calendar): the calendar to add the events to
+
+        Returns:
+            list[Event | HTTPError]: the new events, in the same order as `events`, with
+                the error in place of any event which couldn't be created
+
+        Raises:
+            BatchRequestError: if any of the events couldn't be created (and
+                `validate_request_success` is set); the events which were created are
+                available via its `results`
+        """
+        calendar = calendar or self.primary_calendar
+
+        responses = self.batch(
+            BatchRequest(
+                "POST",
+                f"/calendars/{calendar.id}/events",
+                params={"maxResults": None},
+                json=self._build_event_body(**event),
+            )
+            for event in events
         )
 
-        return Event.from_json_response(event_json, calendar=calendar, google_client=self)
+        return self._process_batch_responses(
+            responses,
+            lambda res: Event.from_json_response(
+                json_loads(res.content),
+                calendar=calendar,
+                google_client=self,
+            ),
+        )
 
     def delete_event_by_id(self, event_id: str, calendar: Calendar | None = None) -> None:
         """Delete an event from a calendar.
@@ -587,7 +680,7 @@ class GoogleCalendarClient(GoogleClient[GoogleCalendarEntityJson]):
         """
         calendar = calendar or self.primary_calendar
 
-        res = delete(
+        res = self.session.delete(
             f"{self.base_url}/calendars/{calendar.id}/events/{event_id}",
             headers=self.request_headers,
             timeout=10,
@@ -595,6 +688,33 @@ class GoogleCalendarClient(GoogleClient[GoogleCalendarEntityJson]):
 
         res.raise_for_status()
 
+    def delete_events(self, events: Iterable[Event], /) -> list[HTTPError | None]:
+        """Delete many events at once, using batch requests.
+
+        A failure to delete one event doesn't stop the others from being deleted.
+
+        Args:
+            events (Iterable[Event]): the events to delete
+
+        Returns:
+            list[HTTPError | None]: None for each deleted event, or the error for each
+                event which couldn't be deleted, in the same order as `events`
+
+        Raises:
+            BatchRequestError: if any of the events couldn't be deleted (and
+                `validate_request_success` is set)
+        """
+        responses = self.batch(
+            BatchRequest(
+                "DELETE",
+                f"/calendars/{event.calendar.id}/events/{event.id}",
+                params={"maxResults": None},
+            )
+            for event in events
+        )
+
+        return self._process_batch_responses(responses, lambda _: None)
+
     def get_event_by_id(
         self,
         event_id: str,
@@ -2,22 +2,24 @@
 
 from __future__ import annotations
 
+from collections import defaultdict, deque
 from copy import deepcopy
 from datetime import date, datetime  # noqa: TC003
 from enum import StrEnum
 from re import sub
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self, SupportsIndex, TypeVar
 
 from pydantic import Field, PrivateAttr, ValidationInfo, field_validator
 
-from wg_utilities.clients._google import GoogleClient
+from wg_utilities.clients._google import BatchRequest, GoogleClient
 from wg_utilities.clients.oauth_client import BaseModelWithConfig
-from wg_utilities.functions.json import JSONObj
+from wg_utilities.functions.json import JSONObj, json_loads
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Mapping
     from pathlib import Path
 
+    from wg_utilities.clients.google_drive_index import DriveIndex
     from wg_utilities.clients.json_api_client import StrBytIntFlt
 
 
@@ -241,11 +243,121 @@ class _GoogleDriveEntity(BaseModelWithConfig):
         return self.name
 
 
+_EntityT = TypeVar("_EntityT", bound=_GoogleDriveEntity)
+
+
+class _EntityList(list[_EntityT]):
+    """List of Drive entities, indexed by ID for O(1) membership checks and lookups.
+
+    Entities are equal if their IDs are, so `entity in entities` is equivalent to
+    the linear search of a plain list.
+
+    Args:
+        entities (Iterable): the initial entities
+    """
+
+    def __init__(self, entities: Iterable[_EntityT] = (), /):
+        super().__init__(entities)
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._by_id: dict[str, _EntityT] = {entity.id: entity for entity in self}
+
+    def get(self, entity_id: str, /) -> _EntityT | None:
+        """Get an entity by its ID.
+
+        Args:
+            entity_id (str): the ID of the entity to get
+
+        Returns:
+            _GoogleDriveEntity: the entity, or None if it isn't in the list
+        """
+        return self._by_id.get(entity_id)
+
+    def __contains__(self, value: object) -> bool:
+        """Check if an equal entity is in the list."""
+        return (
+            isinstance(value, _GoogleDriveEntity)
+            and (entity := self._by_id.get(value.id)) is not None
+            and entity == value
+        )
+
+    def append(self, entity: _EntityT, /) -> None:
+        """Append an entity to the list."""
+        super().append(entity)
+        self._by_id[entity.id] = entity
+
+    def extend(self, entities: Iterable[_EntityT], /) -> None:
+        """Append each of the given entities to the list."""
+        for entity in entities:
+            self.append(entity)
+
+    def insert(self, index: SupportsIndex, entity: _EntityT, /) -> None:
+        """Insert an entity into the list."""
+        super().insert(index, entity)
+        self._by_id[entity.id] = entity
+
+    def __iadd__(self, entities: Iterable[_EntityT]) -> Self:  # type: ignore[override,misc]
+        """Append each of the given entities to the list."""
+        self.extend(entities)
+        return self
+
+    # Removals are O(N) anyway, so the index is just rebuilt
+
+    def remove(self, entity: _EntityT, /) -> None:
+        """Remove the first occurrence of an entity from the list."""
+        super().remove(entity)
+        self._reindex()
+
+    def pop(self, index: SupportsIndex = -1, /) -> _EntityT:
+        """Remove and return the entity at the given index."""
+        entity = super().pop(index)
+        self._reindex()
+        return entity
+
+    def clear(self) -> None:
+        """Remove all entities from the list."""
+        super().clear()
+        self._by_id.clear()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Replace the entity/entities at the given index/slice."""
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        """Delete the entity/entities at the given index/slice."""
+        super().__delitem__(index)
+        self._reindex()
+
+    def __reduce__(self) -> tuple[type[Self], tuple[list[_EntityT]]]:
+        """Copy/pickle via `__init__`, so the index is always built."""
+        return type(self), (list(self),)
+
+
+def _as_entity_list(value: object, /) -> _EntityList[Any]:
+    """Get an `_EntityList` from a children attribute's value.
+
+    Args:
+        value (object): the attribute's value; it could be a plain list if it's been
+            set directly, or a `FieldInfo` if it's never been set
+
+    Returns:
+        _EntityList: the value itself if it's already an `_EntityList`, otherwise a
+            new one with the same entities (if any)
+    """
+    if isinstance(value, _EntityList):
+        return value
+
+    return _EntityList(value if isinstance(value, list) else ())
+
+
 class _CanHaveChildren(_GoogleDriveEntity):
     """Mixin for entities that can have children."""
 
-    _directories: list[Directory] = PrivateAttr(default_factory=list)
-    _files: list[File] = PrivateAttr(default_factory=list)
+    # Indexed by ID, so checking for duplicates is O(1)
+    _directories: _EntityList[Directory] = PrivateAttr(default_factory=_EntityList)
+    _files: _EntityList[File] = PrivateAttr(default_factory=_EntityList)
 
     _files_loaded: bool = False
     _directories_loaded: bool = False
@@ -265,15 +377,13 @@ class _CanHaveChildren(_GoogleDriveEntity):
                 "`self.directories`.",
             )
 
-        if not isinstance(self._directories, list):
-            self._directories = [directory]
-        elif directory not in self._directories:
+        self._directories = _as_entity_list(self._directories)
+        if directory not in self._directories:
             self._directories.append(directory)
 
         if isinstance(self, Drive):
-            if not isinstance(self._all_directories, list):
-                self._all_directories = [directory]
-            elif directory not in self._all_directories:
+            self._all_directories = _as_entity_list(self._all_directories)
+            if directory not in self._all_directories:
                 self._all_directories.append(directory)
 
     def _add_file(self, file: File) -> None:
@@ -294,15 +404,13 @@ class _CanHaveChildren(_GoogleDriveEntity):
                 f"Cannot add `{file.__class__.__name__}` instance to `self.files`.",
             )
 
-        if not isinstance(self._files, list):
-            self._files = [file]
-        elif file not in self._files:
+        self._files = _as_entity_list(self._files)
+        if file not in self._files:
             self._files.append(file)
 
         if isinstance(self, Drive):
-            if not isinstance(self._all_files, list):
-                self._all_files = [file]
-            elif file not in self._all_files:
+            self._all_files = _as_entity_list(self._all_files)
+            if file not in self._all_files:
                 self._all_files.append(file)
 
     def add_child(self, child: File | Directory) -> None:
@@ -368,24 +476,32 @@ class _CanHaveChildren(_GoogleDriveEntity):
                     if child.name == directory_name:
                         return child.navigate("/".join(rest))
 
-                try:
-                    file_fields = (
-                        "*"
-                        if self.google_client.item_metadata_retrieval == IMR.ON_INIT
-                        else "id, name, parents, mimeType, kind"
+                if (drive_index := self.google_client.drive_index) is None or (
+                    item := drive_index.get_child(
+                        self.host_drive.id,
+                        self.id,
+                        directory_name,
                     )
-
-                    item = self.google_client.get_items(
-                        "/files",
-                        list_key="files",
-                        params={
-                            "pageSize": "1",
-                            "fields": f"files({file_fields})",
-                            "q": f"'{self.id}' in parents and name = '{directory_name}'",
-                        },
-                    ).pop()
-                except IndexError:
-                    raise ValueError(f"Invalid path: {path!r}") from None
+                ) is None:
+                    try:
+                        file_fields = (
+                            "*"
+                            if self.google_client.item_metadata_retrieval == IMR.ON_INIT
+                            else "id, name, parents, mimeType, kind"
+                        )
+
+                        item = self.google_client.get_items(
+                            "/files",
+                            list_key="files",
+                            params={
+                                "pageSize": "1",
+                                "fields": f"files({file_fields})",
+                                "q": f"'{self.id}' in parents and "
+                                f"name = '{directory_name}'",
+                            },
+                        ).pop()
+                    except IndexError:
+                        raise ValueError(f"Invalid path: {path!r}") from None
 
                 if item["mimeType"] == Directory.MIME_TYPE:
                     directory = Directory.from_json_response(
@@ -411,11 +527,24 @@ class _CanHaveChildren(_GoogleDriveEntity):
                 # I haven't found a way to trigger this but have kept it just in case
                 raise ValueError(f"Unprocessable path: {path!r}")
 
+    def _remove_child(self, child: File | Directory) -> None:
+        """Remove a child from this directory's children record, if it's in it.
+
+        Args:
+            child (File | Directory): the child to remove
+        """
+        children = _as_entity_list(
+            self._directories if isinstance(child, Directory) else self._files,
+        )
+
+        if child in children:
+            children.remove(child)
+
     def reset_known_children(self) -> None:
         """Reset the list of known children."""
-        self._directories = []
+        self._directories = _EntityList()
         self._directories_loaded = False
-        self._files = []
+        self._files = _EntityList()
         self._files_loaded = False
 
     def tree(self, *, local_only: bool = False, include_files: bool = False) -> str:
@@ -433,10 +562,13 @@ class _CanHaveChildren(_GoogleDriveEntity):
         Returns:
             str: the full directory tree in text form
         """
-        if not local_only:
-            self.host_drive.map(
-                map_type=EntityType.FILE if include_files else EntityType.DIRECTORY,
-            )
+        map_type = EntityType.FILE if include_files else EntityType.DIRECTORY
+
+        if local_only:
+            # Still no HTTP requests, but the tree can be rebuilt from the local index
+            self.host_drive.load_index(map_type)
+        else:
+            self.host_drive.map(map_type=map_type)
 
         output = self.name
 
@@ -502,11 +634,8 @@ class _CanHaveChildren(_GoogleDriveEntity):
         Returns:
             list[Directory | File]: The list of children.
         """
-        if not isinstance(self._directories, list):
-            self._directories = []
-
-        if not isinstance(self._files, list):
-            self._files = []
+        self._directories = _as_entity_list(self._directories)
+        self._files = _as_entity_list(self._files)
 
         return self._files + self._directories  # type: ignore[operator]
 
@@ -539,26 +668,28 @@ class _CanHaveChildren(_GoogleDriveEntity):
             # TODO: this needs to be changed to only get *new* folders - currently this
             #   will overwrite any known children, including all metadata ad further
             #   descendents
-            self._directories = sorted(
-                [
-                    Directory.from_json_response(
-                        directory,
-                        google_client=self.google_client,
-                        parent=self,
-                        host_drive=self.host_drive,
-                        _block_describe_call=True,
-                    )
-                    for directory in self.google_client.get_items(
-                        "/files",
-                        list_key="files",
-                        params={
-                            "pageSize": 1000,
-                            "q": f"mimeType = '{Directory.MIME_TYPE}'"
-                            f" and '{self.id}' in parents",
-                            "fields": f"nextPageToken, files({file_fields})",
-                        },
-                    )
-                ],
+            self._directories = _EntityList(
+                sorted(
+                    [
+                        Directory.from_json_response(
+                            directory,
+                            google_client=self.google_client,
+                            parent=self,
+                            host_drive=self.host_drive,
+                            _block_describe_call=True,
+                        )
+                        for directory in self.google_client.get_items(
+                            "/files",
+                            list_key="files",
+                            params={
+                                "pageSize": 1000,
+                                "q": f"mimeType = '{Directory.MIME_TYPE}'"
+                                f" and '{self.id}' in parents",
+                                "fields": f"nextPageToken, files({file_fields})",
+                            },
+                        )
+                    ],
+                ),
             )
 
             self._directories_loaded = True
@@ -579,25 +710,27 @@ class _CanHaveChildren(_GoogleDriveEntity):
                 else "id, name, parents, mimeType, kind"
             )
 
-            self._files = [
-                File.from_json_response(
-                    item,
-                    google_client=self.google_client,
-                    parent=self,
-                    host_drive=self.host_drive,
-                    _block_describe_call=True,
-                )
-                for item in self.google_client.get_items(
-                    "/files",
-                    list_key="files",
-                    params={
-                        "pageSize": 1000,
-                        "q": f"mimeType != '{Directory.MIME_TYPE}' and"
-                        f" '{self.id}' in parents",
-                        "fields": f"nextPageToken, files({file_fields})",
-                    },
-                )
-            ]
+            self._files = _EntityList(
+                [
+                    File.from_json_response(
+                        item,
+                        google_client=self.google_client,
+                        parent=self,
+                        host_drive=self.host_drive,
+                        _block_describe_call=True,
+                    )
+                    for item in self.google_client.get_items(
+                        "/files",
+                        list_key="files",
+                        params={
+                            "pageSize": 1000,
+                            "q": f"mimeType != '{Directory.MIME_TYPE}' and"
+                            f" '{self.id}' in parents",
+                            "fields": f"nextPageToken, files({file_fields})",
+                        },
+                    )
+                ],
+            )
 
             self._files_loaded = True
 
@@ -694,6 +827,9 @@ class File(_GoogleDriveEntity):
     writers_can_share: bool | None = Field(None, alias="writersCanShare")
 
     _description: JSONObj = PrivateAttr(default_factory=dict)
+    # Files which were retrieved together (e.g. search results), so are described
+    # together in `IMR.BATCHED` mode
+    _siblings: list[File] = PrivateAttr(default_factory=list)
     host_drive_: Drive = Field(exclude=True)
     parent_: Directory | Drive | None = Field(exclude=True)
 
@@ -720,6 +856,13 @@ class File(_GoogleDriveEntity):
                 self.describe()
                 return super().__getattribute__(name)
 
+            # If IMR is batched, load all metadata for this file and its siblings
+            if self.google_client.item_metadata_retrieval == IMR.BATCHED:
+                if not self.has_description:
+                    self.google_client.describe_files(self._batch_siblings)
+
+                return super().__getattribute__(name)
+
             # Otherwise just get the single field
             google_key = self.model_fields[name].alias or name
 
@@ -793,29 +936,81 @@ class File(_GoogleDriveEntity):
         Raises:
             ValueError: if an unexpected field is returned from the Google Drive API.
         """
-        if (
-            force_update
-            or not hasattr(self, "_description")
-            or not isinstance(self._description, dict)
-            or not self._description
-        ):
-            self._description = self.google_client.get_json_response(
-                f"/files/{self.id}",
-                params={"fields": "*", "pageSize": None},
+        if force_update or not self.has_description:
+            self._set_description(
+                self.google_client.get_json_response(
+                    f"/files/{self.id}",
+                    params={"fields": "*", "pageSize": None},
+                ),
             )
 
-            for key, value in self._description.items():
-                google_key = sub("([A-Z])", r"_\1", key).lower()
+        return self._description
 
-                try:
-                    setattr(self, google_key, value)
-                except ValueError as exc:
-                    raise ValueError(
-                        f"Received unexpected field {key!r} with value {value!r}"
-                        " from Google Drive API",
-                    ) from exc
+    @property
+    def _batch_siblings(self) -> list[File]:
+        """The files to describe alongside this one in `IMR.BATCHED` mode.
 
-        return self._description
+        Returns:
+            list[File]: this file, plus the other files retrieved with it or (failing
+                that) the other known children of its parent
+        """
+        siblings = self._siblings or (
+            [] if self.parent_ is None else self.parent_.all_known_children
+        )
+
+        return [self, *(sibling for sibling in siblings if sibling.id != self.id)]
+
+    @property
+    def has_description(self) -> bool:
+        """Whether the full description of this file has already been retrieved.
+
+        Returns:
+            bool: True if `describe` wouldn't need to make a request
+        """
+        return (
+            hasattr(self, "_description")
+            and isinstance(self._description, dict)
+            and bool(self._description)
+        )
+
+    def _apply_update(self, item: JSONObj) -> None:
+        """Update the file's attributes from a (partial) JSON response.
+
+        Args:
+            item (dict): the updated JSON for this file, e.g. from the changes feed
+        """
+        # A full description is only returned if all fields were requested
+        if self.google_client.item_metadata_retrieval == IMR.ON_INIT:
+            self._set_description(item)
+            return
+
+        # Any previous description is out of date now
+        self._description = {}
+
+        for key, value in item.items():
+            setattr(self, sub("([A-Z])", r"_\1", key).lower(), value)
+
+    def _set_description(self, description: JSONObj) -> None:
+        """Store a file's description and set its attributes from it.
+
+        Args:
+            description (dict): the description JSON for this file
+
+        Raises:
+            ValueError: if an unexpected field is returned from the Google Drive API.
+        """
+        self._description = description
+
+        for key, value in self._description.items():
+            google_key = sub("([A-Z])", r"_\1", key).lower()
+
+            try:
+                setattr(self, google_key, value)
+            except ValueError as exc:
+                raise ValueError(
+                    f"Received unexpected field {key!r} with value {value!r}"
+                    " from Google Drive API",
+                ) from exc
 
     @property
     def parent(self) -> Directory | Drive:
@@ -1040,10 +1235,12 @@ class Drive(_CanHaveChildren):
     parent_: None = Field(exclude=True, frozen=True, default=None)
     host_drive_: None = Field(exclude=True, frozen=True, default=None)
 
-    _all_directories: list[Directory] = PrivateAttr(default_factory=list)
+    # Every known directory/file in the Drive, indexed by ID for O(1) lookups
+    _all_directories: _EntityList[Directory] = PrivateAttr(default_factory=_EntityList)
     _directories_mapped: bool = False
-    _all_files: list[File] = PrivateAttr(default_factory=list)
+    _all_files: _EntityList[File] = PrivateAttr(default_factory=_EntityList)
     _files_mapped: bool = False
+    _changes_page_token: str | None = None
 
     @field_validator("kind", mode="before")
     @classmethod
@@ -1066,20 +1263,25 @@ class Drive(_CanHaveChildren):
             cls (type): The class of the entity to get.
             entity_id (str): The ID of the entity to get.
         """
-        file_fields = (
-            "*"
-            if self.google_client.item_metadata_retrieval == IMR.ON_INIT
-            else "id, name, parents, mimeType, kind"
-        )
+        if (drive_index := self.google_client.drive_index) is None or (
+            item := drive_index.get_item(self.id, entity_id)
+        ) is None:
+            file_fields = (
+                "*"
+                if self.google_client.item_metadata_retrieval == IMR.ON_INIT
+                else "id, name, parents, mimeType, kind"
+            )
 
-        return cls.from_json_response(
-            self.google_client.get_json_response(
+            item = self.google_client.get_json_response(
                 f"/files/{entity_id}",
                 params={
                     "fields": file_fields,
                     "pageSize": None,
                 },
-            ),
+            )
+
+        return cls.from_json_response(
+            item,
             google_client=self.google_client,
             host_drive=self,
             _block_describe_call=True,
@@ -1094,10 +1296,9 @@ class Drive(_CanHaveChildren):
         Returns:
             Directory: the directory with the given ID
         """
-        if isinstance(self._all_directories, list):
-            for directory in self._all_directories:
-                if directory.id == directory_id:
-                    return directory
+        self._all_directories = _as_entity_list(self._all_directories)
+        if (directory := self._all_directories.get(directory_id)) is not None:
+            return directory
 
         return self._get_entity_by_id(Directory, directory_id)
 
@@ -1110,25 +1311,144 @@ class Drive(_CanHaveChildren):
         Returns:
             File: the file with the given ID
         """
-        if isinstance(self._all_files, list):
-            for file in self._all_files:
-                if file.id == file_id:
-                    return file
+        self._all_files = _as_entity_list(self._all_files)
+        if (file := self._all_files.get(file_id)) is not None:
+            return file
 
         return self._get_entity_by_id(File, file_id)
 
-    def map(self, map_type: EntityType = EntityType.FILE) -> None:  # noqa: C901
+    def _is_mapped(self, map_type: EntityType) -> bool:
+        """Check whether the Drive has already been mapped.
+
+        Args:
+            map_type (EntityType): the type of entity to check the map of
+
+        Returns:
+            bool: whether the Drive has been mapped for the given type of entity
+        """
+        return (
+            map_type == EntityType.DIRECTORY and self._directories_mapped is True
+        ) or (map_type == EntityType.FILE and self._files_mapped is True)
+
+    def _build_tree(self, items: Iterable[JSONObj], map_type: EntityType) -> None:  # noqa: C901
+        """Build the Drive's tree from a flat listing of its items.
+
+        The items are indexed by their parent's ID, then the tree is built
+        breadth-first from the root, so the cost is linear in the number of items.
+
+        Args:
+            items (Iterable[JSONObj]): the items in the Drive
+            map_type (EntityType): the type of entity the items were listed for
+        """
+        # Index the items by their parent's ID in a single pass, so each directory's
+        # children can be looked up directly rather than rescanning every item
+        items_by_parent_id: dict[str, list[JSONObj]] = defaultdict(list)
+        for item in items:
+            if parents := item.get("parents"):
+                items_by_parent_id[parents[0]].append(item)  # type: ignore[index]
+
+        # Previously known entities aren't recreated, but they're still included
+        all_files = _EntityList(_as_entity_list(self._all_files))
+        all_directories = _EntityList(_as_entity_list(self._all_directories))
+
+        to_be_mapped: deque[_CanHaveChildren] = deque([self])
+        while to_be_mapped:
+            parent_dir = to_be_mapped.popleft()
+
+            # Children found by e.g. `navigate` aren't necessarily in the Drive's lists
+            known_child_directories = _as_entity_list(parent_dir._directories)
+            known_child_files = _as_entity_list(parent_dir._files)
+
+            for item in items_by_parent_id.pop(parent_dir.id, ()):
+                item_id: str = item["id"]  # type: ignore[assignment]
+
+                if (known_directory := all_directories.get(item_id)) is not None:
+                    to_be_mapped.append(known_directory)
+                    continue
+
+                if (known_directory := known_child_directories.get(item_id)) is not None:
+                    all_directories.append(known_directory)
+                    to_be_mapped.append(known_directory)
+                    continue
+
+                if all_files.get(item_id) is not None:
+                    continue
+
+                if (known_file := known_child_files.get(item_id)) is not None:
+                    all_files.append(known_file)
+                    continue
+
+                # Can't use `kind` here as it can be `drive#file` for directories
+                if item["mimeType"] == Directory.MIME_TYPE:
+                    directory = Directory.from_json_response(
+                        item,
+                        google_client=self.google_client,
+                        parent=parent_dir,
+                        host_drive=self,
+                        _block_describe_call=True,
+                    )
+                    parent_dir.add_child(directory)
+                    all_directories.append(directory)
+                    to_be_mapped.append(directory)
+                else:
+                    file = File.from_json_response(
+                        item,
+                        google_client=self.google_client,
+                        parent=parent_dir,
+                        host_drive=self,
+                        _block_describe_call=True,
+                    )
+                    parent_dir.add_child(file)
+                    all_files.append(file)
+
+        self._all_directories = all_directories
+        self._directories_mapped = True
+
+        if map_type != EntityType.DIRECTORY:
+            self._all_files = all_files
+            self._files_mapped = True
+
+    def load_index(self, map_type: EntityType = EntityType.FILE) -> bool:
+        """Map the Drive from the client's `drive_index`, without any HTTP requests.
+
+        Args:
+            map_type (EntityType, optional): the type of entity to map. Defaults to
+                EntityType.FILE.
+
+        Returns:
+            bool: whether the Drive is mapped, i.e. False if there's no index or the
+                Drive isn't in it
+        """
+        if self._is_mapped(map_type):
+            return True
+
+        if (drive_index := self.google_client.drive_index) is None or (
+            items := drive_index.load(self.id, map_type=map_type)
+        ) is None:
+            return False
+
+        self._changes_page_token = drive_index.get_page_token(self.id)
+        self._build_tree(items, map_type)
+
+        return True
+
+    def map(self, map_type: EntityType = EntityType.FILE) -> None:
         """Traverse the entire Drive to map its content.
 
+        If the client has a `drive_index`, the Drive is rebuilt from it when possible;
+        otherwise all items are listed from the API (and then saved to the index).
+
         Args:
             map_type (EntityType, optional): the type of entity to map. Defaults to
                 EntityType.FILE.
         """
-        if (map_type == EntityType.DIRECTORY and self._directories_mapped is True) or (
-            map_type == EntityType.FILE and self._files_mapped is True
-        ):
+        if self.load_index(map_type):
             return
 
+        # Taken before listing the items, so nothing changed mid-listing is missed by
+        # the next `sync`
+        page_token = self._get_start_page_token()
+
         # May as well get all fields in initial request if we're going to do it per
         # item anyway
         file_fields = (
@@ -1148,78 +1468,265 @@ class Drive(_CanHaveChildren):
         if map_type == EntityType.DIRECTORY:
             params["q"] = f"mimeType = '{Directory.MIME_TYPE}'"
 
-        all_items = self.google_client.get_items(
+        items: Iterable[JSONObj] = self.google_client.iter_items(
             "/files",
             list_key="files",
             params=params,
         )
-        all_files = []
-        all_directories = []
-        all_items = [item for item in all_items if "parents" in item]
 
-        known_descendent_ids = [child.id for child in self.all_known_descendents]
+        if (drive_index := self.google_client.drive_index) is not None:
+            items = list(items)
+            drive_index.save(
+                self.id,
+                items,
+                map_type=map_type,
+                page_token=page_token,
+            )
 
-        def build_sub_structure(
-            parent_dir: _CanHaveChildren,
-        ) -> None:
-            """Build the sub-structure a given directory recursively.
+        self._changes_page_token = page_token
+        self._build_tree(items, map_type)
 
-            Args:
-                parent_dir (_CanHaveChildren): the parent directory to build the
-                    sub-structure for
-            """
-            nonlocal all_items
+    def _get_start_page_token(self) -> str:
+        """Get a token for the changes feed, from which to track future changes.
 
-            remaining_items = []
+        Returns:
+            str: the changes feed's current start page token
+        """
+        return self.google_client.get_json_response(  # type: ignore[return-value]
+            "/changes/startPageToken",
+            params={"fields": "startPageToken", "pageSize": None},
+        )["startPageToken"]
 
-            to_be_mapped = []
-            for item in all_items:
-                try:
-                    if parent_dir.id != item["parents"][0]:  # type: ignore[index]
-                        remaining_items.append(item)
-                        continue
-                except LookupError:  # pragma: no cover
-                    continue
+    def _reset_map(self) -> None:
+        """Forget the Drive's mapped content, so it can be mapped from scratch."""
+        self.reset_known_children()
+        self._all_directories = _EntityList()
+        self._directories_mapped = False
+        self._all_files = _EntityList()
+        self._files_mapped = False
+        self._changes_page_token = None
 
-                if item["id"] in known_descendent_ids:
-                    if item["mimeType"] == Directory.MIME_TYPE:
-                        to_be_mapped.append(self.get_directory_by_id(item["id"]))  # type: ignore[arg-type]
+    def _apply_change(
+        self,
+        change: JSONObj,
+        removed_ids: set[str],
+        updated_items: dict[str, JSONObj],
+    ) -> bool:
+        """Apply a single entry from the changes feed to the Drive's tree.
 
-                # Can't use `kind` here as it can be `drive#file` for directories
-                elif item["mimeType"] == Directory.MIME_TYPE:
-                    directory = Directory.from_json_response(
-                        item,
-                        google_client=self.google_client,
-                        parent=parent_dir,
-                        host_drive=self,
-                        _block_describe_call=True,
-                    )
-                    parent_dir.add_child(directory)
-                    all_directories.append(directory)
-                    to_be_mapped.append(directory)
-                else:
-                    file = File.from_json_response(
-                        item,
-                        google_client=self.google_client,
-                        parent=parent_dir,
-                        host_drive=self,
-                        _block_describe_call=True,
-                    )
-                    parent_dir.add_child(file)
-                    all_files.append(file)
+        Args:
+            change (dict): the change to apply
+            removed_ids (set[str]): the IDs of entities removed so far; added to if
+                this change removes an entity
+            updated_items (dict[str, JSONObj]): the items added/updated so far, keyed by
+                ID; added to if this change adds or updates an entity
 
-            all_items = remaining_items
-            for directory in to_be_mapped:
-                build_sub_structure(directory)
+        Returns:
+            bool: False if the change's parent isn't (yet) known, True otherwise
+        """
+        item_id: str = change["fileId"]  # type: ignore[assignment]
+        item: JSONObj | None = change.get("file")  # type: ignore[assignment]
 
-        build_sub_structure(self)
+        known_entity: File | Directory | None = self._all_directories.get(
+            item_id,
+        ) or self._all_files.get(item_id)
 
-        self._all_directories = all_directories
-        self._directories_mapped = True
+        if change.get("removed") or item is None or item.get("trashed"):
+            if known_entity is not None:
+                self._detach(known_entity, removed_ids)
 
-        if map_type != EntityType.DIRECTORY:
-            self._all_files = all_files
-            self._files_mapped = True
+            return True
+
+        parent_id: str | None = (
+            parents[0] if (parents := item.get("parents")) else None  # type: ignore[index]
+        )
+        parent: Drive | Directory | None = (
+            self
+            if parent_id == self.id
+            else None
+            if parent_id is None or parent_id in removed_ids
+            else self._all_directories.get(parent_id)
+        )
+
+        if parent is None:
+            return False
+
+        # It may have been moved out of a directory which has since been removed
+        removed_ids.discard(item_id)
+        updated_items[item_id] = item
+
+        # Children of the Drive itself are added to `_all_*` by `add_child`, which
+        # `from_json_response` calls
+        if known_entity is None:
+            if item["mimeType"] == Directory.MIME_TYPE:
+                directory = Directory.from_json_response(
+                    item,
+                    google_client=self.google_client,
+                    parent=parent,
+                    host_drive=self,
+                    _block_describe_call=True,
+                )
+                if parent is not self:
+                    self._all_directories.append(directory)
+            elif self._files_mapped:
+                file = File.from_json_response(
+                    item,
+                    google_client=self.google_client,
+                    parent=parent,
+                    host_drive=self,
+                    _block_describe_call=True,
+                )
+                if parent is not self:
+                    self._all_files.append(file)
+            else:
+                # Only directories are mapped (and indexed)
+                del updated_items[item_id]
+
+            return True
+
+        if (previous_parent := known_entity.parent_) is not None:
+            previous_parent._remove_child(known_entity)
+
+        known_entity.parent_ = None
+        known_entity._apply_update(item)
+        known_entity.parent_ = parent
+        parent.add_child(known_entity)
+
+        return True
+
+    def _detach(self, entity: File | Directory, removed_ids: set[str]) -> None:
+        """Remove an entity from its parent, and mark it and its descendents as removed.
+
+        Args:
+            entity (File | Directory): the entity to remove
+            removed_ids (set[str]): the IDs of entities removed so far
+        """
+        if entity.parent_ is not None:
+            entity.parent_._remove_child(entity)
+
+        to_be_removed: list[File | Directory] = [entity]
+        while to_be_removed:
+            removed_entity = to_be_removed.pop()
+            removed_ids.add(removed_entity.id)
+
+            if isinstance(removed_entity, Directory):
+                to_be_removed.extend(removed_entity.all_known_children)
+
+    def _get_changes(self, page_token: str) -> tuple[list[JSONObj], str]:
+        """Get the changes made to the Drive's items since the given token.
+
+        Args:
+            page_token (str): the changes feed token to start from
+
+        Returns:
+            list[JSONObj]: the latest change to each item, in the order they were made
+            str: the token to get any subsequent changes from
+        """
+        file_fields = (
+            "*"
+            if self.google_client.item_metadata_retrieval == IMR.ON_INIT
+            else "id, name, parents, mimeType, kind, trashed"
+        )
+
+        # Only the latest change to each item matters
+        changes: dict[str, JSONObj] = {}
+        while True:
+            res = self.google_client.get_json_response(
+                "/changes",
+                params={
+                    "pageToken": page_token,
+                    "pageSize": 1000,
+                    "fields": "nextPageToken, newStartPageToken, "
+                    f"changes(changeType, fileId, removed, file({file_fields}))",
+                },
+            )
+
+            page: list[JSONObj] = res.get("changes", [])  # type: ignore[assignment]
+            for change in page:
+                # Shared drives themselves can change too, but their items can't
+                if change.get("changeType", "file") == "file":
+                    item_id: str = change["fileId"]  # type: ignore[assignment]
+                    changes.pop(item_id, None)
+                    changes[item_id] = change
+
+            if not (next_page_token := res.get("nextPageToken")):
+                return list(changes.values()), res["newStartPageToken"]  # type: ignore[return-value]
+
+            page_token = next_page_token  # type: ignore[assignment]
+
+    def sync(self) -> None:
+        """Apply the changes made to the Drive since it was mapped (or last synced).
+
+        Only the additions, moves, renames and deletions reported by the Drive changes
+        feed are applied to the mapped tree (and the client's `drive_index`), which
+        is far cheaper than mapping the whole Drive again. If the Drive hasn't been
+        mapped yet, it's mapped instead.
+        """
+        if self._changes_page_token is None:
+            map_type = (
+                EntityType.FILE
+                if self._files_mapped or not self._directories_mapped
+                else EntityType.DIRECTORY
+            )
+
+            # Mapped without a token (e.g. from an old index), so there's no way of
+            # knowing what's changed since
+            if self._directories_mapped:
+                self._reset_map()
+
+                if (drive_index := self.google_client.drive_index) is not None:
+                    drive_index.delete(self.id)
+
+            self.map(map_type)
+            return
+
+        changes, page_token = self._get_changes(self._changes_page_token)
+
+        removed_ids: set[str] = set()
+        updated_items: dict[str, JSONObj] = {}
+
+        # Items can be listed before their (new) parent, so keep going until there's
+        # nothing left which can be applied
+        pending = changes
+        while pending:
+            deferred = [
+                change
+                for change in pending
+                if not self._apply_change(change, removed_ids, updated_items)
+            ]
+
+            if len(deferred) == len(pending):
+                break
+
+            pending = deferred
+
+        # Anything left has been moved out of the Drive (or was never in it)
+        for change in pending:
+            self._apply_change(
+                {"fileId": change["fileId"], "removed": True},
+                removed_ids,
+                updated_items,
+            )
+
+        if removed_ids:
+            self._all_directories = _EntityList(
+                directory
+                for directory in self._all_directories
+                if directory.id not in removed_ids
+            )
+            self._all_files = _EntityList(
+                file for file in self._all_files if file.id not in removed_ids
+            )
+
+        self._changes_page_token = page_token
+
+        if (drive_index := self.google_client.drive_index) is not None:
+            drive_index.apply_changes(
+                self.id,
+                updated_items=updated_items.values(),
+                removed_ids=removed_ids,
+                page_token=page_token,
+            )
 
     def search(
         self,
@@ -1233,6 +1740,9 @@ class Drive(_CanHaveChildren):
     ) -> list[File | Directory]:
         """Search for files and directories in the Drive.
 
+        If the client has a `drive_index` which holds this Drive, searches by name are
+        answered from it, without any HTTP requests.
+
         Args:
             term (str): the term to search for
             entity_type (EntityType | None, optional): the type of
@@ -1285,13 +1795,29 @@ class Drive(_CanHaveChildren):
 
         params["q"] = " and ".join(query_conditions)
 
-        all_items = self.google_client.get_items(
-            "/files",
-            list_key="files",
-            params=params,
-        )
+        items: Iterable[JSONObj] | None = None
 
-        return [
+        # The index doesn't necessarily have items' created times
+        if created_range is None and (drive_index := self.google_client.drive_index):
+            items = drive_index.search(
+                self.id,
+                term,
+                entity_type=entity_type,
+                max_results=max_results,
+                exact_match=exact_match,
+            )
+
+        if items is None:
+            # Pages are fetched lazily, so only as many are requested as are needed to
+            # find `max_results` matches
+            items = self.google_client.iter_items(
+                "/files",
+                list_key="files",
+                params=params,
+                max_items=max_results,
+            )
+
+        results: list[File | Directory] = [
             (
                 Directory if item["mimeType"] == Directory.MIME_TYPE else File
             ).from_json_response(
@@ -1300,9 +1826,14 @@ class Drive(_CanHaveChildren):
                 google_client=self.google_client,
                 _block_describe_call=True,
             )
-            for item in all_items
+            for item in items
         ]
 
+        for result in results:
+            result._siblings = results
+
+        return results
+
     @property
     def all_known_descendents(self) -> list[Directory | File]:
         """Get all known children of this directory.
@@ -1313,11 +1844,8 @@ class Drive(_CanHaveChildren):
         Returns:
             list[Directory | File]: The list of children.
         """
-        if not isinstance(self._all_directories, list):
-            self._all_directories = []
-
-        if not isinstance(self._all_files, list):
-            self._all_files = []
+        self._all_directories = _as_entity_list(self._all_directories)
+        self._all_files = _as_entity_list(self._all_files)
 
         return self._all_files + self._all_directories  # type: ignore[operator]
 
@@ -1354,11 +1882,17 @@ class ItemMetadataRetrieval(StrEnum):
         ON_INIT (str): retrieves metadata on instance initialisation. Increases memory
             usage, makes the fewest HTTP requests. If combined with a `Drive.map` call,
             it can be used to preload all metadata for the entire Drive.
+        BATCHED (str): retrieves all metadata items on the first request for _any_
+            metadata value, for the file and all of its siblings (i.e. the rest of its
+            directory's known children, or of the search results it came from) at
+            once, using batch requests. Best for reading the same values from many
+            files, e.g. when iterating over a directory.
     """
 
     ON_DEMAND = "on_demand"
     ON_FIRST_REQUEST = "on_first_request"
     ON_INIT = "on_init"
+    BATCHED = "batched"
 
 
 IMR = ItemMetadataRetrieval
@@ -1373,6 +1907,7 @@ class GoogleDriveClient(GoogleClient[JSONObj]):
     """
 
     BASE_URL = "https://www.googleapis.com/drive/v3"
+    BATCH_URL = "https://www.googleapis.com/batch/drive/v3"
 
     DEFAULT_SCOPES: ClassVar[list[str]] = [
         "https://www.googleapis.com/auth/drive",
@@ -1384,6 +1919,10 @@ class GoogleDriveClient(GoogleClient[JSONObj]):
         "https://www.googleapis.com/auth/drive.photos.readonly",
     ]
 
+    # Where mapped Drives are persisted, so they can be rehydrated without listing
+    # every item again; can be set per class or per instance
+    drive_index: DriveIndex | None = None
+
     _my_drive: Drive
 
     def __init__(  # noqa: PLR0913
@@ -1419,6 +1958,47 @@ class GoogleDriveClient(GoogleClient[JSONObj]):
 
         self.item_metadata_retrieval = item_metadata_retrieval
 
+    def describe_files(
+        self,
+        files: Iterable[File],
+        /,
+        *,
+        force_update: bool = False,
+    ) -> None:
+        """Describe many files at once, using batch requests.
+
+        This is equivalent to calling `File.describe` on each file, but with up to
+        `BATCH_MAX_SIZE` files described per HTTP request.
+
+        Args:
+            files (Iterable[File]): the files (and/or directories) to describe
+            force_update (bool): re-pull the descriptions from Google Drive, even if we
+                already have them locally
+
+        Raises:
+            HTTPError: if any of the files couldn't be described (and
+                `validate_request_success` is set)
+        """
+        to_describe = [file for file in files if force_update or not file.has_description]
+
+        responses = self.batch(
+            BatchRequest(
+                "GET",
+                f"/files/{file.id}",
+                params={"fields": "*", "pageSize": None},
+            )
+            for file in to_describe
+        )
+
+        for file, res in zip(to_describe, responses, strict=True):
+            if not res.ok:
+                if self.validate_request_success:
+                    res.raise_for_status()
+
+                continue
+
+            file._set_description(json_loads(res.content))
+
     @property
     def my_drive(self) -> Drive:
         """User's personal Drive.
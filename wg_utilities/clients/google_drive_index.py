@@ -0,0 +1,381 @@
+"""Persistent local index of a Google Drive's mapped content."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from time import time
+from typing import TYPE_CHECKING
+
+from wg_utilities.clients.google_drive import Directory, EntityType
+from wg_utilities.functions.file_management import force_mkdir
+from wg_utilities.functions.json import json_dumps, json_loads
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+    from datetime import timedelta
+    from pathlib import Path
+
+    from wg_utilities.functions.json import JSONObj
+
+
+class DriveIndex:
+    """SQLite index of the items found by `Drive.map`, so they can be rehydrated.
+
+    Each item is stored as it was returned by the API (i.e. with whichever fields were
+    requested), keyed by its Drive's ID, so one database can hold many Drives. Once a
+    Drive has been indexed, `Drive.map` rebuilds its tree from the index instead of
+    listing every item again, and lookups by ID, name or path can be answered without
+    any HTTP requests. The Drive's changes feed token is stored alongside its items, so
+    `Drive.sync` can bring the index up to date incrementally.
+
+    Args:
+        path (Path): the path to the database file
+        max_age (timedelta): how long an indexed Drive is valid for; older indexes
+            are ignored (and replaced on the next `Drive.map` call). Defaults to no
+            limit.
+    """
+
+    DRIVES_TABLE_NAME = "drives"
+    ITEMS_TABLE_NAME = "drive_items"
+
+    def __init__(self, path: Path, /, *, max_age: timedelta | None = None):
+        self.path = path
+        self.max_age = max_age
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.DRIVES_TABLE_NAME} "
+                "(drive_id TEXT PRIMARY KEY, map_type TEXT NOT NULL, "
+                "mapped_at REAL NOT NULL, page_token TEXT)",
+            )
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.ITEMS_TABLE_NAME} "
+                "(drive_id TEXT NOT NULL, id TEXT NOT NULL, parent_id TEXT, "
+                "name TEXT NOT NULL, mime_type TEXT NOT NULL, item TEXT NOT NULL, "
+                "PRIMARY KEY (drive_id, id))",
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.ITEMS_TABLE_NAME}_parent "
+                f"ON {self.ITEMS_TABLE_NAME} (drive_id, parent_id, name)",
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(force_mkdir(self.path, path_is_file=True))
+
+    def _indexed_map_type(
+        self,
+        conn: sqlite3.Connection,
+        drive_id: str,
+    ) -> EntityType | None:
+        """Get the type of map which is indexed for a Drive, if it's still valid.
+
+        Args:
+            conn (sqlite3.Connection): the database connection to use
+            drive_id (str): the ID of the Drive
+
+        Returns:
+            EntityType: the indexed map type, or None if the Drive isn't indexed (or
+                its index has expired)
+        """
+        row = conn.execute(
+            f"SELECT map_type, mapped_at FROM {self.DRIVES_TABLE_NAME} "  # noqa: S608
+            "WHERE drive_id = ?",
+            (drive_id,),
+        ).fetchone()
+
+        if row is None or (
+            self.max_age is not None and time() - row[1] > self.max_age.total_seconds()
+        ):
+            return None
+
+        return EntityType(row[0])
+
+    def _covers(
+        self,
+        conn: sqlite3.Connection,
+        drive_id: str,
+        map_type: EntityType,
+    ) -> bool:
+        """Check whether the index holds (at least) the given map type for a Drive.
+
+        Args:
+            conn (sqlite3.Connection): the database connection to use
+            drive_id (str): the ID of the Drive
+            map_type (EntityType): the type of map needed
+
+        Returns:
+            bool: whether the index can be used for the given map type
+        """
+        return self._indexed_map_type(conn, drive_id) in (EntityType.FILE, map_type)
+
+    def save(
+        self,
+        drive_id: str,
+        items: Iterable[JSONObj],
+        /,
+        *,
+        map_type: EntityType,
+        page_token: str | None = None,
+    ) -> None:
+        """Index a Drive's items, replacing anything previously indexed for it.
+
+        Args:
+            drive_id (str): the ID of the Drive
+            items (Iterable[JSONObj]): the items in the Drive, as returned by the API
+            map_type (EntityType): the type of map the items are from, i.e. whether
+                they include files or only directories
+            page_token (str): the changes feed token from just before the items were
+                listed
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"DELETE FROM {self.ITEMS_TABLE_NAME} WHERE drive_id = ?",  # noqa: S608
+                (drive_id,),
+            )
+            self._insert_items(conn, drive_id, items)
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.DRIVES_TABLE_NAME} "  # noqa: S608
+                "(drive_id, map_type, mapped_at, page_token) VALUES (?, ?, ?, ?)",
+                (drive_id, map_type.value, time(), page_token),
+            )
+
+    def _insert_items(
+        self,
+        conn: sqlite3.Connection,
+        drive_id: str,
+        items: Iterable[JSONObj],
+    ) -> None:
+        """Insert (or replace) items in the index.
+
+        Args:
+            conn (sqlite3.Connection): the database connection to use
+            drive_id (str): the ID of the Drive
+            items (Iterable[JSONObj]): the items to insert
+        """
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {self.ITEMS_TABLE_NAME} "  # noqa: S608
+            "(drive_id, id, parent_id, name, mime_type, item) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    drive_id,
+                    item["id"],
+                    parents[0] if (parents := item.get("parents")) else None,  # type: ignore[index]
+                    item["name"],
+                    item["mimeType"],
+                    json_dumps(item),
+                )
+                for item in items
+            ),
+        )
+
+    def apply_changes(
+        self,
+        drive_id: str,
+        /,
+        *,
+        updated_items: Iterable[JSONObj],
+        removed_ids: Iterable[str],
+        page_token: str,
+    ) -> None:
+        """Update an indexed Drive with the changes since it was last indexed/synced.
+
+        Args:
+            drive_id (str): the ID of the Drive
+            updated_items (Iterable[JSONObj]): items which have been added, moved or
+                renamed
+            removed_ids (Iterable[str]): the IDs of items which have been removed
+            page_token (str): the changes feed token to sync from next time
+        """
+        with closing(self._connect()) as conn, conn:
+            self._insert_items(conn, drive_id, updated_items)
+            conn.executemany(
+                f"DELETE FROM {self.ITEMS_TABLE_NAME} "  # noqa: S608
+                "WHERE drive_id = ? AND id = ?",
+                ((drive_id, item_id) for item_id in removed_ids),
+            )
+            conn.execute(
+                f"UPDATE {self.DRIVES_TABLE_NAME} SET page_token = ? "  # noqa: S608
+                "WHERE drive_id = ?",
+                (page_token, drive_id),
+            )
+
+    def get_page_token(self, drive_id: str, /) -> str | None:
+        """Get the changes feed token to sync an indexed Drive from.
+
+        Args:
+            drive_id (str): the ID of the Drive
+
+        Returns:
+            str: the token, or None if the Drive isn't indexed (or has no token)
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f"SELECT page_token FROM {self.DRIVES_TABLE_NAME} "  # noqa: S608
+                "WHERE drive_id = ?",
+                (drive_id,),
+            ).fetchone()
+
+        return None if row is None else row[0]
+
+    def load(
+        self,
+        drive_id: str,
+        /,
+        *,
+        map_type: EntityType = EntityType.FILE,
+    ) -> list[JSONObj] | None:
+        """Load a Drive's indexed items.
+
+        Args:
+            drive_id (str): the ID of the Drive
+            map_type (EntityType): the type of map to load the items for. Defaults to
+                EntityType.FILE.
+
+        Returns:
+            list[JSONObj]: the indexed items (in the order they were saved), or None if
+                the Drive isn't indexed for the given map type
+        """
+        with closing(self._connect()) as conn:
+            if not self._covers(conn, drive_id, map_type):
+                return None
+
+            query = f"SELECT item FROM {self.ITEMS_TABLE_NAME} WHERE drive_id = ?"  # noqa: S608
+            params: tuple[str, ...] = (drive_id,)
+
+            if map_type == EntityType.DIRECTORY:
+                query += " AND mime_type = ?"
+                params += (Directory.MIME_TYPE,)
+
+            rows = conn.execute(f"{query} ORDER BY rowid", params).fetchall()
+
+        return [json_loads(row[0]) for row in rows]
+
+    def get_item(self, drive_id: str, item_id: str, /) -> JSONObj | None:
+        """Get a single indexed item by its ID.
+
+        Args:
+            drive_id (str): the ID of the Drive
+            item_id (str): the ID of the item
+
+        Returns:
+            JSONObj: the item, or None if it isn't in the index
+        """
+        with closing(self._connect()) as conn:
+            if self._indexed_map_type(conn, drive_id) is None:
+                return None
+
+            row = conn.execute(
+                f"SELECT item FROM {self.ITEMS_TABLE_NAME} "  # noqa: S608
+                "WHERE drive_id = ? AND id = ?",
+                (drive_id, item_id),
+            ).fetchone()
+
+        return None if row is None else json_loads(row[0])
+
+    def get_child(self, drive_id: str, parent_id: str, name: str, /) -> JSONObj | None:
+        """Get an indexed item by its parent's ID and its name.
+
+        Args:
+            drive_id (str): the ID of the Drive
+            parent_id (str): the ID of the item's parent
+            name (str): the name of the item
+
+        Returns:
+            JSONObj: the item, or None if it isn't in the index
+        """
+        with closing(self._connect()) as conn:
+            if self._indexed_map_type(conn, drive_id) is None:
+                return None
+
+            row = conn.execute(
+                f"SELECT item FROM {self.ITEMS_TABLE_NAME} "  # noqa: S608
+                "WHERE drive_id = ? AND parent_id = ? AND name = ? ORDER BY rowid",
+                (drive_id, parent_id, name),
+            ).fetchone()
+
+        return None if row is None else json_loads(row[0])
+
+    def search(
+        self,
+        drive_id: str,
+        term: str,
+        /,
+        *,
+        entity_type: EntityType | None = None,
+        max_results: int = 50,
+        exact_match: bool = False,
+    ) -> list[JSONObj] | None:
+        """Search the indexed items by name.
+
+        Like the API's `name contains` queries, non-exact matches are
+        case-insensitive.
+
+        Args:
+            drive_id (str): the ID of the Drive
+            term (str): the term to search for
+            entity_type (EntityType | None): the type of entity to search for, or None
+                to search for both
+            max_results (int): the maximum number of results to return
+            exact_match (bool): whether to only return items whose name is exactly
+                the search term
+
+        Returns:
+            list[JSONObj]: the matching items, or None if the Drive isn't indexed fully
+                enough to answer the search
+        """
+        with closing(self._connect()) as conn:
+            if not self._covers(
+                conn,
+                drive_id,
+                entity_type or EntityType.FILE,
+            ):
+                return None
+
+            query = f"SELECT item FROM {self.ITEMS_TABLE_NAME} WHERE drive_id = ?"  # noqa: S608
+            params: tuple[str | int, ...] = (drive_id,)
+
+            if exact_match:
+                query += " AND name = ?"
+                params += (term,)
+            else:
+                query += r" AND name LIKE ? ESCAPE '\'"
+                params += (
+                    "%"
+                    + term.replace("\\", r"\\").replace("%", r"\%").replace("_", r"\_")
+                    + "%",
+                )
+
+            if entity_type == EntityType.DIRECTORY:
+                query += " AND mime_type = ?"
+                params += (Directory.MIME_TYPE,)
+            elif entity_type == EntityType.FILE:
+                query += " AND mime_type != ?"
+                params += (Directory.MIME_TYPE,)
+
+            rows = conn.execute(
+                f"{query} ORDER BY rowid LIMIT ?",
+                (*params, max_results),
+            ).fetchall()
+
+        return [json_loads(row[0]) for row in rows]
+
+    def delete(self, drive_id: str, /) -> None:
+        """Remove a Drive from the index, if it's there.
+
+        Args:
+            drive_id (str): the ID of the Drive
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"DELETE FROM {self.ITEMS_TABLE_NAME} WHERE drive_id = ?",  # noqa: S608
+                (drive_id,),
+            )
+            conn.execute(
+                f"DELETE FROM {self.DRIVES_TABLE_NAME} WHERE drive_id = ?",  # noqa: S608
+                (drive_id,),
+            )
+
+
+__all__ = ["DriveIndex"]
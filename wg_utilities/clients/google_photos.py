@@ -6,7 +6,7 @@ from datetime import datetime  # noqa: TC003
 from enum import Enum
 from logging import DEBUG, getLogger
 from pathlib import Path
-from typing import Any, ClassVar, Literal, Self, TypeAlias
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self, TypeAlias
 
 from pydantic import Field, field_validator
 from requests import post
@@ -14,7 +14,10 @@ from typing_extensions import TypedDict
 
 from wg_utilities.clients._google import GoogleClient
 from wg_utilities.clients.oauth_client import BaseModelWithConfig
-from wg_utilities.functions import force_mkdir
+from wg_utilities.functions import chunk_list, force_mkdir
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
 
 LOGGER = getLogger(__name__)
 LOGGER.setLevel(DEBUG)
@@ -334,6 +337,10 @@ class GooglePhotosClient(GoogleClient[GooglePhotosEntityJson]):
         "https://www.googleapis.com/auth/photoslibrary.edit.appcreateddata",
     ]
 
+    # The Photos Library API has no batch endpoint, but `mediaItems:batchGet` accepts
+    # up to 50 IDs per request
+    MEDIA_ITEMS_BATCH_GET_MAX_SIZE: ClassVar[int] = 50
+
     _albums: list[Album]
     # Only really used to check if all album metadata has been fetched, not
     # available to the user (would still require caching all albums).
@@ -384,6 +391,40 @@ class GooglePhotosClient(GoogleClient[GooglePhotosEntityJson]):
 
         raise FileNotFoundError(f"Unable to find album with name {album_name!r}.")
 
+    def get_media_items_by_ids(self, media_item_ids: Iterable[str], /) -> list[MediaItem]:
+        """Get many media items by their IDs, using as few requests as possible.
+
+        Args:
+            media_item_ids (Iterable[str]): the IDs of the media items to fetch
+
+        Returns:
+            list[MediaItem]: the media items, in the same order as the IDs. Any items
+                which couldn't be retrieved are omitted.
+        """
+        media_items = []
+
+        for chunk in chunk_list(
+            list(media_item_ids),
+            self.MEDIA_ITEMS_BATCH_GET_MAX_SIZE,
+        ):
+            res = self.get_json_response(
+                "/mediaItems:batchGet",
+                params={"mediaItemIds": chunk, "pageSize": None},
+            )
+
+            for result in res.get("mediaItemResults", []):  # type: ignore[attr-defined]
+                if item := result.get("mediaItem"):
+                    media_items.append(
+                        MediaItem.from_json_response(item, google_client=self),
+                    )
+                else:
+                    LOGGER.warning(
+                        "Unable to get media item: %s",
+                        result.get("status", {}).get("message"),
+                    )
+
+        return media_items
+
     @property
     def albums(self) -> list[Album]:
         """List all albums in the active Google account.
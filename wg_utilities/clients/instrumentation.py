@@ -0,0 +1,205 @@
+"""Per-endpoint request instrumentation for `JsonApiClient`."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from re import compile as compile_regex
+from threading import Lock
+from typing import Any, Final
+from urllib.parse import urlparse
+
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+)
+"""Upper bounds (in seconds) of the latency histogram buckets."""
+
+_ID_SEGMENT = compile_regex(r"^(\d+|(?=[^/]*\d)[\w\-.=:]{12,})$")
+
+
+def endpoint_template(url: str, base_url: str | None = None) -> str:
+    """Template a request URL into its endpoint, e.g. `/playlists/{id}/tracks`.
+
+    The query string and base URL are removed, and any path segments which look like
+    IDs (i.e. are numeric, or are long and contain a digit) are replaced with `{id}`.
+
+    Args:
+        url (str): the full URL of the request
+        base_url (str): the client's base URL
+
+    Returns:
+        str: the templated endpoint
+    """
+    if base_url and url.startswith(base_url):
+        url = url[len(base_url) :]
+
+    path = urlparse(url).path if "://" in url else url.split("?", 1)[0]
+
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """Metrics for a single request made by a client."""
+
+    client: str
+    """The name of the client class which made the request."""
+
+    method: str
+    endpoint: str
+    """The templated endpoint, see `endpoint_template`."""
+
+    wall_time: float
+    """The total time taken (including retries and rate limiting), in seconds."""
+
+    ttfb: float | None
+    """The time taken to receive the (final) response's headers, in seconds."""
+
+    response_bytes: int
+    status_code: int | None
+    """The status code of the (final) response; None if the request raised an error."""
+
+    retries: int = 0
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated metrics for a single client/endpoint."""
+
+    count: int = 0
+    retries: int = 0
+    response_bytes: int = 0
+
+    wall_time_total: float = 0
+    wall_time_max: float = 0
+    ttfb_total: float = 0
+    ttfb_max: float = 0
+
+    status_codes: Counter[str] = field(default_factory=Counter)
+    """Counts of each response status code; "error" for requests which raised."""
+
+    latency_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1),
+    )
+    """Counts of wall times in each of `LATENCY_BUCKETS` (plus one for "+Inf")."""
+
+    def add(self, metrics: RequestMetrics, /) -> None:
+        """Add a request's metrics to these stats.
+
+        Args:
+            metrics (RequestMetrics): the metrics of the request
+        """
+        self.count += 1
+        self.retries += metrics.retries
+        self.response_bytes += metrics.response_bytes
+
+        self.wall_time_total += metrics.wall_time
+        self.wall_time_max = max(self.wall_time_max, metrics.wall_time)
+
+        if metrics.ttfb is not None:
+            self.ttfb_total += metrics.ttfb
+            self.ttfb_max = max(self.ttfb_max, metrics.ttfb)
+
+        self.status_codes[
+            str(metrics.status_code) if metrics.status_code is not None else "error"
+        ] += 1
+        self.latency_histogram[bisect_left(LATENCY_BUCKETS, metrics.wall_time)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get these stats as a JSON-serializable dict.
+
+        Returns:
+            dict: the stats
+        """
+        return {
+            "count": self.count,
+            "retries": self.retries,
+            "response_bytes": self.response_bytes,
+            "wall_time": {
+                "total": self.wall_time_total,
+                "mean": self.wall_time_total / self.count if self.count else 0,
+                "max": self.wall_time_max,
+                "histogram": dict(
+                    zip(
+                        [*map(str, LATENCY_BUCKETS), "+Inf"],
+                        self.latency_histogram,
+                        strict=True,
+                    ),
+                ),
+            },
+            "ttfb": {
+                "total": self.ttfb_total,
+                "mean": self.ttfb_total / self.count if self.count else 0,
+                "max": self.ttfb_max,
+            },
+            "status_codes": dict(self.status_codes),
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe, in-process registry of request metrics.
+
+    Instances are callable, so can be used directly as a client's `instrumentation`
+    hook:
+
+        >>> metrics = MetricsRegistry()
+        >>> SpotifyClient.instrumentation = metrics
+        >>> ...
+        >>> metrics.snapshot()["SpotifyClient"]["GET /playlists/{id}/tracks"]["count"]
+        42
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[str, dict[str, EndpointStats]] = {}
+        self._lock = Lock()
+
+    def __call__(self, metrics: RequestMetrics, /) -> None:
+        """Record a request's metrics.
+
+        Args:
+            metrics (RequestMetrics): the metrics of the request
+        """
+        with self._lock:
+            self._stats.setdefault(metrics.client, {}).setdefault(
+                f"{metrics.method} {metrics.endpoint}",
+                EndpointStats(),
+            ).add(metrics)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Get a (JSON-serializable) copy of the current metrics.
+
+        Returns:
+            dict: stats keyed by client name, then by "<METHOD> <endpoint>"
+        """
+        with self._lock:
+            return {
+                client: {
+                    endpoint: stats.as_dict() for endpoint, stats in endpoints.items()
+                }
+                for client, endpoints in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        with self._lock:
+            self._stats.clear()
+
+
+__all__ = [
+    "LATENCY_BUCKETS",
+    "EndpointStats",
+    "MetricsRegistry",
+    "RequestMetrics",
+    "endpoint_template",
+]
@@ -2,22 +2,170 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Mapping
+from codecs import iterdecode
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
+from dataclasses import dataclass
+from gzip import compress as gzip_compress
 from http import HTTPStatus
-from json import JSONDecodeError, dumps
+from json import JSONDecodeError
 from logging import DEBUG, getLogger
-from typing import Any, ClassVar, Generic, TypeAlias, TypeVar
+from queue import SimpleQueue
+from threading import Event, Lock, Semaphore, Thread
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Generic, TypeAlias, TypeVar
 
-from requests import Response, get, post
+from requests import Response, Session, delete, get, head, options, patch, post, put
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+from urllib3.util import make_headers
+
+from wg_utilities.clients.instrumentation import RequestMetrics, endpoint_template
+from wg_utilities.clients.rate_limiter import RateLimiter, parse_retry_after
+from wg_utilities.clients.response_cache import CachedResponse, ResponseCache
+from wg_utilities.functions.decorators import backoff
+from wg_utilities.functions.json import (
+    iter_json_array,
+    json_dumps,
+    json_dumps_bytes,
+    json_loads,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from wg_utilities.clients.async_json_api_client import AsyncJsonApiClient
+    from wg_utilities.clients.cassette import Cassette
 
 LOGGER = getLogger(__name__)
 LOGGER.setLevel(DEBUG)
 
 GetJsonResponse = TypeVar("GetJsonResponse", bound=Mapping[Any, Any])
+_Page = TypeVar("_Page")
 
 StrBytIntFlt: TypeAlias = str | bytes | int | float
 
+_SESSION_LOCK = Lock()
+
+# The HTTP verbs of the `requests` functions and `Session` methods which can be passed
+# to `JsonApiClient._request`
+_HTTP_METHOD_NAMES: Final[dict[Callable[..., Response], str]] = {
+    func: func.__name__.upper()
+    for func in (
+        delete,
+        get,
+        head,
+        options,
+        patch,
+        post,
+        put,
+        Session.delete,
+        Session.get,
+        Session.head,
+        Session.options,
+        Session.patch,
+        Session.post,
+        Session.put,
+    )
+}
+
+
+def _http_method_name(method: Callable[..., Response] | str, /) -> str:
+    """Get the HTTP verb for a request method.
+
+    Args:
+        method (Callable | str): a `requests` function (e.g. `requests.get`), a
+            `Session` method, or the verb itself (e.g. "GET")
+
+    Returns:
+        str: the uppercase HTTP verb, e.g. "GET"
+
+    Raises:
+        ValueError: if the method isn't a known `requests` function/`Session` method
+    """
+    if isinstance(method, str):
+        return method.upper()
+
+    try:
+        # Bound `Session` methods are looked up by their underlying function
+        return _HTTP_METHOD_NAMES[getattr(method, "__func__", method)]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Unknown HTTP method {method!r}, pass the HTTP verb instead (e.g. 'GET')",
+        ) from None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Declarative retry policy for the requests made by a `JsonApiClient`.
+
+    Only idempotent requests are retried, when they fail with a connection error/timeout
+    or come back with a retryable status. Retries are made via the `backoff` decorator,
+    so there's a jittered exponential delay between attempts.
+    """
+
+    max_attempts: int = 3
+    """The maximum number of attempts (including the first); 0 for no limit."""
+
+    max_delay: int = 10
+    """The maximum delay between attempts, in seconds."""
+
+    deadline: int = 60
+    """The time after which no more attempts will be made, in seconds."""
+
+    retryable_statuses: frozenset[int] = frozenset(
+        {
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        },
+    )
+    """Response statuses which should be retried."""
+
+    retryable_methods: frozenset[str] = frozenset(
+        {"DELETE", "GET", "HEAD", "OPTIONS", "PUT"},
+    )
+    """HTTP methods which are safe to retry."""
+
+    retryable_exceptions: tuple[type[Exception], ...] = (
+        RequestsConnectionError,
+        Timeout,
+    )
+    """Exceptions (raised while sending the request) which should be retried."""
+
+
+@dataclass(frozen=True)
+class GetRequest:
+    """A single GET request to be sent as part of a fan-out, see `JsonApiClient.get_many`."""
+
+    url: str
+    """The URL path to the endpoint (not necessarily including the base URL)."""
+
+    params: (
+        dict[
+            StrBytIntFlt,
+            StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+        ]
+        | None
+    ) = None
+    """Any URL parameters to send in the request."""
+
+    header_overrides: Mapping[str, str | bytes] | None = None
+    """Any headers to override the default headers."""
+
+    timeout: float | None = None
+    """Custom timeout for the request."""
+
+
+class _RetryableStatusError(Exception):
+    """Raised to trigger a retry of a request with a retryable response status."""
+
+    def __init__(self, response: Response):
+        super().__init__(f"{response.status_code} {response.reason} for {response.url}")
+        self.response = response
+
 
 class JsonApiClient(Generic[GetJsonResponse]):
     """Generic no-auth JSON API client to simplify interactions.
@@ -31,6 +179,57 @@ class JsonApiClient(Generic[GetJsonResponse]):
         dict[StrBytIntFlt, StrBytIntFlt | Iterable[StrBytIntFlt] | None]
     ] = {}
 
+    # Connection pooling config for the client's `Session`; see `HTTPAdapter`
+    SESSION_POOL_CONNECTIONS: ClassVar[int] = 10
+    SESSION_POOL_MAXSIZE: ClassVar[int] = 10
+    SESSION_POOL_BLOCK: ClassVar[bool] = False
+    SESSION_KEEP_ALIVE: ClassVar[bool] = True
+
+    # Encodings advertised via `Accept-Encoding`; responses are decoded transparently.
+    # Brotli/Zstandard are included if `brotli`/`zstandard` are installed
+    ACCEPT_ENCODING: ClassVar[str] = make_headers(accept_encoding=True)["accept-encoding"]
+
+    # Gzip request bodies of at least this many bytes; None disables compression. Only
+    # enable for servers which accept `Content-Encoding: gzip` requests: if a server
+    # responds with a 415, the request is resent uncompressed and compression is
+    # disabled for the client
+    REQUEST_COMPRESSION_MIN_SIZE: ClassVar[int | None] = None
+
+    # Client-side rate limiting, shared by all clients with the same base URL; see
+    # `RateLimiter`. 429 responses' `Retry-After` headers are honoured regardless
+    RATE_LIMIT: ClassVar[float | None] = None
+    RATE_LIMIT_BURST: ClassVar[int] = 1
+
+    # Optional cache for GET responses; can be set per class or per instance
+    response_cache: ResponseCache | None = None
+
+    # Optional retry policy for idempotent requests, e.g. `RetryPolicy()`; can be set
+    # per class or per instance
+    retry_policy: RetryPolicy | None = None
+
+    # Optional hook which is called with the metrics of every request, e.g. a
+    # `MetricsRegistry`. Plain functions should only be set per instance, otherwise
+    # they'll be bound as methods
+    instrumentation: Callable[[RequestMetrics], None] | None = None
+
+    # Share the response of identical concurrent GET requests (i.e. those with the
+    # same `ResponseCache.key`) between callers, rather than sending duplicates
+    coalesce_requests: bool = False
+
+    # Optional record/replay transport, e.g. for offline benchmarks; see `Cassette`
+    cassette: Cassette | None = None
+
+    # How many pages of a paginated listing to fetch in the background while the
+    # caller processes the current one. Defaults to 0, i.e. pages are only fetched as
+    # they're needed. Can be set per class or per instance
+    page_prefetch_depth: int = 0
+
+    _aio: AsyncJsonApiClient[GetJsonResponse]
+    _in_flight: dict[str, Future[Response]]
+    _in_flight_lock: Lock
+    _request_compression_rejected: bool = False
+    _session: Session
+
     def __init__(
         self,
         *,
@@ -42,6 +241,34 @@ class JsonApiClient(Generic[GetJsonResponse]):
         self.log_requests = log_requests
         self.validate_request_success = validate_request_success
 
+        # Coalesced requests which are currently being sent, see `_coalesce`
+        self._in_flight = {}
+        self._in_flight_lock = Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Exclude any in-flight requests and their lock, which can't be copied.
+
+        Returns:
+            dict: the instance's state, minus its in-flight requests
+        """
+        state = self.__dict__.copy()
+
+        state.pop("_in_flight", None)
+        state.pop("_in_flight_lock", None)
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the instance's state, with no requests in flight.
+
+        Args:
+            state (dict): the instance's state, from `__getstate__`
+        """
+        self.__dict__.update(state)
+
+        self._in_flight = {}
+        self._in_flight_lock = Lock()
+
     def _get(
         self,
         url: str,
@@ -125,10 +352,56 @@ class JsonApiClient(Generic[GetJsonResponse]):
             data=data,
         )
 
+    def _prepare_request(
+        self,
+        *,
+        method_name: str,
+        url: str,
+        params: (
+            dict[
+                StrBytIntFlt,
+                StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+            ]
+            | None
+        ),
+    ) -> tuple[str, dict[StrBytIntFlt, StrBytIntFlt | Iterable[StrBytIntFlt]]]:
+        """Build the full URL and parameters for a request, and log it if required.
+
+        Args:
+            method_name (str): the HTTP method being used, e.g. "GET"
+            url (str): the URL path to the endpoint (not necessarily including the
+                base URL)
+            params (dict): the parameters to be passed in the HTTP request
+
+        Returns:
+            tuple[str, dict]: the full URL and the parameters, including defaults
+        """
+        if params is not None:
+            params.update(
+                {k: v for k, v in self.DEFAULT_PARAMS.items() if k not in params},
+            )
+        else:
+            params = deepcopy(self.DEFAULT_PARAMS)
+
+        prepared_params = {k: v for k, v in params.items() if v is not None}
+
+        if url.startswith("/"):
+            url = f"{self.base_url}{url}"
+
+        if self.log_requests:
+            LOGGER.debug(
+                "%s %s: %s",
+                method_name,
+                url,
+                json_dumps(prepared_params, default=str),
+            )
+
+        return url, prepared_params
+
     def _request(
         self,
         *,
-        method: Callable[..., Response],
+        method: Callable[..., Response] | str,
         url: str,
         params: (
             dict[
@@ -141,11 +414,23 @@ class JsonApiClient(Generic[GetJsonResponse]):
         timeout: float | tuple[float, float] | tuple[float, None] | None = None,
         json: Any | None = None,
         data: Any | None = None,
+        stream: bool = False,
     ) -> Response:
         """Make a HTTP request.
 
+        The request is sent via this client's pooled `Session`; `method` is only used
+        to determine the HTTP verb, so it can be a `requests` function (e.g.
+        `requests.get`), a `Session` method, or the verb itself (e.g. "GET"). If a
+        `response_cache` is set, GET requests are served from/revalidated against it.
+
+        Requests are paced by the client's `rate_limiter`; if the server responds with
+        a 429, further requests to the same base URL are paused for as long as its
+        `Retry-After` header specifies. Idempotent requests are retried as per the
+        client's `retry_policy`. If `coalesce_requests` is set, concurrent identical GET
+        requests share a single HTTP call.
+
         Args:
-            method (Callable): the HTTP method to use
+            method (Callable | str): the HTTP method to use
             url (str): the URL path to the endpoint (not necessarily including the
                 base URL)
             params (dict): the parameters to be passed in the HTTP request
@@ -154,47 +439,415 @@ class JsonApiClient(Generic[GetJsonResponse]):
                 timeout for the request
             json (dict): the data to be passed in the HTTP request
             data (dict): the data to be passed in the HTTP request
+            stream (bool): don't download the response body immediately; streamed
+                responses are never cached
         """
-        if params is not None:
-            params.update(
-                {k: v for k, v in self.DEFAULT_PARAMS.items() if k not in params},
+        method_name = _http_method_name(method)
+
+        url, prepared_params = self._prepare_request(
+            method_name=method_name,
+            url=url,
+            params=params,
+        )
+
+        send_kwargs: dict[str, Any] = {
+            "params": prepared_params,
+            "timeout": timeout,
+            "json": json,
+            "data": data,
+            "stream": stream,
+        }
+
+        if (
+            self.coalesce_requests
+            and method_name == "GET"
+            and not stream
+            and header_overrides is None
+            and json is None
+            and data is None
+        ):
+            res = self._coalesce(
+                ResponseCache.key(method_name, url, prepared_params),
+                lambda: self._send_with_cache(method_name, url, None, **send_kwargs),
             )
         else:
-            params = deepcopy(self.DEFAULT_PARAMS)
+            res = self._send_with_compression(
+                method_name,
+                url,
+                header_overrides,
+                **send_kwargs,
+            )
 
-        params = {k: v for k, v in params.items() if v is not None}
+        if self.validate_request_success:
+            res.raise_for_status()
 
-        if url.startswith("/"):
-            url = f"{self.base_url}{url}"
+        return res
 
-        if self.log_requests:
-            LOGGER.debug(
-                "%s %s: %s",
-                method.__name__.upper(),
-                url,
-                dumps(params, default=str),
+    def _compress_request_body(self, *, json: Any, data: Any) -> bytes | None:
+        """Gzip a request's body, if compression is enabled and the body is big enough.
+
+        Args:
+            json (Any): the JSON body of the request
+            data (Any): the raw body of the request; form data isn't compressed
+
+        Returns:
+            bytes: the compressed body, or None if it shouldn't be compressed
+        """
+        if (
+            self.REQUEST_COMPRESSION_MIN_SIZE is None
+            or self._request_compression_rejected
+        ):
+            return None
+
+        if json is not None:
+            body = json_dumps_bytes(json)
+        elif isinstance(data, str):
+            body = data.encode()
+        elif isinstance(data, bytes):
+            body = data
+        else:
+            return None
+
+        if len(body) < self.REQUEST_COMPRESSION_MIN_SIZE:
+            return None
+
+        # Level 6 is zlib's default; higher levels are much slower for little gain
+        return gzip_compress(body, compresslevel=6)
+
+    def _send_with_compression(
+        self,
+        method_name: str,
+        url: str,
+        header_overrides: Mapping[str, str | bytes] | None,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request, gzipping its body as per `REQUEST_COMPRESSION_MIN_SIZE`.
+
+        Args:
+            method_name (str): the HTTP method to use, e.g. "GET"
+            url (str): the full URL of the request
+            header_overrides (dict): any headers to override the default headers
+            **kwargs (Any): any other arguments for `Session.request`
+
+        Returns:
+            Response: the response from the server
+        """
+        if (
+            compressed := self._compress_request_body(
+                json=kwargs["json"],
+                data=kwargs["data"],
             )
+        ) is None:
+            return self._send_with_cache(method_name, url, header_overrides, **kwargs)
 
-        res = method(
-            url,
-            headers=(
+        headers = {
+            **(
+                {"Content-Type": "application/json"} if kwargs["json"] is not None else {}
+            ),
+            **(
                 header_overrides if header_overrides is not None else self.request_headers
             ),
-            params=params,
-            timeout=timeout,
-            json=json,
-            data=data,
+            "Content-Encoding": "gzip",
+        }
+
+        res = self._send_with_cache(
+            method_name,
+            url,
+            headers,
+            **{**kwargs, "json": None, "data": compressed},
         )
 
-        if self.validate_request_success:
-            res.raise_for_status()
+        if res.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE:
+            LOGGER.warning(
+                "Compressed request rejected by %s, disabling request compression",
+                url,
+            )
+            self._request_compression_rejected = True
+            res = self._send_with_cache(method_name, url, header_overrides, **kwargs)
+
+        return res
+
+    def _send_with_cache(
+        self,
+        method_name: str,
+        url: str,
+        header_overrides: Mapping[str, str | bytes] | None,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request, serving it from/revalidating it against the response cache.
+
+        Args:
+            method_name (str): the HTTP method to use, e.g. "GET"
+            url (str): the full URL of the request
+            header_overrides (dict): any headers to override the default headers
+            **kwargs (Any): any other arguments for `Session.request`
+
+        Returns:
+            Response: the response, from the server or the cache
+        """
+        headers = (
+            header_overrides if header_overrides is not None else self.request_headers
+        )
+
+        cache_key = cached = None
+        if (
+            self.response_cache is not None
+            and method_name == "GET"
+            and not kwargs.get("stream")
+        ):
+            # Keyed on the headers too, so different users' responses aren't mixed up
+            cache_key = self.response_cache.key(
+                method_name,
+                url,
+                kwargs["params"],
+                headers,
+            )
+
+            if (cached := self.response_cache.get(cache_key)) is not None:
+                if cached.is_fresh:
+                    return cached.to_response()
+
+                headers = {**headers, **cached.conditional_headers()}
+
+        res = self._send_with_retries(method_name, url, headers=headers, **kwargs)
+
+        if cache_key is not None:
+            res = self._update_response_cache(
+                self.response_cache,  # type: ignore[arg-type]
+                cache_key,
+                cached,
+                res,
+            )
+
+        return res
+
+    def _coalesce(self, key: str, send: Callable[[], Response]) -> Response:
+        """Send a request, unless an identical one is already in flight.
+
+        The first caller for a given key sends the request; any callers (e.g. in other
+        threads) with the same key which arrive before it completes wait for, and
+        share, its response (or exception).
+
+        Args:
+            key (str): the identity of the request, as per `ResponseCache.key`
+            send (Callable): the function which sends the request
+
+        Returns:
+            Response: the (shared) response
+        """
+        with self._in_flight_lock:
+            if (future := self._in_flight.get(key)) is not None:
+                is_leader = False
+            else:
+                future = self._in_flight[key] = Future()
+                is_leader = True
+
+        if not is_leader:
+            LOGGER.debug("Waiting for in-flight request: %s", key)
+            return future.result()
+
+        try:
+            future.set_result(send())
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+        return future.result()
+
+    def _send(self, method_name: str, url: str, **kwargs: Any) -> Response:
+        """Send a single request via the session, respecting the rate limiter.
+
+        Args:
+            method_name (str): the HTTP method to use, e.g. "GET"
+            url (str): the full URL of the request
+            **kwargs (Any): any other arguments for `Session.request`
+
+        Returns:
+            Response: the response from the server
+        """
+        self.rate_limiter.acquire()
+
+        if self.cassette is not None:
+            res = self.cassette.send(self.session, method_name, url, **kwargs)
+        else:
+            res = self.session.request(method_name, url, **kwargs)
+
+        self._handle_rate_limit_response(res.status_code, res.headers)
+
+        return res
+
+    def _send_with_retries(self, method_name: str, url: str, **kwargs: Any) -> Response:
+        """Send a request, retrying it as per the client's `retry_policy`.
+
+        If the retries are exhausted on a retryable status, the last response is
+        returned so that it can be validated as normal. The request's metrics are
+        passed to the client's `instrumentation` hook (if set).
+
+        Args:
+            method_name (str): the HTTP method to use, e.g. "GET"
+            url (str): the full URL of the request
+            **kwargs (Any): any other arguments for `Session.request`
+
+        Returns:
+            Response: the (final) response from the server
+        """
+        policy = self.retry_policy
+        if policy is not None and method_name not in policy.retryable_methods:
+            policy = None
+
+        attempts = 0
+
+        def _send_or_raise() -> Response:
+            nonlocal attempts
+            attempts += 1
+
+            res = self._send(method_name, url, **kwargs)
+
+            if policy is not None and res.status_code in policy.retryable_statuses:
+                raise _RetryableStatusError(res)
+
+            return res
+
+        if policy is not None:
+            _send_or_raise = backoff(
+                (_RetryableStatusError, *policy.retryable_exceptions),
+                logger=LOGGER,
+                max_tries=policy.max_attempts,
+                max_delay=policy.max_delay,
+                timeout=policy.deadline,
+            )(_send_or_raise)
+
+        start_time = perf_counter()
+
+        try:
+            res = _send_or_raise()
+        except _RetryableStatusError as exc:
+            res = exc.response
+        except Exception:
+            self._record_request_metrics(
+                method_name,
+                url,
+                start_time=start_time,
+                attempts=attempts,
+            )
+            raise
+
+        if self.instrumentation is not None:
+            self._record_request_metrics(
+                method_name,
+                url,
+                start_time=start_time,
+                attempts=attempts,
+                status_code=res.status_code,
+                ttfb=res.elapsed.total_seconds(),
+                response_bytes=(
+                    int(res.headers.get("Content-Length", 0))
+                    if kwargs.get("stream")
+                    else len(res.content)
+                ),
+            )
+
+        return res
+
+    def _record_request_metrics(
+        self,
+        method_name: str,
+        url: str,
+        *,
+        start_time: float,
+        attempts: int = 1,
+        status_code: int | None = None,
+        ttfb: float | None = None,
+        response_bytes: int = 0,
+    ) -> None:
+        """Pass a request's metrics to the client's `instrumentation` hook, if set.
+
+        Args:
+            method_name (str): the HTTP method used, e.g. "GET"
+            url (str): the full URL of the request
+            start_time (float): the `perf_counter` value from before the request
+            attempts (int): the number of attempts made
+            status_code (int): the status code of the (final) response; None if the
+                request raised an error
+            ttfb (float): the time taken to receive the (final) response's headers
+            response_bytes (int): the size of the (final) response's body. Streamed
+                responses use the `Content-Length` header.
+        """
+        if self.instrumentation is None:
+            return
+
+        self.instrumentation(
+            RequestMetrics(
+                client=type(self).__name__,
+                method=method_name,
+                endpoint=endpoint_template(url, self.base_url),
+                wall_time=perf_counter() - start_time,
+                ttfb=ttfb,
+                response_bytes=response_bytes,
+                status_code=status_code,
+                retries=max(attempts - 1, 0),
+            ),
+        )
+
+    def _handle_rate_limit_response(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+    ) -> None:
+        """Pause the rate limiter if the server says that it's been rate limited.
+
+        Args:
+            status_code (int): the status code of the response
+            headers (Mapping): the (case-insensitive) headers of the response
+        """
+        if status_code != HTTPStatus.TOO_MANY_REQUESTS:
+            return
+
+        if (retry_after := parse_retry_after(headers)) is not None:
+            LOGGER.warning(
+                "Rate limited by %s, pausing requests for %.3fs",
+                self.base_url,
+                retry_after,
+            )
+            self.rate_limiter.pause(retry_after)
+
+    @staticmethod
+    def _update_response_cache(
+        cache: ResponseCache,
+        cache_key: str,
+        cached: CachedResponse | None,
+        res: Response,
+    ) -> Response:
+        """Update the response cache with a response, resolving 304s.
+
+        Args:
+            cache (ResponseCache): the cache to update
+            cache_key (str): the cache key of the request
+            cached (CachedResponse): the existing cache entry, if there was one
+            res (Response): the response from the server
+
+        Returns:
+            Response: the response to return to the caller
+        """
+        if cached is not None and res.status_code == HTTPStatus.NOT_MODIFIED:
+            cached.revalidate(res)
+            cache.set(cache_key, cached)
+            return cached.to_response()
+
+        if (entry := CachedResponse.from_response(res)) is not None:
+            cache.set(cache_key, entry)
+        elif cached is not None:
+            cache.delete(cache_key)
 
         return res
 
     def _request_json_response(
         self,
         *,
-        method: Callable[..., Response],
+        method: Callable[..., Response] | str,
         url: str,
         params: (
             dict[
@@ -221,7 +874,7 @@ class JsonApiClient(Generic[GetJsonResponse]):
             return {}  # type: ignore[return-value]
 
         try:
-            return res.json()  # type: ignore[no-any-return]
+            return json_loads(res.content)  # type: ignore[no-any-return]
         except JSONDecodeError as exc:
             if not res.content:
                 return {}  # type: ignore[return-value]
@@ -314,6 +967,253 @@ class JsonApiClient(Generic[GetJsonResponse]):
             data=data,
         )
 
+    def get_many(
+        self,
+        urls_or_requests: Iterable[str | GetRequest],
+        /,
+        *,
+        max_concurrency: int | None = None,
+    ) -> list[GetJsonResponse | Exception]:
+        """Send independent GET requests in parallel, over the client's pooled session.
+
+        Results are returned in the same order as the requests. An exception raised by
+        one request doesn't affect the others: it's returned in place of that request's
+        JSON, as with `asyncio.gather(..., return_exceptions=True)`.
+
+        Args:
+            urls_or_requests (Iterable[str | GetRequest]): the API endpoints to GET, or
+                `GetRequest`s for requests which need parameters, headers etc.
+            max_concurrency (int): the maximum number of requests in flight at once;
+                defaults to `SESSION_POOL_MAXSIZE`, as any more would just be queued
+                for a pooled connection
+
+        Returns:
+            list: the JSON from each response, or the exception raised by the request
+
+        Raises:
+            ValueError: if `max_concurrency` is less than 1
+        """
+        requests = [
+            GetRequest(item) if isinstance(item, str) else item
+            for item in urls_or_requests
+        ]
+
+        if max_concurrency is None:
+            max_concurrency = self.SESSION_POOL_MAXSIZE
+        elif max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, not {max_concurrency}")
+
+        def _get_json_response(request: GetRequest) -> GetJsonResponse | Exception:
+            try:
+                return self.get_json_response(
+                    request.url,
+                    params=dict(request.params) if request.params is not None else None,
+                    header_overrides=request.header_overrides,
+                    timeout=request.timeout,
+                )
+            except Exception as exc:
+                return exc
+
+        if max_concurrency == 1 or len(requests) <= 1:
+            return [_get_json_response(request) for request in requests]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(requests)),
+            thread_name_prefix=f"{type(self).__name__}.get_many",
+        ) as pool:
+            return list(pool.map(_get_json_response, requests))
+
+    def _prefetch_pages(self, pages: Iterable[_Page], /) -> Iterator[_Page]:
+        """Iterate over pages, fetching the next one(s) in a background thread.
+
+        Token-based pagination can't be parallelised, but the request for page N+1
+        can overlap with the caller's processing of page N. At most
+        `page_prefetch_depth` pages are fetched ahead of the caller; any more would
+        just be wasted if the caller stops early.
+
+        Args:
+            pages (Iterable): the pages, typically a generator which sends a request
+                for each one
+
+        Yields:
+            Any: each page, in order
+
+        Raises:
+            Exception: any exception raised whilst fetching a page, once the caller
+                reaches that page
+        """
+        if self.page_prefetch_depth < 1:
+            yield from pages
+            return
+
+        buffer: SimpleQueue[tuple[bool, _Page | Exception | None]] = SimpleQueue()
+        # Released by the caller as it takes each page, so the producer only fetches
+        # the next page once there's room for it
+        slots = Semaphore(self.page_prefetch_depth - 1)
+        stop = Event()
+
+        def _fetch_pages() -> None:
+            try:
+                for page in pages:
+                    buffer.put((True, page))
+
+                    while not slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+            except Exception as exc:
+                buffer.put((False, exc))
+            else:
+                buffer.put((False, None))
+
+        Thread(
+            target=_fetch_pages,
+            name=f"{type(self).__name__}.prefetch_pages",
+            daemon=True,
+        ).start()
+
+        try:
+            while (next_page := buffer.get())[0]:
+                slots.release()
+                yield next_page[1]  # type: ignore[misc]
+        finally:
+            stop.set()
+
+        if isinstance(exc := next_page[1], Exception):
+            raise exc
+
+    def iter_json_items(
+        self,
+        url: str,
+        /,
+        *,
+        list_key: str | None = "items",
+        params: (
+            dict[
+                StrBytIntFlt,
+                StrBytIntFlt | Iterable[StrBytIntFlt] | None,
+            ]
+            | None
+        ) = None,
+        header_overrides: Mapping[str, str | bytes] | None = None,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        metadata: dict[str, Any] | None = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[Any]:
+        """Stream the items of a JSON array from a URL, without buffering the response.
+
+        The response is parsed incrementally, so items are yielded as they arrive and
+        peak memory usage scales with a single item rather than the whole response.
+
+        Args:
+            url (str): the API endpoint to GET
+            list_key (str): the key of the array in the response's top-level object;
+                None if the response is itself an array
+            params (dict): the parameters to be passed in the HTTP request
+            header_overrides (dict): headers to add to/overwrite the headers in
+                `self.request_headers`. Setting this to an empty dict will erase all
+                headers; `None` will use `self.request_headers`.
+            timeout (float): How many seconds to wait for the server to send data
+                before giving up
+            metadata (dict): if provided, this is populated with the other top-level
+                values of the response, e.g. `nextPageToken`
+            chunk_size (int): the number of bytes to read from the response at a time
+
+        Yields:
+            Any: the items in the response's array
+        """
+        with self._request(
+            method=get,
+            url=url,
+            params=params,
+            header_overrides=header_overrides,
+            timeout=timeout,
+            stream=True,
+        ) as res:
+            if res.status_code == HTTPStatus.NO_CONTENT:
+                return
+
+            yield from iter_json_array(
+                iterdecode(res.iter_content(chunk_size), res.encoding or "utf-8"),
+                list_key,
+                metadata=metadata,
+            )
+
+    def _create_aio_client(self) -> AsyncJsonApiClient[GetJsonResponse]:
+        """Create the asyncio-native flavour of this client.
+
+        Overridable in subclasses.
+
+        Returns:
+            AsyncJsonApiClient: the async client, wrapping this one
+        """
+        from wg_utilities.clients.async_json_api_client import (
+            AsyncJsonApiClient,
+        )
+
+        return AsyncJsonApiClient(self)
+
+    def close_session(self) -> None:
+        """Close the client's session, releasing any pooled connections.
+
+        A new session will be created the next time a request is made.
+        """
+        if hasattr(self, "_session"):
+            self._session.close()
+            del self._session
+
+    def _create_session(self) -> Session:
+        """Create a new `Session` with a connection pool as per the class config.
+
+        Returns:
+            Session: the new session
+        """
+        session = Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.SESSION_POOL_CONNECTIONS,
+            pool_maxsize=self.SESSION_POOL_MAXSIZE,
+            pool_block=self.SESSION_POOL_BLOCK,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        session.headers["Accept-Encoding"] = self.ACCEPT_ENCODING
+
+        if not self.SESSION_KEEP_ALIVE:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    @property
+    def aio(self) -> AsyncJsonApiClient[GetJsonResponse]:
+        """Asyncio-native flavour of this client, sharing its config and credentials.
+
+        Requires `aiohttp` to be installed.
+
+        Returns:
+            AsyncJsonApiClient: the async client
+        """
+        if not hasattr(self, "_aio"):
+            self._aio = self._create_aio_client()
+
+        return self._aio
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Rate limiter shared by all clients with this client's base URL.
+
+        Configured by the `RATE_LIMIT` and `RATE_LIMIT_BURST` class attributes of
+        whichever client uses it first.
+
+        Returns:
+            RateLimiter: the rate limiter
+        """
+        return RateLimiter.for_base_url(
+            self.base_url,
+            rate=self.RATE_LIMIT,
+            capacity=self.RATE_LIMIT_BURST,
+        )
+
     @property
     def request_headers(self) -> dict[str, str]:
         """Header to be used in requests to the API.
@@ -324,3 +1224,25 @@ class JsonApiClient(Generic[GetJsonResponse]):
         return {
             "Content-Type": "application/json",
         }
+
+    @property
+    def session(self) -> Session:
+        """Pooled, keep-alive session used for all requests made by this client.
+
+        `requests.Session` is safe to share between threads for making requests; the
+        underlying `urllib3` pools handle concurrent access.
+
+        Returns:
+            Session: the client's session
+        """
+        if not hasattr(self, "_session"):
+            with _SESSION_LOCK:
+                if not hasattr(self, "_session"):
+                    self._session = self._create_session()
+
+        return self._session
+
+    @session.setter
+    def session(self, value: Session) -> None:
+        """Set the client's session, e.g. to share one pool between clients."""
+        self._session = value
@@ -7,7 +7,6 @@ from logging import DEBUG, getLogger
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, final
 
 from pydantic import Field, field_validator
-from requests import put
 from typing_extensions import TypedDict
 
 from wg_utilities.clients.oauth_client import BaseModelWithConfig, OAuthClient
@@ -436,6 +435,9 @@ class MonzoClient(OAuthClient[MonzoGJR]):
     AUTH_LINK_BASE = "https://auth.monzo.com"
     BASE_URL = "https://api.monzo.com"
 
+    RATE_LIMIT: ClassVar[float | None] = 5
+    RATE_LIMIT_BURST: ClassVar[int] = 10
+
     DEFAULT_PARAMS: ClassVar[
         dict[StrBytIntFlt, StrBytIntFlt | Iterable[StrBytIntFlt] | None]
     ] = {}
@@ -460,7 +462,7 @@ class MonzoClient(OAuthClient[MonzoGJR]):
             [pot.id, str(amount_pence), str(utcnow(DTU.SECOND))],
         )
 
-        res = put(
+        res = self.session.put(
             f"{self.BASE_URL}/pots/{pot.id}/deposit",
             headers=self.request_headers,
             data={
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from json import dumps
 from logging import DEBUG, getLogger
 from os import getenv
 from pathlib import Path
 from random import choice
 from string import ascii_letters
+from threading import Event, RLock, Thread
 from time import time
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 from urllib.parse import urlencode
@@ -17,9 +17,8 @@ from webbrowser import open as open_browser
 from jwt import DecodeError, decode
 from pydantic import BaseModel, ConfigDict
 
-from wg_utilities.api import TempAuthServer
 from wg_utilities.clients.json_api_client import GetJsonResponse, JsonApiClient
-from wg_utilities.functions import user_data_dir
+from wg_utilities.functions import json_loads, user_data_dir
 from wg_utilities.functions.file_management import force_mkdir
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -27,6 +26,10 @@ if TYPE_CHECKING:  # pragma: no cover
 
     from pydantic.main import IncEx
 
+    from wg_utilities.api import TempAuthServer
+    from wg_utilities.clients.async_json_api_client import AsyncOAuthClient
+    from wg_utilities.clients.credential_store import CredentialStore
+
 else:
     IncEx = set[int] | set[str] | dict[int, Any] | dict[str, Any] | None
 
@@ -251,7 +254,21 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
 
     HEADLESS_MODE = getenv("WG_UTILITIES_HEADLESS_MODE", "0") == "1"
 
+    # Background refresh config, see `start_background_refresh`: how long before the
+    # token would be considered expired to renew it, and how long to wait before
+    # retrying a failed refresh (both in seconds)
+    BACKGROUND_REFRESH_MARGIN: ClassVar[float] = 30
+    BACKGROUND_REFRESH_RETRY_DELAY: ClassVar[float] = 30
+
+    # Where the credentials are persisted; can be set per class or per instance.
+    # Defaults to a `FileCredentialStore` at `creds_cache_path`
+    credential_store: CredentialStore | None = None
+
+    _background_refresh_stop: Event
+    _background_refresh_thread: Thread
     _credentials: OAuthCredentials
+    _request_headers: tuple[str | None, dict[str, str]]
+    _refresh_lock: RLock
     _temp_auth_server: TempAuthServer
 
     def __init__(  # noqa: PLR0913
@@ -311,6 +328,10 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
 
         self._client_id = client_id
         self._client_secret = client_secret
+
+        # Serialises this client's refreshes; other clients (and providers) aren't
+        # blocked by it
+        self._refresh_lock = RLock()
         self.access_token_endpoint = access_token_endpoint or self.ACCESS_TOKEN_ENDPOINT
         self.auth_link_base = auth_link_base or self.AUTH_LINK_BASE
         self.oauth_login_redirect_host = oauth_login_redirect_host
@@ -333,36 +354,144 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
 
         self.scopes = scopes or self.DEFAULT_SCOPES
 
-        if self._creds_cache_path:
+        if self._creds_cache_path or self.credential_store is not None:
             self._load_local_credentials()
 
+    def _create_aio_client(self) -> AsyncOAuthClient[GetJsonResponse]:
+        """Create the asyncio-native flavour of this client.
+
+        Returns:
+            AsyncOAuthClient: the async client, wrapping this one
+        """
+        from wg_utilities.clients.async_json_api_client import (
+            AsyncOAuthClient,
+        )
+
+        return AsyncOAuthClient(self)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Exclude the refresh lock and thread, which can't be copied or pickled.
+
+        Returns:
+            dict: the instance's state, minus its threading primitives
+        """
+        state = super().__getstate__()
+
+        for attr_name in (
+            "_refresh_lock",
+            "_background_refresh_stop",
+            "_background_refresh_thread",
+        ):
+            state.pop(attr_name, None)
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the instance's state, with a new refresh lock.
+
+        Args:
+            state (dict): the instance's state, from `__getstate__`
+        """
+        super().__setstate__(state)
+
+        self._refresh_lock = RLock()
+
     def _load_local_credentials(self) -> bool:
-        """Load credentials from the local cache.
+        """Load credentials from the credential store.
 
         Returns:
             bool: True if the credentials were loaded successfully, False otherwise
         """
-        try:
-            self._credentials = OAuthCredentials.model_validate_json(
-                self.creds_cache_path.read_text(),
-            )
-        except FileNotFoundError:
+        if (credentials := self._credential_store.load()) is None:
             return False
 
+        self._credentials = credentials
+
         return True
 
+    def _write_local_credentials(self) -> None:
+        """Write the credentials to the credential store."""
+        self._credential_store.save(self._credentials)
+
+    def _background_refresh_loop(self, stop: Event) -> None:
+        """Refresh the access token shortly before it expires, until `stop` is set.
+
+        Args:
+            stop (Event): the event which signals the loop to exit
+        """
+        while not stop.is_set():
+            if hasattr(self, "_credentials") or self._load_local_credentials():
+                delay = (
+                    self._credentials.expiry_epoch
+                    - self.ACCESS_TOKEN_EXPIRY_THRESHOLD
+                    - self.BACKGROUND_REFRESH_MARGIN
+                    - time()
+                )
+            else:
+                # Nothing to refresh until the first time login has been completed
+                delay = self.BACKGROUND_REFRESH_RETRY_DELAY
+
+            if delay > 0 and stop.wait(delay):
+                break
+
+            if not hasattr(self, "_credentials"):
+                continue
+
+            try:
+                with self._refresh_lock:
+                    # The token may have been refreshed while waiting for the lock
+                    if (
+                        self._credentials.expiry_epoch
+                        - self.ACCESS_TOKEN_EXPIRY_THRESHOLD
+                        - self.BACKGROUND_REFRESH_MARGIN
+                        <= time()
+                    ):
+                        self.refresh_access_token()
+            except Exception:
+                LOGGER.exception(
+                    "Background access token refresh failed, retrying in %s seconds",
+                    self.BACKGROUND_REFRESH_RETRY_DELAY,
+                )
+
+                if stop.wait(self.BACKGROUND_REFRESH_RETRY_DELAY):
+                    break
+
     def delete_creds_file(self) -> None:
-        """Delete the local creds file."""
-        self.creds_cache_path.unlink(missing_ok=True)
+        """Delete the credentials from the credential store."""
+        self._credential_store.delete()
 
     def refresh_access_token(self) -> None:
-        """Refresh access token."""
+        """Refresh access token.
+
+        The refresh is done under the credential store's inter-process lock, so that
+        processes sharing the store don't all refresh at once: if another process
+        refreshed the token while this one was waiting for the lock, the new
+        credentials are loaded from the store instead.
+        """
         if not hasattr(self, "_credentials") and not self._load_local_credentials():
             # If we don't have any credentials, we can't refresh the access token -
             # perform first time login and leave it at that
             self.run_first_time_login()
             return
 
+        stale_access_token = self._credentials.access_token
+        credential_store = self._credential_store
+
+        with self._refresh_lock, credential_store.lock():
+            if (
+                stored_credentials := credential_store.reload()
+            ) is not None and stored_credentials.access_token != stale_access_token:
+                LOGGER.info("Access token already refreshed by another process")
+                self._credentials = stored_credentials
+                return
+
+            self._refresh_access_token()
+
+    def _refresh_access_token(self) -> None:
+        """Refresh the access token and write the new credentials to the local cache.
+
+        Should only be called by `refresh_access_token`, which holds the lock.
+        """
         LOGGER.info("Refreshing access token")
 
         payload = {
@@ -385,9 +514,7 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
             refresh_token=new_creds.get("refresh_token"),
         )
 
-        self.creds_cache_path.write_text(
-            self.credentials.model_dump_json(exclude_none=True),
-        )
+        self._write_local_credentials()
 
     def run_first_time_login(self) -> None:
         """Run the first time login process.
@@ -480,7 +607,7 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
             ),
         )
 
-        credentials = res.json()
+        credentials = json_loads(res.content)
 
         if self._client_id:
             credentials["client_id"] = self._client_id
@@ -490,6 +617,54 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
 
         self.credentials = OAuthCredentials.parse_first_time_login(credentials)
 
+    def start_background_refresh(self) -> None:
+        """Start renewing the access token in a background thread.
+
+        The token is refreshed `BACKGROUND_REFRESH_MARGIN` seconds before it would be
+        considered expired, so requests (sync or via `aio`) never have to wait for a
+        refresh. Does nothing if the background refresh is already running.
+        """
+        if self.background_refresh_running:
+            return
+
+        self._background_refresh_stop = Event()
+        self._background_refresh_thread = Thread(
+            target=self._background_refresh_loop,
+            args=(self._background_refresh_stop,),
+            name=f"{type(self).__name__}.background_refresh",
+            daemon=True,
+        )
+        self._background_refresh_thread.start()
+
+    def stop_background_refresh(self, timeout: float | None = None) -> None:
+        """Stop the background access token refresh thread.
+
+        Args:
+            timeout (float, optional): the maximum time to wait for the thread to
+                exit, in seconds. Defaults to None (wait indefinitely).
+        """
+        if not hasattr(self, "_background_refresh_thread"):
+            return
+
+        self._background_refresh_stop.set()
+        self._background_refresh_thread.join(timeout)
+
+        del self._background_refresh_thread
+
+    @property
+    def _credential_store(self) -> CredentialStore:
+        """The credential store in use, falling back to the `creds_cache_path` file.
+
+        Returns:
+            CredentialStore: the credential store
+        """
+        if self.credential_store is not None:
+            return self.credential_store
+
+        from wg_utilities.clients.credential_store import FileCredentialStore
+
+        return FileCredentialStore(self.creds_cache_path)
+
     @property
     def _creds_rel_file_path(self) -> Path | None:
         """Get the credentials cache filepath relative to the cache directory.
@@ -511,7 +686,10 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
             str: the access token for this bank's API
         """
         if self.access_token_has_expired:
-            self.refresh_access_token()
+            with self._refresh_lock:
+                # Another thread may have refreshed it while waiting for the lock
+                if self.access_token_has_expired:
+                    self.refresh_access_token()
 
         return self.credentials.access_token
 
@@ -530,6 +708,18 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
             < int(time()) + self.ACCESS_TOKEN_EXPIRY_THRESHOLD
         )
 
+    @property
+    def background_refresh_running(self) -> bool:
+        """Whether the background access token refresh thread is running.
+
+        Returns:
+            bool: True if the thread is running, False otherwise
+        """
+        return (
+            hasattr(self, "_background_refresh_thread")
+            and self._background_refresh_thread.is_alive()
+        )
+
     @property
     def client_id(self) -> str:
         """Client ID for the Google API.
@@ -569,9 +759,7 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
         """Set the client's credentials, and write to the local cache file."""
         self._credentials = value
 
-        self.creds_cache_path.write_text(
-            dumps(self._credentials.model_dump(exclude_none=True)),
-        )
+        self._write_local_credentials()
 
     @property
     def creds_cache_path(self) -> Path:
@@ -602,13 +790,26 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
     def request_headers(self) -> dict[str, str]:
         """Header to be used in requests to the API.
 
+        The dict is reused until the access token changes, so it shouldn't be mutated.
+
         Returns:
             dict: auth headers for HTTP requests
         """
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        access_token = self.access_token
+
+        if (
+            not hasattr(self, "_request_headers")
+            or self._request_headers[0] != access_token
+        ):
+            self._request_headers = (
+                access_token,
+                {
+                    "Authorization": f"Bearer {access_token}",
+                    "Content-Type": "application/json",
+                },
+            )
+
+        return self._request_headers[1]
 
     @property
     def refresh_token(self) -> str:
@@ -627,6 +828,9 @@ class OAuthClient(JsonApiClient[GetJsonResponse]):
             TempAuthServer: the temporary server
         """
         if not hasattr(self, "_temp_auth_server"):
+            # Only imported when it's needed, i.e. for a first time login
+            from wg_utilities.api import TempAuthServer
+
             self._temp_auth_server = TempAuthServer(__name__, auto_run=False)
 
         return self._temp_auth_server
@@ -0,0 +1,185 @@
+"""Client-side rate limiting for `JsonApiClient`, shared between clients per base URL."""
+
+from __future__ import annotations
+
+from asyncio import sleep as async_sleep
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from logging import DEBUG, getLogger
+from threading import Lock
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping
+
+LOGGER = getLogger(__name__)
+LOGGER.setLevel(DEBUG)
+
+
+def parse_retry_after(headers: Mapping[str, str], /) -> float | None:
+    """Get the number of seconds to wait from a response's `Retry-After` header.
+
+    Args:
+        headers (Mapping): the (case-insensitive) response headers
+
+    Returns:
+        float: the number of seconds to wait, or None if the header is missing/invalid
+    """
+    if not (value := headers.get("Retry-After")):
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        LOGGER.warning("Unable to parse Retry-After header: %r", value)
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """Thread-safe token bucket rate limiter.
+
+    Each request takes a token; tokens are replenished at `rate` per second, up to
+    `capacity` (i.e. the burst size). Requests which can't get a token immediately
+    reserve the next available one and wait until it's due, so waiting requests are
+    served in order.
+
+    The limiter can also be paused (e.g. when a server responds with a 429 and a
+    `Retry-After` header), in which case all requests wait until the pause is over.
+
+    Args:
+        rate (float): the number of requests allowed per second, or None to disable
+            pacing (pauses are still honoured)
+        capacity (int): the maximum number of requests which can be made in a burst
+    """
+
+    _REGISTRY: ClassVar[dict[str, RateLimiter]] = {}
+    _REGISTRY_LOCK: ClassVar[Lock] = Lock()
+
+    def __init__(self, rate: float | None = None, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens = float(capacity)
+        self._updated_at = monotonic()
+        self._paused_until = 0.0
+        self._lock = Lock()
+
+        # Settings this limiter has been requested with (via `for_base_url`) but which
+        # don't match its own, so each mismatch is only warned about once
+        self._ignored_settings: set[tuple[float | None, int]] = set()
+
+    @classmethod
+    def for_base_url(
+        cls,
+        base_url: str,
+        /,
+        *,
+        rate: float | None = None,
+        capacity: int = 1,
+    ) -> RateLimiter:
+        """Get the limiter for a base URL, creating it if necessary.
+
+        All clients targeting the same base URL share a limiter (and so a budget). The
+        limiter is configured by whichever client uses it first: later requests for it
+        with different settings get the existing limiter as-is, and a warning is logged
+        (once per set of settings).
+
+        Args:
+            base_url (str): the base URL of the API
+            rate (float): the number of requests allowed per second
+            capacity (int): the maximum number of requests which can be made in a burst
+
+        Returns:
+            RateLimiter: the shared limiter
+        """
+        with cls._REGISTRY_LOCK:
+            if (limiter := cls._REGISTRY.get(base_url)) is None:
+                limiter = cls._REGISTRY[base_url] = cls(rate, capacity)
+            elif (settings := (rate, capacity)) != (
+                limiter.rate,
+                limiter.capacity,
+            ) and settings not in limiter._ignored_settings:
+                limiter._ignored_settings.add(settings)
+                LOGGER.warning(
+                    "Rate limiter for %s already exists with rate=%s and capacity=%s; "
+                    "ignoring rate=%s and capacity=%s",
+                    base_url,
+                    limiter.rate,
+                    limiter.capacity,
+                    rate,
+                    capacity,
+                )
+
+        return limiter
+
+    def _reserve(self) -> float:
+        """Take the next available token.
+
+        Returns:
+            float: the number of seconds to wait before the token can be used
+        """
+        with self._lock:
+            now = monotonic()
+            wait = max(self._paused_until - now, 0.0)
+
+            if self.rate is None:
+                return wait
+
+            self._tokens = min(
+                float(self.capacity),
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+            self._tokens -= 1
+
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+
+            return wait
+
+    def acquire(self) -> float:
+        """Block until a request can be made.
+
+        Returns:
+            float: the number of seconds spent waiting
+        """
+        if (wait := self._reserve()) > 0:
+            LOGGER.debug("Rate limited, waiting %.3fs", wait)
+            sleep(wait)
+
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait (without blocking the event loop) until a request can be made.
+
+        Returns:
+            float: the number of seconds spent waiting
+        """
+        if (wait := self._reserve()) > 0:
+            LOGGER.debug("Rate limited, waiting %.3fs", wait)
+            await async_sleep(wait)
+
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Stop any requests from being made for the given number of seconds.
+
+        Args:
+            seconds (float): the number of seconds to pause for
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, monotonic() + seconds)
+
+
+__all__ = ["RateLimiter", "parse_retry_after"]
@@ -0,0 +1,361 @@
+"""HTTP response cache for `JsonApiClient`, with conditional request revalidation."""
+
+from __future__ import annotations
+
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+from http import HTTPStatus
+from io import BytesIO
+from json import JSONDecodeError
+from logging import DEBUG, getLogger
+from operator import itemgetter
+from threading import Lock
+from time import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from wg_utilities.functions.file_management import atomic_write_bytes, force_mkdir
+from wg_utilities.functions.json import json_dumps_bytes, json_loads
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+    from wg_utilities.clients.json_api_client import StrBytIntFlt
+
+LOGGER = getLogger(__name__)
+LOGGER.setLevel(DEBUG)
+
+
+def _parse_cache_control(value: str | None) -> dict[str, int | None]:
+    """Parse a `Cache-Control` header into a dict of directives.
+
+    Args:
+        value (str): the header value, e.g. "private, max-age=60"
+
+    Returns:
+        dict: lowercased directive names, with their integer value (if any)
+    """
+    directives: dict[str, int | None] = {}
+
+    for directive in (value or "").split(","):
+        name, _, arg = directive.strip().partition("=")
+        if not name:
+            continue
+
+        try:
+            directives[name.lower()] = int(arg.strip('"'))
+        except ValueError:
+            directives[name.lower()] = None
+
+    return directives
+
+
+def _to_str(value: StrBytIntFlt) -> str:
+    """Convert a request parameter's name or value to a string.
+
+    Args:
+        value (StrBytIntFlt): the name or value
+
+    Returns:
+        str: the value as a string, with bytes decoded as UTF-8
+    """
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+@dataclass
+class CachedResponse:
+    """A cached HTTP response, with the info needed to revalidate it."""
+
+    url: str
+    content: bytes
+    headers: dict[str, str]
+
+    fresh_until: float
+    """Epoch time until which the response can be used without revalidation."""
+
+    stored_at: float
+    """Epoch time at which the response was stored (or last revalidated)."""
+
+    @classmethod
+    def from_response(cls, res: Response, /) -> CachedResponse | None:
+        """Create a cache entry from a response, if it is cacheable.
+
+        Responses are only cached if they are successful, not marked as `no-store`,
+        and either have a validator (`ETag`/`Last-Modified`) or a positive `max-age`.
+
+        Args:
+            res (Response): the response to cache
+
+        Returns:
+            CachedResponse: the cache entry, or None if the response isn't cacheable
+        """
+        if res.status_code != HTTPStatus.OK:
+            return None
+
+        cache_control = _parse_cache_control(res.headers.get("Cache-Control"))
+
+        if "no-store" in cache_control:
+            return None
+
+        max_age = 0 if "no-cache" in cache_control else cache_control.get("max-age") or 0
+
+        if not (max_age > 0 or "ETag" in res.headers or "Last-Modified" in res.headers):
+            return None
+
+        now = time()
+
+        return cls(
+            url=res.url,
+            content=res.content,
+            headers=dict(res.headers),
+            fresh_until=now + max_age,
+            stored_at=now,
+        )
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Get the headers needed to revalidate this response with the server.
+
+        Returns:
+            dict: `If-None-Match` and/or `If-Modified-Since` headers
+        """
+        cached_headers = CaseInsensitiveDict(self.headers)
+        headers = {}
+
+        if etag := cached_headers.get("ETag"):
+            headers["If-None-Match"] = etag
+
+        if last_modified := cached_headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = last_modified
+
+        return headers
+
+    def revalidate(self, res: Response, /) -> None:
+        """Update this entry after the server confirms it's unchanged (i.e. a 304).
+
+        Args:
+            res (Response): the 304 response
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        for header in ("Cache-Control", "ETag", "Expires", "Last-Modified"):
+            if header in res.headers:
+                headers[header] = res.headers[header]
+
+        self.headers = dict(headers)
+
+        cache_control = _parse_cache_control(headers.get("Cache-Control"))
+        max_age = 0 if "no-cache" in cache_control else cache_control.get("max-age") or 0
+
+        self.stored_at = time()
+        self.fresh_until = self.stored_at + max_age
+
+    def to_response(self) -> Response:
+        """Build a `requests.Response` from this entry.
+
+        Returns:
+            Response: a 200 response with the cached content
+        """
+        res = Response()
+        res.status_code = HTTPStatus.OK
+        res.reason = HTTPStatus.OK.phrase
+        res.url = self.url
+        res.headers = CaseInsensitiveDict(self.headers)
+        res._content = self.content
+        # The body has already been read, so streamed requests iterate over (and
+        # close) an in-memory copy of it
+        res._content_consumed = True
+        res.raw = BytesIO(self.content)
+
+        return res
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the response can be used without revalidating it.
+
+        Returns:
+            bool: True if the response is still fresh
+        """
+        return time() < self.fresh_until
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of HTTP responses, with TTL and an optional disk tier.
+
+    Responses are keyed on the method, URL, parameters and headers of the request;
+    the headers are hashed, so credentials (e.g. an `Authorization` header) aren't
+    held in the keys, but clients authenticated as different users can safely share
+    a cache without being served each other's responses. Fresh
+    responses (as per the `Cache-Control: max-age` directive) are served without a
+    request being made; stale ones are revalidated with `If-None-Match`/
+    `If-Modified-Since`, so an unchanged resource costs a 304 and no body.
+
+    Args:
+        max_entries (int): the maximum number of entries to hold in memory
+        ttl (float): the maximum number of seconds to hold an entry for, regardless of
+            its freshness
+        disk_dir (Path): an optional directory to persist entries to, so that they
+            survive between processes
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        ttl: float = 3600,
+        disk_dir: Path | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_dir = force_mkdir(disk_dir) if disk_dir else None
+
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def key(
+        method: str,
+        url: str,
+        params: Mapping[StrBytIntFlt, StrBytIntFlt | Iterable[StrBytIntFlt]]
+        | None = None,
+        headers: Mapping[str, str | bytes] | None = None,
+    ) -> str:
+        """Create the cache key for a request.
+
+        Args:
+            method (str): the HTTP method, e.g. "GET"
+            url (str): the full URL of the request
+            params (dict): the request's parameters
+            headers (dict): the request's headers (excluding any conditional ones)
+
+        Returns:
+            str: the cache key
+        """
+        query_pairs: list[tuple[str, str]] = []
+
+        for name, value in (params or {}).items():
+            values = (value,) if isinstance(value, str | bytes | int | float) else value
+            query_pairs.extend((_to_str(name), _to_str(item)) for item in values)
+
+        # Only sorted by name, as the order of a repeated param's values can matter
+        query = urlencode(sorted(query_pairs, key=itemgetter(0)))
+
+        if not headers:
+            return f"{method.upper()} {url}?{query}"
+
+        # Header names are case-insensitive, so they're normalised before hashing
+        headers_digest = sha256(
+            urlencode(
+                sorted((name.lower(), _to_str(value)) for name, value in headers.items()),
+            ).encode(),
+        ).hexdigest()
+
+        return f"{method.upper()} {url}?{query} {headers_digest}"
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+
+        return self.disk_dir / f"{sha256(key.encode()).hexdigest()}.json"
+
+    def _has_expired(self, entry: CachedResponse) -> bool:
+        return time() - entry.stored_at > self.ttl
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get an entry from the cache, checking the disk tier if necessary.
+
+        Args:
+            key (str): the cache key
+
+        Returns:
+            CachedResponse: the entry, or None if there's no (unexpired) entry
+        """
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                if self._has_expired(entry):
+                    del self._entries[key]
+                    entry = None
+                else:
+                    self._entries.move_to_end(key)
+                    return entry
+
+        if (path := self._disk_path(key)) is None:
+            return None
+
+        try:
+            entry_json = json_loads(path.read_bytes())
+            entry_json["content"] = b64decode(entry_json["content"])
+            entry = CachedResponse(**entry_json)
+        except FileNotFoundError:
+            return None
+        except (JSONDecodeError, KeyError, TypeError, ValueError):
+            LOGGER.warning("Invalid response cache file: %s", path)
+            path.unlink(missing_ok=True)
+            return None
+
+        if self._has_expired(entry):
+            path.unlink(missing_ok=True)
+            return None
+
+        self._set_in_memory(key, entry)
+
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Add (or update) an entry in the cache.
+
+        Args:
+            key (str): the cache key
+            entry (CachedResponse): the entry to store
+        """
+        self._set_in_memory(key, entry)
+
+        if (path := self._disk_path(key)) is not None:
+            entry_json: dict[str, Any] = asdict(entry)
+            entry_json["content"] = b64encode(entry.content).decode()
+
+            atomic_write_bytes(path, json_dumps_bytes(entry_json))
+
+    def _set_in_memory(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry from the cache (both tiers).
+
+        Args:
+            key (str): the cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+        if (path := self._disk_path(key)) is not None:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache (both tiers)."""
+        with self._lock:
+            self._entries.clear()
+
+        if self.disk_dir is not None:
+            for path in self.disk_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def __contains__(self, key: str) -> bool:
+        """Check if an (unexpired) entry exists for the given key."""
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        """Get the number of entries held in memory."""
+        return len(self._entries)
+
+
+__all__ = ["CachedResponse", "ResponseCache"]
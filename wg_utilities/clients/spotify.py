@@ -5,7 +5,6 @@ from __future__ import annotations
 import contextlib
 from datetime import UTC, date, datetime, timedelta
 from http import HTTPStatus
-from json import dumps
 from logging import DEBUG, getLogger
 from re import sub
 from typing import (
@@ -21,10 +20,10 @@ from typing import (
     cast,
     overload,
 )
-from urllib.parse import urlencode
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 from pydantic import Field, ValidationInfo, field_validator, model_validator
-from requests import HTTPError, delete, put
+from requests import HTTPError
 from typing_extensions import TypedDict
 
 from wg_utilities.clients._spotify_types import (
@@ -32,7 +31,6 @@ from wg_utilities.clients._spotify_types import (
     AlbumType,
     AnyPaginatedResponse,
     ArtistSummaryJson,
-    DeviceJson,
     Followers,
     Image,
     PaginatedResponseAlbums,
@@ -52,7 +50,7 @@ from wg_utilities.clients._spotify_types import (
     UserSummaryJson,
 )
 from wg_utilities.clients.oauth_client import BaseModelWithConfig, OAuthClient
-from wg_utilities.functions import chunk_list
+from wg_utilities.functions import chunk_list, json_dumps, json_loads
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Iterator, Sequence
@@ -125,6 +123,10 @@ class SpotifyClient(OAuthClient[SpotifyEntityJson]):
     ACCESS_TOKEN_ENDPOINT = "https://accounts.spotify.com/api/token"  # noqa: S105
     BASE_URL = "https://api.spotify.com/v1"
 
+    # Spotify's limit is applied over a rolling 30 second window, but isn't published
+    RATE_LIMIT: ClassVar[float | None] = 10
+    RATE_LIMIT_BURST: ClassVar[int] = 20
+
     DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
     DEFAULT_SCOPES: ClassVar[list[str]] = [
@@ -158,6 +160,11 @@ class SpotifyClient(OAuthClient[SpotifyEntityJson]):
         # "episode",
     )
 
+    # Once the first page of an offset-paginated listing has been received, request
+    # the remaining pages concurrently rather than following each `next` link in
+    # turn; see `iter_items`. Can be set per class or per instance
+    parallel_page_fetching: bool = False
+
     _current_user: User
 
     def add_tracks_to_playlist(
@@ -198,7 +205,7 @@ class SpotifyClient(OAuthClient[SpotifyEntityJson]):
             )
 
             if log_responses:
-                LOGGER.info(dumps(res.json()))
+                LOGGER.info(json_dumps(json_loads(res.content)))
 
         if update_instance_tracklist:
             playlist.tracks.extend(tracks_to_add)
@@ -235,7 +242,7 @@ class SpotifyClient(OAuthClient[SpotifyEntityJson]):
             },
         )
 
-        return Playlist.from_json_response(res.json(), spotify_client=self)
+        return Playlist.from_json_response(json_loads(res.content), spotify_client=self)
 
     def get_album_by_id(self, id_: str) -> Album:
         """Get an album from Spotify based on the ID.
@@ -265,7 +272,75 @@ class SpotifyClient(OAuthClient[SpotifyEntityJson]):
             spotify_client=self,
         )
 
-    def get_items(
+    def _get_remaining_pages(
+        self,
+        url: str,
+        first_page: AnyPaginatedResponse,
+        *,
+        max_items: int,
+        top_level_key: str | None,
+        list_key: str,
+        max_concurrency: int | None,
+    ) -> Iterator[list[SpotifyEntityJson]]:
+        """Request all pages after the first one concurrently, by offset.
+
+        Args:
+            url (str): the URL which the first page was requested from
+            first_page (AnyPaginatedResponse): the first page of the listing
+            max_items (int): the maximum number of further items to get
+            top_level_key (str): an optional key to use when the items in the response
+                are nested 1 level deeper than normal
+            list_key (str): the key in the response which contains the list of items
+            max_concurrency (int): the maximum number of requests in flight at once
+
+        Yields:
+            list: the items in each page, in order
+
+        Raises:
+            Exception: the first exception raised by any page's request
+        """
+        page_size = first_page["limit"] or 50
+        start = first_page["offset"] + len(first_page[list_key])  # type: ignore[literal-required]
+        # As with sequential pagination, only the `hard_limit` trims a page's limit
+        limit_end = start + max_items
+        end = min(first_page["total"], limit_end)
+
+        split_url = urlsplit(url)
+        query = [
+            (key, value)
+            for key, value in parse_qsl(split_url.query, keep_blank_values=True)
+            if key not in {"limit", "offset"}
+        ]
+
+        responses = self.get_many(
+            [
+                split_url._replace(
+                    query=urlencode(
+                        [
+                            *query,
+                            ("offset", offset),
+                            ("limit", min(page_size, limit_end - offset)),
+                        ],
+                    ),
+                ).geturl()
+                for offset in range(start, end, page_size)
+            ],
+            max_concurrency=max_concurrency,
+        )
+
+        for res in responses:
+            if isinstance(res, Exception):
+                raise res
+
+            page = (
+                cast("SearchResponse", res)[top_level_key]  # type: ignore[literal-required]
+                if top_level_key
+                else cast("AnyPaginatedResponse", res)
+            )
+
+            yield page.get(list_key, [])  # type: ignore[misc]
+
+    def iter_items(
         self,
         url: str,
         *,
@@ -291,8 +366,17 @@ class SpotifyClient(OAuthClient[SpotifyEntityJson]):
             | None
         ) = None,
         list_key: Literal["items", "devices"] = "items",
-    ) -> list[SpotifyEntityJson]:
-        """Retrieve a list of items from a given URL, including pagination.
+        parallel: bool | None = None,
+        max_concurrency: int | None = None,
+    ) -> Iterator[SpotifyEntityJson]:
+        """Lazily iterate over the items from a given URL, including pagination.
+
+        If `page_prefetch_depth` is set, the next page(s) are fetched in the background
+        while the caller processes the current one. In parallel mode, all remaining pages
+        are requested concurrently once the first page has been received, using its
+        `total`, `offset` and `limit`; items are still yielded in order. Listings
+        which aren't offset-paginated (e.g. cursor-based ones), or which use a
+        `limit_func`, are always fetched sequentially.
 
         Args:
             url (str): the API endpoint which we're listing
@@ -300,72 +384,147 @@ class SpotifyClient(OAuthClient[SpotifyEntityJson]):
             hard_limit (int): a hard limit to apply to the number of items returned (as
                 opposed to the "soft" limit of 50 imposed by the API)
             limit_func (Callable): a function which is used to evaluate each item in
-                turn: if it returns False, the item is added to the output list; if it
-                returns True then the iteration stops and the list is returned as-is
+                turn: if it returns False, the item is yielded; if it returns True then
+                the iteration stops
             top_level_key (str): an optional key to use when the items in the response
                 are nested 1 level deeper than normal
             list_key (Literal["devices", "items"]): the key in the response which
                 contains the list of items
+            parallel (bool): request the pages concurrently where possible; defaults
+                to `parallel_page_fetching`
+            max_concurrency (int): the maximum number of concurrent requests in
+                parallel mode; see `get_many`
 
-        Returns:
-            list: a list of dicts representing the Spotify items
+        Yields:
+            dict: a dict representing a Spotify item
         """
         params = params or {}
         if "limit=" not in url:
             params["limit"] = min(50, hard_limit)
 
-        items: list[SpotifyEntityJson] = []
-
         if params:
             url += ("?" if "?" not in url else "&") + urlencode(params)
 
-        page: AnyPaginatedResponse = {
-            "href": "",
-            "items": [],
-            "limit": 0,
-            "next": url,
-            "offset": 0,
-            "total": 0,
-        }
+        # A `limit_func` has to be evaluated in order, so the pages are too
+        parallel = (
+            self.parallel_page_fetching if parallel is None else parallel
+        ) and limit_func is None
+
+        def _fetch_pages() -> Iterator[list[SpotifyEntityJson]]:
+            page: AnyPaginatedResponse = {
+                "href": "",
+                "items": [],
+                "limit": 0,
+                "next": url,
+                "offset": 0,
+                "total": 0,
+            }
+            item_count = 0
+
+            while (next_url := page.get("next")) and item_count < hard_limit:
+                # Ensure we don't bother getting more items than we need
+                limit = min(50, hard_limit - item_count)
+                next_url = sub(r"(?<=limit=)(\d{1,2})(?=&?)", str(limit), next_url)
+
+                res: SearchResponse | AnyPaginatedResponse = self.get_json_response(
+                    next_url,
+                )  # type: ignore[assignment]
+                page = (
+                    cast("SearchResponse", res)[top_level_key]
+                    if top_level_key
+                    else cast("AnyPaginatedResponse", res)
+                )
 
-        while (next_url := page.get("next")) and len(items) < hard_limit:
-            # Ensure we don't bother getting more items than we need
-            limit = min(50, hard_limit - len(items))
-            next_url = sub(r"(?<=limit=)(\d{1,2})(?=&?)", str(limit), next_url)
+                page_items: list[SpotifyEntityJson] = page.get(list_key, [])  # type: ignore[assignment]
+
+                if limit_func is not None:
+                    # The limit is applied here (rather than as the items are
+                    # yielded) so no further pages are fetched once it's reached
+                    for i, item in enumerate(page_items):
+                        if limit_func(item):
+                            yield page_items[:i]
+                            return
+
+                item_count += len(page_items)
+                yield page_items
+
+                if parallel and page.get("next") and {"offset", "total"} <= page.keys():
+                    yield from self._get_remaining_pages(
+                        next_url,
+                        page,
+                        max_items=hard_limit - item_count,
+                        top_level_key=top_level_key,
+                        list_key=list_key,
+                        max_concurrency=max_concurrency,
+                    )
+                    return
 
-            res: SearchResponse | AnyPaginatedResponse = self.get_json_response(next_url)  # type: ignore[assignment]
-            page = (
-                cast("SearchResponse", res)[top_level_key]
-                if top_level_key
-                else cast("AnyPaginatedResponse", res)
-            )
+        for page_items in self._prefetch_pages(_fetch_pages()):
+            yield from page_items
 
-            page_items: (
-                list[AlbumSummaryJson]
-                | list[DeviceJson]
-                | list[ArtistSummaryJson]
-                | list[PlaylistSummaryJson]
-                | list[TrackFullJson]
-            ) = page.get(list_key, [])
-            if limit_func is None:
-                items.extend(page_items)
-            else:
-                # Initialise `limit_reached` to False, and then it will be set to
-                # True on the first matching item. This will then cause the loop to
-                # skip subsequent items - not as good as a `break` but still kind of
-                # elegant imho!
-                limit_reached = False
-                items.extend(
-                    [
-                        item
-                        for item in page_items
-                        if (not (limit_reached := (limit_reached or limit_func(item))))
-                    ],
-                )
-                if limit_reached:
-                    return items
+    def get_items(
+        self,
+        url: str,
+        *,
+        params: None | dict[str, str | int | float | bool | dict[str, Any]] = None,
+        hard_limit: int = 1000000,
+        limit_func: (
+            Callable[
+                [dict[str, Any] | SpotifyEntityJson],
+                bool,
+            ]
+            | None
+        ) = None,
+        top_level_key: (
+            Literal[
+                "albums",
+                "artists",
+                "audiobooks",
+                "episodes",
+                "playlists",
+                "shows",
+                "tracks",
+            ]
+            | None
+        ) = None,
+        list_key: Literal["items", "devices"] = "items",
+        parallel: bool | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[SpotifyEntityJson]:
+        """Retrieve a list of items from a given URL, including pagination.
 
-        return items
+        Args:
+            url (str): the API endpoint which we're listing
+            params (dict): any params to pass with the API request
+            hard_limit (int): a hard limit to apply to the number of items returned (as
+                opposed to the "soft" limit of 50 imposed by the API)
+            limit_func (Callable): a function which is used to evaluate each item in
+                turn: if it returns False, the item is added to the output list; if it
+                returns True then the iteration stops and the list is returned as-is
+            top_level_key (str): an optional key to use when the items in the response
+                are nested 1 level deeper than normal
+            list_key (Literal["devices", "items"]): the key in the response which
+                contains the list of items
+            parallel (bool): request the pages concurrently where possible; defaults
+                to `parallel_page_fetching`
+            max_concurrency (int): the maximum number of concurrent requests in
+                parallel mode; see `get_many`
+
+        Returns:
+            list: a list of dicts representing the Spotify items
+        """
+        return list(
+            self.iter_items(
+                url,
+                params=params,
+                hard_limit=hard_limit,
+                limit_func=limit_func,
+                top_level_key=top_level_key,
+                list_key=list_key,
+                parallel=parallel,
+                max_concurrency=max_concurrency,
+            ),
+        )
 
     def get_playlist_by_id(self, id_: str) -> Playlist:
         """Get a playlist from Spotify based on the ID.
@@ -418,7 +577,7 @@ class SpotifyClient(OAuthClient[SpotifyEntityJson]):
         url = self.BASE_URL + f"/playlists/{playlist.id}/tracks"
 
         for chunk in chunk_list(list(tracks), 100):
-            res = delete(
+            res = self.session.delete(
                 url,
                 json={"tracks": [{"uri": t.uri} for t in chunk]},
                 headers={
@@ -798,7 +957,7 @@ class Album(SpotifyEntity[AlbumSummaryJson]):
                                 spotify_client=self.spotify_client,
                                 additional_fields={"album": self.summary_json},
                             )
-                            for item in self.spotify_client.get_items(next_url)
+                            for item in self.spotify_client.iter_items(next_url)
                         ],
                     )
             else:
@@ -808,7 +967,9 @@ class Album(SpotifyEntity[AlbumSummaryJson]):
                         spotify_client=self.spotify_client,
                         additional_fields={"album": self.summary_json},
                     )
-                    for item in self.spotify_client.get_items(f"/albums/{self.id}/tracks")
+                    for item in self.spotify_client.iter_items(
+                        f"/albums/{self.id}/tracks",
+                    )
                 ]
 
             self._tracks = tracks
@@ -839,7 +1000,7 @@ class Artist(SpotifyEntity[ArtistSummaryJson]):
         if not hasattr(self, "_albums"):
             albums = [
                 Album.from_json_response(item, spotify_client=self.spotify_client)
-                for item in self.spotify_client.get_items(f"/artists/{self.id}/albums")
+                for item in self.spotify_client.iter_items(f"/artists/{self.id}/albums")
             ]
 
             self._albums = albums
@@ -1064,8 +1225,8 @@ class Playlist(SpotifyEntity[PlaylistSummaryJson]):
                     spotify_client=self.spotify_client,
                 )
                 for item in cast(
-                    "list[PlaylistFullJsonTracks]",
-                    self.spotify_client.get_items(f"/playlists/{self.id}/tracks"),
+                    "Iterator[PlaylistFullJsonTracks]",
+                    self.spotify_client.iter_items(f"/playlists/{self.id}/tracks"),
                 )
                 if item.get("track") is not None and item["is_local"] is False
             ]
@@ -1260,8 +1421,8 @@ class User(SpotifyEntity[UserSummaryJson]):
                 },
             )
             for item in cast(
-                "list[SavedItem]",
-                self.spotify_client.get_items(
+                "Iterator[SavedItem]",
+                self.spotify_client.iter_items(
                     "/me/tracks",
                     hard_limit=track_limit,
                     limit_func=limit_func,
@@ -1318,7 +1479,7 @@ class User(SpotifyEntity[UserSummaryJson]):
                 f"Must be one of: Album, Artist, Playlist, Track",
             )
 
-        res = put(
+        res = self.spotify_client.session.put(
             url,
             params=params,
             headers={
@@ -1357,7 +1518,7 @@ class User(SpotifyEntity[UserSummaryJson]):
                 f"Must be one of: Album, Artist, Playlist, Track",
             )
 
-        res = delete(
+        res = self.spotify_client.session.delete(
             url,
             params=params,
             headers={
@@ -1384,8 +1545,8 @@ class User(SpotifyEntity[UserSummaryJson]):
                     spotify_client=self.spotify_client,
                 )
                 for item in cast(
-                    "list[SavedItem]",
-                    self.spotify_client.get_items("/me/albums"),
+                    "Iterator[SavedItem]",
+                    self.spotify_client.iter_items("/me/albums"),
                 )
             ]
 
@@ -1579,8 +1740,8 @@ class User(SpotifyEntity[UserSummaryJson]):
                     },
                 )
                 for item in cast(
-                    "list[SavedItem]",
-                    self.spotify_client.get_items("/me/tracks"),
+                    "Iterator[SavedItem]",
+                    self.spotify_client.iter_items("/me/tracks"),
                 )
             ]
 
@@ -559,6 +559,9 @@ class TrueLayerClient(OAuthClient[dict[Literal["results"], list[TrueLayerEntityJ
     ACCESS_TOKEN_ENDPOINT = "https://auth.truelayer.com/connect/token"  # noqa: S105
     BASE_URL = "https://api.truelayer.com"
 
+    RATE_LIMIT: ClassVar[float | None] = 5
+    RATE_LIMIT_BURST: ClassVar[int] = 10
+
     DEFAULT_SCOPES: ClassVar[list[str]] = [
         "info",
         "accounts",
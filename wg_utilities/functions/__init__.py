@@ -5,8 +5,20 @@ from __future__ import annotations
 from ._functions import chunk_list, flatten_dict, try_float
 from .datetime_helpers import DTU, DatetimeFixedUnit, utcnow
 from .decorators import backoff
-from .file_management import force_mkdir, user_data_dir
-from .json import process_json_object, process_list, set_nested_value, traverse_dict
+from .file_management import atomic_write_bytes, file_lock, force_mkdir, user_data_dir
+from .json import (
+    JsonCodec,
+    get_json_codec,
+    iter_json_array,
+    json_dumps,
+    json_dumps_bytes,
+    json_loads,
+    process_json_object,
+    process_list,
+    set_json_codec,
+    set_nested_value,
+    traverse_dict,
+)
 from .processes import run_cmd
 from .string_manipulation import cleanse_string
 from .subclasses import subclasses_recursive
@@ -14,14 +26,23 @@ from .subclasses import subclasses_recursive
 __all__ = [
     "DTU",
     "DatetimeFixedUnit",
+    "JsonCodec",
+    "atomic_write_bytes",
     "backoff",
     "chunk_list",
     "cleanse_string",
+    "file_lock",
     "flatten_dict",
     "force_mkdir",
+    "get_json_codec",
+    "iter_json_array",
+    "json_dumps",
+    "json_dumps_bytes",
+    "json_loads",
     "process_json_object",
     "process_list",
     "run_cmd",
+    "set_json_codec",
     "set_nested_value",
     "subclasses_recursive",
     "traverse_dict",
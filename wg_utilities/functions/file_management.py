@@ -2,9 +2,37 @@
 
 from __future__ import annotations
 
-from os import environ, getenv
+import sys
+from contextlib import contextmanager
+from os import environ, fsync, getenv
 from pathlib import Path
 from sys import platform
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+    from io import BufferedRandom
+
+if sys.platform == "win32":  # pragma: no cover
+    from msvcrt import LK_LOCK, LK_UNLCK, locking
+
+    def _lock_file(lock_file: BufferedRandom) -> None:
+        lock_file.seek(0)
+        locking(lock_file.fileno(), LK_LOCK, 1)
+
+    def _unlock_file(lock_file: BufferedRandom) -> None:
+        lock_file.seek(0)
+        locking(lock_file.fileno(), LK_UNLCK, 1)
+
+else:
+    from fcntl import LOCK_EX, LOCK_UN, flock
+
+    def _lock_file(lock_file: BufferedRandom) -> None:
+        flock(lock_file.fileno(), LOCK_EX)
+
+    def _unlock_file(lock_file: BufferedRandom) -> None:
+        flock(lock_file.fileno(), LOCK_UN)
 
 
 def user_data_dir(
@@ -64,3 +92,53 @@ def force_mkdir(target_path: Path, *, path_is_file: bool = False) -> Path:
         target_path.mkdir(exist_ok=True, parents=True)
 
     return target_path
+
+
+def atomic_write_bytes(target_path: Path, data: bytes) -> None:
+    """Write bytes to a file atomically.
+
+    The data is written to a temporary file in the same directory, which is then
+    renamed over the target file. Readers will see either the old content or the new
+    content, never a partially written file.
+
+    Args:
+        target_path (Path): the path to the file to write
+        data (bytes): the content to write to the file
+    """
+    with NamedTemporaryFile(
+        dir=target_path.parent,
+        prefix=f".{target_path.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as temp_file:
+        try:
+            temp_file.write(data)
+            temp_file.flush()
+            fsync(temp_file.fileno())
+        except BaseException:
+            Path(temp_file.name).unlink(missing_ok=True)
+            raise
+
+    Path(temp_file.name).replace(target_path)
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive inter-process lock on a file, blocking until it's acquired.
+
+    The lock file is created if it doesn't exist, and isn't deleted afterwards. The
+    lock is advisory: it only excludes other processes which use the same lock file.
+
+    Args:
+        lock_path (Path): the path to the lock file
+
+    Yields:
+        None: the lock is held until the context manager exits
+    """
+    with force_mkdir(lock_path, path_is_file=True).open("a+b") as lock_file:
+        _lock_file(lock_file)
+
+        try:
+            yield
+        finally:
+            _unlock_file(lock_file)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import MutableMapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, MutableMapping, Sequence
+from dataclasses import dataclass
+from json import JSONDecodeError, JSONDecoder
+from json import dumps as stdlib_dumps
+from json import loads as stdlib_loads
 from logging import DEBUG, getLogger
-from typing import Any, Protocol, TypeVar, Union, cast
+from typing import Any, Final, Literal, Protocol, TypeVar, Union, cast
 
 LOGGER = getLogger(__name__)
 LOGGER.setLevel(DEBUG)
@@ -290,3 +294,357 @@ def process_json_object(
         )
     else:
         raise InvalidJsonObjectError(obj)
+
+
+class _JsonStream:
+    """Reads JSON values from a stream of text chunks, one at a time.
+
+    Only the current (partially-consumed) chunk(s) are held in memory, i.e. enough to
+    decode the next value.
+    """
+
+    NUMERIC: Final[str] = "+-.0123456789Ee"
+    WHITESPACE: Final[str] = " \t\n\r"
+
+    def __init__(self, chunks: Iterable[str], /):
+        self._chunks = iter(chunks)
+        self._decoder = JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _read_more(self) -> bool:
+        """Discard the consumed part of the buffer and read the next chunk into it.
+
+        Returns:
+            bool: False if the stream has been exhausted
+        """
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += chunk
+                return True
+
+        return False
+
+    def peek(self) -> str:
+        """Skip any whitespace and get the next character, without consuming it.
+
+        Returns:
+            str: the next character, or an empty string at the end of the stream
+        """
+        while True:
+            while (
+                self._pos < len(self._buffer)
+                and self._buffer[self._pos] in self.WHITESPACE
+            ):
+                self._pos += 1
+
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+
+            if not self._read_more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of `chars`.
+
+        Args:
+            chars (str): the allowed characters
+
+        Returns:
+            str: the consumed character
+
+        Raises:
+            ValueError: if the next character isn't one of `chars`
+        """
+        if not (char := self.peek()) or char not in chars:
+            raise ValueError(f"Expected one of {chars!r}, got {char or 'EOF'!r}")
+
+        self._pos += 1
+        return char
+
+    def decode(self) -> Any:
+        """Decode the next (complete) JSON value.
+
+        Returns:
+            Any: the decoded value
+        """
+        self.peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except JSONDecodeError:
+                if not self._read_more():
+                    raise
+
+                continue
+
+            # A number which runs to the end of the buffer may have been truncated (e.g.
+            # "12.5" split into "12." and "5"), so only accept it once there's more data
+            # or the stream is exhausted
+            tail = end
+            if isinstance(value, int | float) and not isinstance(value, bool):
+                while tail < len(self._buffer) and self._buffer[tail] in self.NUMERIC:
+                    tail += 1
+
+            if tail == len(self._buffer) and self._read_more():
+                continue
+
+            self._pos = end
+            return value
+
+    def seek_key(self, key: str, metadata: dict[str, Any] | None = None) -> None:
+        """Consume the start of an object, up to and including the given key.
+
+        Args:
+            key (str): the key to find
+            metadata (dict): if provided, populated with the values of any skipped keys
+
+        Raises:
+            ValueError: if the key isn't found in the object
+        """
+        self.expect("{")
+
+        not_found_error = ValueError(f"Key {key!r} not found in JSON object")
+
+        if self.peek() == "}":
+            raise not_found_error
+
+        while True:
+            name = self.decode()
+            self.expect(":")
+
+            if name == key:
+                return
+
+            value = self.decode()
+            if metadata is not None:
+                metadata[name] = value
+
+            if self.expect(",}") == "}":
+                raise not_found_error
+
+    def read_remaining_values(self, metadata: dict[str, Any]) -> None:
+        """Consume the rest of an object, adding its values to `metadata`.
+
+        Args:
+            metadata (dict): the dict to populate
+        """
+        while self.expect(",}") == ",":
+            name = self.decode()
+            self.expect(":")
+            metadata[name] = self.decode()
+
+
+def iter_json_array(
+    chunks: Iterable[str],
+    /,
+    key: str | None = None,
+    *,
+    metadata: dict[str, Any] | None = None,
+) -> Iterator[Any]:
+    """Incrementally parse a JSON array from a stream of text, yielding its items.
+
+    Items are yielded as soon as they've been received, so peak memory usage scales
+    with the size of a single item rather than the whole document.
+
+    Args:
+        chunks (Iterable[str]): the JSON document, e.g. from `Response.iter_content`
+        key (str): the key of the array within the top-level JSON object. If None, the
+            document itself must be an array.
+        metadata (dict): if provided, this is populated with all other top-level values
+            of the JSON object (e.g. pagination tokens). Values after the array are only
+            added once all items have been consumed.
+
+    Yields:
+        Any: the items of the array
+
+    Raises:
+        ValueError: if the document is invalid, or the key isn't found
+    """
+    stream = _JsonStream(chunks)
+
+    if key is not None:
+        stream.seek_key(key, metadata)
+
+    stream.expect("[")
+
+    if stream.peek() == "]":
+        stream.expect("]")
+    else:
+        while True:
+            yield stream.decode()
+
+            if stream.expect(",]") == "]":
+                break
+
+    if key is not None and metadata is not None:
+        stream.read_remaining_values(metadata)
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """A JSON encoder/decoder pair, see `set_json_codec`."""
+
+    name: Literal["orjson", "msgspec", "stdlib"]
+
+    encode: Callable[[Any, Callable[[Any], Any] | None], bytes]
+    """Encode an object (with an optional `default` function) as UTF-8 JSON.
+
+    orjson and msgspec produce compact output; the stdlib codec keeps `json.dumps`'s
+    default formatting.
+    """
+
+    decode: Callable[[bytes | str], Any]
+    """Decode a JSON document, raising a `JSONDecodeError` if it's invalid."""
+
+
+def _stdlib_codec() -> JsonCodec:
+    def _encode(obj: Any, default: Callable[[Any], Any] | None) -> bytes:
+        return stdlib_dumps(obj, default=default).encode()
+
+    return JsonCodec(name="stdlib", encode=_encode, decode=stdlib_loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def _encode(obj: Any, default: Callable[[Any], Any] | None) -> bytes:
+        # `orjson.JSONEncodeError` is a `TypeError`
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+    # `orjson.JSONDecodeError` is a `json.JSONDecodeError`
+    return JsonCodec(name="orjson", encode=_encode, decode=orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    def _encode(obj: Any, default: Callable[[Any], Any] | None) -> bytes:
+        try:
+            return msgspec.json.encode(obj, enc_hook=default)
+        except msgspec.EncodeError as exc:
+            raise TypeError(str(exc)) from exc
+
+    def _decode(data: bytes | str) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as exc:
+            raise JSONDecodeError(str(exc), str(data), 0) from exc
+
+    return JsonCodec(name="msgspec", encode=_encode, decode=_decode)
+
+
+_CODEC_FACTORIES: Final[dict[str, Callable[[], JsonCodec]]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "stdlib": _stdlib_codec,
+}
+
+_STDLIB_CODEC: Final[JsonCodec] = _stdlib_codec()
+_codec = _STDLIB_CODEC
+
+
+def set_json_codec(
+    name: Literal["orjson", "msgspec", "stdlib"] | None = None,
+) -> JsonCodec:
+    """Set the codec used by `json_dumps`/`json_loads` (and so all clients/loggers).
+
+    By default, the fastest installed codec is used: orjson, then msgspec, then the
+    standard library's `json` module.
+
+    Args:
+        name (str): the codec to use, or None to use the fastest one installed
+
+    Returns:
+        JsonCodec: the codec now in use
+
+    Raises:
+        ImportError: if the requested codec isn't installed
+    """
+    global _codec  # noqa: PLW0603
+
+    if name is not None:
+        _codec = _CODEC_FACTORIES[name]()
+    else:
+        for factory in _CODEC_FACTORIES.values():
+            try:
+                _codec = factory()
+                break
+            except ImportError:
+                continue
+
+    LOGGER.debug("Using JSON codec %r", _codec.name)
+    return _codec
+
+
+def get_json_codec() -> JsonCodec:
+    """Get the codec currently used by `json_dumps`/`json_loads`.
+
+    Returns:
+        JsonCodec: the codec in use
+    """
+    return _codec
+
+
+def json_dumps_bytes(
+    obj: Any,
+    /,
+    *,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON using the current codec.
+
+    If the codec can't serialize the object (e.g. orjson with `bytes` keys), the
+    standard library is used instead.
+
+    Args:
+        obj (Any): the object to serialize
+        default (Callable): a function to convert unsupported objects into
+            serializable ones (e.g. `str`)
+
+    Returns:
+        bytes: the JSON document
+    """
+    try:
+        return _codec.encode(obj, default)
+    except TypeError:
+        if _codec is _STDLIB_CODEC:
+            raise
+
+        return _STDLIB_CODEC.encode(obj, default)
+
+
+def json_dumps(obj: Any, /, *, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize an object to a JSON string using the current codec.
+
+    Args:
+        obj (Any): the object to serialize
+        default (Callable): a function to convert unsupported objects into
+            serializable ones (e.g. `str`)
+
+    Returns:
+        str: the JSON document
+    """
+    return json_dumps_bytes(obj, default=default).decode()
+
+
+def json_loads(data: bytes | str, /) -> Any:
+    """Deserialize a JSON document using the current codec.
+
+    Args:
+        data (bytes | str): the JSON document
+
+    Returns:
+        Any: the deserialized object
+
+    Raises:
+        JSONDecodeError: if the document isn't valid JSON
+    """
+    return _codec.decode(data)
+
+
+set_json_codec()
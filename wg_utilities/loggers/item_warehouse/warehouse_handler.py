@@ -4,17 +4,17 @@ from __future__ import annotations
 
 import atexit
 from http import HTTPStatus
-from json import dumps
 from logging import DEBUG, Logger, LogRecord, getLogger
 from logging.handlers import QueueHandler
 from multiprocessing import Queue
 from os import getenv
 from typing import Literal
 
-from requests import HTTPError, post
+from requests import HTTPError, Response
 from requests.exceptions import RequestException
 
 from wg_utilities.functions.decorators import backoff
+from wg_utilities.functions.json import json_dumps, json_dumps_bytes
 from wg_utilities.loggers.item_warehouse.flushable_queue_listener import (
     FlushableQueueListener,
 )
@@ -26,6 +26,7 @@ LOGGER.setLevel(DEBUG)
 
 BACKOFF_MAX_TRIES = int(getenv("WAREHOUSE_HANDLER_BACKOFF_MAX_TRIES", "0"))
 BACKOFF_TIMEOUT = int(getenv("WAREHOUSE_HANDLER_BACKOFF_TIMEOUT", "0"))
+COMPRESSION_MIN_SIZE = getenv("WAREHOUSE_HANDLER_COMPRESSION_MIN_SIZE")
 
 LOG_QUEUE: Queue[LogRecord | None] = Queue()
 
@@ -42,8 +43,16 @@ class WarehouseHandler(BaseWarehouseHandler):
         - log_host (hostname of the machine the log was generated on)
 
     This means that the same log message from the same host will only be stored once.
+
+    Log payloads (e.g. those with long tracebacks) are gzipped if they're at least
+    `WAREHOUSE_HANDLER_COMPRESSION_MIN_SIZE` bytes; compression is disabled if the
+    environment variable isn't set.
     """
 
+    REQUEST_COMPRESSION_MIN_SIZE = (
+        int(COMPRESSION_MIN_SIZE) if COMPRESSION_MIN_SIZE else None
+    )
+
     def __init__(
         self,
         *,
@@ -106,7 +115,7 @@ class WarehouseHandler(BaseWarehouseHandler):
             if schema_types != self._WAREHOUSE_TYPES:
                 raise ValueError(
                     "Warehouse types do not match expected types: "
-                    + dumps(
+                    + json_dumps(
                         {
                             k: {"expected": v, "actual": schema_types.get(k)}
                             for k, v in self._WAREHOUSE_TYPES.items()
@@ -124,12 +133,42 @@ class WarehouseHandler(BaseWarehouseHandler):
     )
     def post_with_backoff(self, log_payload: LogPayload, /) -> None:
         """Post a JSON response to the warehouse, with backoff applied."""
-        res = post(
+        body = json_dumps_bytes(log_payload)
+
+        if (compressed := self._compress_request_body(json=None, data=body)) is not None:
+            res = self.session.post(
+                f"{self.base_url}{self.ITEM_ENDPOINT}",
+                timeout=60,
+                data=compressed,
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            )
+
+            if res.status_code != HTTPStatus.UNSUPPORTED_MEDIA_TYPE:
+                self._handle_post_response(res)
+                return
+
+            LOGGER.warning("Compressed log rejected by warehouse, disabling compression")
+            self._request_compression_rejected = True
+
+        res = self.session.post(
             f"{self.base_url}{self.ITEM_ENDPOINT}",
             timeout=60,
-            json=log_payload,
+            data=body,
+            headers={"Content-Type": "application/json"},
         )
 
+        self._handle_post_response(res)
+
+    @staticmethod
+    def _handle_post_response(res: Response) -> None:
+        """Handle the response to a posted log.
+
+        Args:
+            res (Response): the response from the warehouse
+
+        Raises:
+            HTTPError: if the error is temporary, so that the post can be retried
+        """
         if res.status_code == HTTPStatus.CONFLICT:
             return
 